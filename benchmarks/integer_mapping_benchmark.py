@@ -0,0 +1,55 @@
+"""Benchmark of mapping mouse positions to values for int sliders with 64-bit ranges
+
+Run with: QT_QPA_PLATFORM=offscreen python benchmarks/integer_mapping_benchmark.py
+"""
+
+import sys
+import timeit
+from qtpy.QtCore import Qt, QPoint, QPointF
+from qtpy.QtGui import QMouseEvent
+from qtpy.QtWidgets import QApplication
+
+sys.path.insert(0, '.')
+from src.pyqt_advanced_slider import Slider
+
+
+def create_slider(minimum, maximum, use_float=False) -> Slider:
+    """Create a slider with the given range and start dragging it"""
+
+    slider = Slider()
+    slider.resize(1000, 30)
+    slider.setFloat(use_float)
+    slider.setRange(minimum, maximum)
+    slider.mousePressEvent(create_mouse_event(QMouseEvent.Type.MouseButtonPress, 0))
+    return slider
+
+
+def create_mouse_event(event_type, position_x: int) -> QMouseEvent:
+    """Create a left button mouse event at a position"""
+
+    position = QPointF(QPoint(position_x, 1))
+    return QMouseEvent(event_type, position, position, Qt.MouseButton.LeftButton,
+                       Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+
+
+def benchmark(name: str, slider: Slider, repeat: int = 5, number: int = 20000):
+    """Time mouseMoveEvent over the whole width of the slider"""
+
+    events = [create_mouse_event(QMouseEvent.Type.MouseMove, x) for x in range(slider.width() + 1)]
+
+    def move():
+        for event in events:
+            slider.mouseMoveEvent(event)
+
+    loops = max(1, number // len(events))
+    best = min(timeit.repeat(move, repeat=repeat, number=loops))
+    print('{:<32} {:8.2f} us per mouseMoveEvent'.format(name, best / (loops * len(events)) * 1e6))
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+
+    benchmark('int 0 to 100', create_slider(0, 100))
+    benchmark('int 0 to 2^53', create_slider(0, 2 ** 53))
+    benchmark('int -2^63 to 2^63 - 1', create_slider(-2 ** 63, 2 ** 63 - 1))
+    benchmark('float 0 to 100', create_slider(0, 100, use_float=True))
@@ -1 +1,21 @@
 from .advanced_slider import Slider
+from .render_stats import RenderStats
+from .latency_tracer import LatencyHistogram, LatencyTracer
+from .worker_binding import WorkerBinding
+from .value_stream import ValueStream
+from .preview_cache import PreviewCache
+from .background_data import MinMaxDecimator
+from .decorations import DecorationLayer, DecorationRenderer, BackgroundDataLayer, TickLayer, RenderContext
+from .scales import Scale, LinearScale, LogScale, PowerScale, FunctionScale, ScaleTable
+from .slider_state import SliderState
+from .range_slider import RangeSlider
+from .multi_slider import MultiSlider
+from .slider_group import SliderGroup, SliderGroupObserver
+from .constraints import Constraint, SumConstraint, OrderedConstraint, ConstrainedSliderGroup
+from .derived_group import DerivedSliderGroup
+from .shared_values import SharedValueBinding, SharedValueReader
+from .parameter_bank import ParameterBank
+from .control_server import ControlServer
+from .persistence import SliderPersistence, PersistenceBackend, SettingsBackend, JsonFileBackend
+from .value_history import ValueHistory
+from .input_recording import InputRecorder, InputReplayer
@@ -1,6 +1,16 @@
-from qtpy.QtCore import Signal, Qt, QRect
+from qtpy.QtCore import Signal, Qt, QRect, QPoint
 from qtpy.QtGui import QColor, QFont, QPixmap, QBrush, QPen, QPainter, QFontMetrics
 from qtpy.QtWidgets import QWidget, QLabel
+from .worker_binding import WorkerBinding
+from .value_stream import ValueStream
+from .preview_cache import PreviewCache
+from .background_data import MinMaxDecimator
+from .decorations import DecorationLayer, DecorationRenderer, BackgroundDataLayer, TickLayer, RenderContext
+from .scales import Scale, LinearScale
+from .slider_state import SliderState
+from .render_stats import RenderStats
+from bisect import bisect_left, bisect_right
+import time
 
 
 class Slider(QWidget):
@@ -8,6 +18,13 @@ class Slider(QWidget):
     # Signal (object, so it can send both int and float)
     valueChanged = Signal(object)
 
+    # Signals (value, result) and (value, exception) of the bound worker for the latest value
+    workerFinished = Signal(object, object)
+    workerFailed = Signal(object, object)
+
+    # Render stats of all sliders (None = global instrumentation disabled)
+    __global_render_stats = None
+
     def __init__(self, parent=None):
         """Create a new Slider instance
 
@@ -36,17 +53,73 @@ class Slider(QWidget):
         self.__keyboard_input_enabled = True
         self.__mouse_wheel_input_enabled = True
         self.__font = QFont('Arial', 9, QFont.Bold)
+        self.__scale = LinearScale()
+
+        # Pixel to value lookup table of non-linear scales (rebuilt when width or range changes)
+        self.__scale_table = None
+        self.__scale_table_key = None
+
+        # Sorted discrete values the slider snaps to, the ones inside the range and pixel to value index lookup table
+        self.__allowed_values = None
+        self.__allowed_values_in_range = None
+        self.__allowed_values_in_range_key = None
+        self.__allowed_values_table = None
+        self.__allowed_values_table_key = None
 
         # Slider value
         self.__value = 0.0
         self.__value_last_paint_event = -1
+        self.__position_x_last_paint_event = None
+
+        # Fixed-point storage of float values as integer count of 10^-decimals units
+        self.__fixed_point = False
+        self.__fixed_point_scale = None
+        self.__value_units = None
+        self.__value_units_last_paint_event = None
 
         # Flag to enable forcing a repaint when value has not changed
         self.__force_repaint = False
 
+        # Span on the x-axis (start, end) that has to be redrawn without redrawing the whole canvas
+        self.__dirty_span = None
+
+        # Device pixel ratio the canvas has been drawn with and window the screen changes are tracked for
+        self.__device_pixel_ratio_last_paint_event = None
+        self.__tracked_window_handle = None
+
         # Slider drag handling
         self.__left_mouse_pressed = False
 
+        # Render stats of this slider (None = instrumentation disabled)
+        self.__render_stats = None
+
+        # Latency tracer with the key of this slider and the times of inputs not painted yet
+        self.__latency_tracer = None
+        self.__latency_key = None
+        self.__unpainted_input_times = []
+
+        # Background worker bound to value changes
+        self.__worker_binding = None
+
+        # Scrub preview shown above the value position while dragging
+        self.__preview_provider = None
+        self.__preview_bucket_size = 1
+        self.__preview_cache = None
+        self.__preview_bucket = None
+        self.__preview_popup = None
+
+        # Decoration layers (rendered into cached images, expensive ones on a worker thread)
+        self.__decoration_layers = []
+        self.__decoration_renderer = DecorationRenderer(parent=self)
+        self.__decoration_renderer.layerReady.connect(self.__on_decoration_changed)
+
+        # Data drawn behind the slider value rect (decimated to min/max pairs per column)
+        self.__background_data_layer = None
+        self.__background_data_color = QColor(0, 0, 0, 48)
+
+        # Tick marks and labels (created when ticks are configured)
+        self.__tick_layer = None
+
         # Widget that will be turned into a slider
         self.__slider = QLabel(self)
 
@@ -71,16 +144,22 @@ class Slider(QWidget):
         :param event: event sent by PyQt
         """
 
+        input_time = self._get_trace_time()
+
         if event.button() == Qt.MouseButton.LeftButton:
             self.__left_mouse_pressed = True
             # Set value and position
-            self.__value = self.__get_value_from_position_x(event.pos().x())
-            self.__position_x = self.__clamp_position_x(event.pos().x())
+            self.__set_value_from_position_x(event.pos().x())
             # Emit value changed signal
-            if self.__round_cast_value(self.__value_last_paint_event) != self.__round_cast_value(self.__value):
+            value_changed = self.__is_value_changed_since_paint()
+            if value_changed:
                 self.__emit_value_changed()
             # Call paint event
             self.update()
+            # Count input event and trace its latency until the value is painted
+            self._record_input(value_changed, input_time)
+            # Show scrub preview
+            self.__update_preview()
 
     def mouseReleaseEvent(self, event):
         """Event that happens every time a mouse button gets released on this widget.
@@ -91,14 +170,17 @@ class Slider(QWidget):
 
         if event.button() == Qt.MouseButton.LeftButton:
             self.__left_mouse_pressed = False
+            self.__hide_preview()
             # Set value and position
-            self.__value = self.__get_value_from_position_x(event.pos().x())
-            self.__position_x = self.__clamp_position_x(event.pos().x())
+            self.__set_value_from_position_x(event.pos().x())
             # Emit value changed signal
-            if self.__round_cast_value(self.__value_last_paint_event) != self.__round_cast_value(self.__value):
+            value_changed = self.__is_value_changed_since_paint()
+            if value_changed:
                 self.__emit_value_changed()
             # Call paint event
             self.update()
+            # Count input event
+            self._record_input(value_changed)
 
     def mouseMoveEvent(self, event):
         """Event that happens every time the mouse gets moved on this widget.
@@ -107,15 +189,21 @@ class Slider(QWidget):
         :param event: event sent by PyQt
         """
 
+        input_time = self._get_trace_time()
+
         if self.__left_mouse_pressed:
             # Set value and position
-            self.__value = self.__get_value_from_position_x(event.pos().x())
-            self.__position_x = self.__clamp_position_x(event.pos().x())
+            self.__set_value_from_position_x(event.pos().x())
             # Emit value changed signal
-            if self.__round_cast_value(self.__value_last_paint_event) != self.__round_cast_value(self.__value):
+            value_changed = self.__is_value_changed_since_paint()
+            if value_changed:
                 self.__emit_value_changed()
             # Call paint event
             self.update()
+            # Count input event and trace its latency until the value is painted
+            self._record_input(value_changed, input_time)
+            # Update scrub preview
+            self.__update_preview()
 
     def wheelEvent(self, event):
         """Event that happens every time the mouse wheel is scrolled on this widget.
@@ -129,21 +217,19 @@ class Slider(QWidget):
         if not self.__mouse_wheel_input_enabled:
             return
 
+        input_time = self._get_trace_time()
+        value_before = self.__value
+
         # Scrolled up
         if event.angleDelta().y() > 0:
-            if self.__single_step > 0:
-                self.setValue(self.__clamp_value(self.__value + self.__single_step))
-            else:
-                single_step = self.__get_value_range() * 0.01
-                self.setValue(self.__clamp_value(self.__value + single_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__single_step, 0.01, 1))
 
         # Scrolled down
         else:
-            if self.__single_step > 0:
-                self.setValue(self.__clamp_value(self.__value - self.__single_step))
-            else:
-                single_step = self.__get_value_range() * 0.01
-                self.setValue(self.__clamp_value(self.__value - single_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__single_step, 0.01, -1))
+
+        # Count input event and trace its latency until the value is painted
+        self._record_input(self.__value != value_before, input_time)
 
     def keyPressEvent(self, event):
         """Event that happens every time a key is pressed on this widget.
@@ -161,6 +247,9 @@ class Slider(QWidget):
         if not self.__keyboard_input_enabled:
             return
 
+        input_time = self._get_trace_time()
+        value_before = self.__value
+
         # Home key
         if event.key() == Qt.Key.Key_Home:
             self.setValue(self.__minimum)
@@ -171,35 +260,26 @@ class Slider(QWidget):
 
         # Arrow key (up or right)
         elif event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Up:
-            if self.__single_step > 0:
-                self.setValue(self.__clamp_value(self.__value + self.__single_step))
-            else:
-                single_step = self.__get_value_range() * 0.01
-                self.setValue(self.__clamp_value(self.__value + single_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__single_step, 0.01, 1))
 
         # Arrow key (down or left)
         elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Down:
-            if self.__single_step > 0:
-                self.setValue(self.__clamp_value(self.__value - self.__single_step))
-            else:
-                single_step = self.__get_value_range() * 0.01
-                self.setValue(self.__clamp_value(self.__value - single_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__single_step, 0.01, -1))
 
         # PageUp key
         elif event.key() == Qt.Key.Key_PageUp:
-            if self.__page_step > 0:
-                self.setValue(self.__clamp_value(self.__value + self.__page_step))
-            else:
-                page_step = self.__get_value_range() * 0.05
-                self.setValue(self.__clamp_value(self.__value + page_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__page_step, 0.05, 1, page=True))
 
         # PageDown key
         elif event.key() == Qt.Key.Key_PageDown:
-            if self.__page_step > 0:
-                self.setValue(self.__clamp_value(self.__value - self.__page_step))
-            else:
-                page_step = self.__get_value_range() * 0.05
-                self.setValue(self.__clamp_value(self.__value - page_step))
+            self.setValue(self._get_stepped_value(self.__value, self.__page_step, 0.05, -1, page=True))
+
+        # Other keys are not handled by the slider
+        else:
+            return
+
+        # Count input event and trace its latency until the value is painted
+        self._record_input(self.__value != value_before, input_time)
 
     def paintEvent(self, event):
         """Event that happens every time a widget needs to update itself.
@@ -208,15 +288,57 @@ class Slider(QWidget):
         :param event: event sent by PyQt
         """
 
-        # Only repaint if widget has been resized or value has changed
-        resized = self.__slider.size() != self.size()
-        value_changed = self.__value != self.__value_last_paint_event
+        # Paint without measuring if instrumentation and latency tracing are disabled
+        if (self.__render_stats is None and Slider.__global_render_stats is None
+                and self.__latency_tracer is None):
+            self.__paint()
+            return
+
+        start_time = time.perf_counter()
+        painted = self.__paint()
+        end_time = time.perf_counter()
+
+        for render_stats in (self.__render_stats, Slider.__global_render_stats):
+            if render_stats is not None:
+                if painted:
+                    render_stats.addPaint(end_time - start_time)
+                else:
+                    render_stats.addSkippedPaint()
+
+        # All traced inputs are reflected by this paint
+        if painted and self.__latency_tracer is not None:
+            for input_time in self.__unpainted_input_times:
+                self.__latency_tracer.addLatency(self.__latency_key, end_time - input_time)
+            self.__unpainted_input_times.clear()
+
+    def __paint(self) -> bool:
+        """Draw the slider if something changed
+
+        :return: whether anything has been drawn
+        """
+
+        # Only repaint if widget has been resized (or moved to a screen with a different
+        # device pixel ratio) or value or position has changed (int values don't change
+        # while dragging within one value step, but the value rect has to follow the mouse)
+        device_pixel_ratio = self.devicePixelRatioF()
+        resized = (self.__slider.size() != self.size()
+                   or device_pixel_ratio != self.__device_pixel_ratio_last_paint_event)
+        value_changed = (self.__value != self.__value_last_paint_event
+                         or (self.__position_x is not None
+                             and self.__position_x != self.__position_x_last_paint_event))
 
         if not resized and not value_changed and not self.__force_repaint:
-            return
+            # Only redraw the dirty span of the canvas
+            if self.__dirty_span is not None:
+                self.__paint_dirty_span(device_pixel_ratio)
+                return True
+            return False
 
         self.__force_repaint = False
+        self.__dirty_span = None
         self.__value_last_paint_event = self.__value
+        self.__value_units_last_paint_event = self.__value_units
+        self.__device_pixel_ratio_last_paint_event = device_pixel_ratio
 
         # Check if range is valid
         if self.__minimum >= self.__maximum:
@@ -228,11 +350,15 @@ class Slider(QWidget):
 
         # Calculate position based on value if position_x not set
         if self.__position_x is None:
-            self.__position_x = self.__get_position_x_from_value(self.__value)
+            self.__position_x = self._get_position_x_from_value(self.__value)
+        self.__position_x_last_paint_event = self.__position_x
 
         # Redraw canvas
         self.__slider.setFixedSize(self.width(), self.height())
-        self.__canvas = QPixmap(self.width(), self.height())
+        # Canvas is drawn in device pixels so that it does not get upscaled on HiDPI screens
+        self.__canvas = QPixmap(round(self.width() * device_pixel_ratio),
+                                round(self.height() * device_pixel_ratio))
+        self.__canvas.setDevicePixelRatio(device_pixel_ratio)
         self.__canvas.fill(QColor(self.__background_color))
 
         # Init painter
@@ -240,6 +366,156 @@ class Slider(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setFont(self.__font)
 
+        # Draw decorations below the value rect
+        context = self.__create_render_context(device_pixel_ratio)
+        self.__draw_decorations(painter, context, DecorationLayer.BELOW_VALUE)
+
+        # Draw slider value rect
+        self._draw_value_rect(painter)
+
+        # Draw decorations above the value rect
+        self.__draw_decorations(painter, context, DecorationLayer.ABOVE_VALUE)
+
+        # Draw slider value
+        if self.__showing_value:
+            self._draw_value_text(painter)
+
+        # Set updated canvas
+        self.__slider.setPixmap(self.__canvas)
+
+        # End painter
+        painter.end()
+
+        return True
+
+    def __paint_dirty_span(self, device_pixel_ratio: float):
+        """Redraw only the dirty span of the existing canvas (clipped to the span)
+
+        :param device_pixel_ratio: device pixel ratio the canvas is drawn with
+        """
+
+        start, end = self.__dirty_span
+        self.__dirty_span = None
+        clip_rect = QRect(start, 0, end - start + 1, self.height())
+
+        # Init painter
+        painter = QPainter(self.__canvas)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.__font)
+        painter.setClipRect(clip_rect)
+        painter.fillRect(clip_rect, QColor(self.__background_color))
+
+        # Draw the same layers as a full redraw, clipped to the span
+        context = self.__create_render_context(device_pixel_ratio)
+        self.__draw_decorations(painter, context, DecorationLayer.BELOW_VALUE)
+        self._draw_value_rect(painter)
+        self.__draw_decorations(painter, context, DecorationLayer.ABOVE_VALUE)
+        if self.__showing_value:
+            self._draw_value_text(painter)
+
+        painter.end()
+
+        # Set updated canvas
+        self.__slider.setPixmap(self.__canvas)
+
+    def showEvent(self, event):
+        """Event that happens every time the widget is shown.
+        Tracks screen changes of the window to redraw once with the new device pixel ratio
+
+        :param event: event sent by PyQt
+        """
+
+        super(Slider, self).showEvent(event)
+
+        window_handle = self.window().windowHandle()
+        if window_handle is not None and window_handle is not self.__tracked_window_handle:
+            if self.__tracked_window_handle is not None:
+                try:
+                    self.__tracked_window_handle.screenChanged.disconnect(self.__on_screen_changed)
+                except (RuntimeError, TypeError):
+                    # Window has already been deleted
+                    pass
+            window_handle.screenChanged.connect(self.__on_screen_changed)
+            self.__tracked_window_handle = window_handle
+
+    def _get_trace_time(self) -> float | None:
+        """Get the current time if latency is traced (taken at the start of input handlers
+        and before emitting valueChanged, also by subclasses)
+
+        :return: time.perf_counter() or None if latency is not traced
+        """
+
+        return time.perf_counter() if self.__latency_tracer is not None else None
+
+    def _record_input(self, value_changed: bool, input_time: float = None):
+        """Count a handled input event if instrumentation is enabled and trace its latency
+        until the paint reflecting it (called by the input event handlers, also of subclasses)
+
+        :param value_changed: whether the event changed the value (otherwise it is counted as coalesced)
+        :param input_time: time the input handler started (see _get_trace_time())
+        """
+
+        # Remember the time of the input until the paint (the oldest 256 unpainted inputs are kept)
+        if (input_time is not None and value_changed and self.__latency_tracer is not None
+                and len(self.__unpainted_input_times) < 256):
+            self.__unpainted_input_times.append(input_time)
+
+        if self.__render_stats is None and Slider.__global_render_stats is None:
+            return
+
+        for render_stats in (self.__render_stats, Slider.__global_render_stats):
+            if render_stats is not None:
+                render_stats.addInput(not value_changed)
+
+    def _record_emission(self, start_time: float = None):
+        """Count a value change emission if instrumentation is enabled and record the time spent
+        in the connected handlers if latency is traced (called after emitting valueChanged, also by subclasses)
+
+        :param start_time: time before the signals have been emitted (see _get_trace_time())
+        """
+
+        if start_time is not None and self.__latency_tracer is not None:
+            self.__latency_tracer.addHandlerTime(self.__latency_key, time.perf_counter() - start_time)
+
+        if self.__render_stats is None and Slider.__global_render_stats is None:
+            return
+
+        for render_stats in (self.__render_stats, Slider.__global_render_stats):
+            if render_stats is not None:
+                render_stats.addEmission()
+
+    def _on_range_changed(self):
+        """Called after the minimum or maximum changed to clamp the value into the new range"""
+
+        self.setValue(self.__value)
+
+    def _request_repaint(self):
+        """Repaint the slider even if the value has not changed"""
+
+        self.__force_repaint = True
+        self.update()
+
+    def _request_partial_repaint(self, start: int, end: int):
+        """Redraw only a span of the slider (merged with other pending spans)
+
+        :param start: start of the span on the x-axis in px
+        :param end: end of the span on the x-axis in px (inclusive)
+        """
+
+        start = max(0, int(start))
+        end = min(self.width(), int(end))
+        if self.__dirty_span is not None:
+            start = min(start, self.__dirty_span[0])
+            end = max(end, self.__dirty_span[1])
+        self.__dirty_span = (start, end)
+        self.update(QRect(start, 0, end - start + 1, self.height()))
+
+    def _draw_value_rect(self, painter: QPainter):
+        """Draw the rect from the start of the slider to the value position
+
+        :param painter: painter of the canvas
+        """
+
         # Init pen
         pen = QPen()
         pen.setWidth(1)
@@ -261,42 +537,37 @@ class Slider(QWidget):
             # Draw rect
             painter.drawRoundedRect(rect, self.__border_radius, self.__border_radius)
 
-        # Draw slider value
-        if self.__showing_value:
-            # Set pen color to text color
-            pen.setColor(self.__text_color)
-            painter.setPen(pen)
+    def _draw_value_text(self, painter: QPainter):
+        """Draw the formatted value next to the value position
 
-            # Create formatted string from value
-            value_string = self.__format_value(self.__value, self.__is_float, self.__decimals,
-                                               self.__thousands_separator, self.__decimal_separator)
-            value_string_full = self.__prefix + value_string + self.__suffix
+        :param painter: painter of the canvas
+        """
 
-            # Get string width and height for current font
-            metrics = QFontMetrics(self.__font)
-            text_width = metrics.horizontalAdvance(value_string_full)
-            text_height = metrics.tightBoundingRect(value_string_full).height()
+        # Set pen color to text color
+        painter.setPen(QPen(self.__text_color))
 
-            # Calculate text position x
-            text_margin = 5
+        # Create formatted string from value
+        value_string_full = self._format_value_string(self.__value)
 
-            text_pos_x = self.__position_x + text_margin
-            if text_pos_x + text_width >= self.width() - text_margin:
-                text_pos_x = self.width() - text_width - text_margin
+        # Get string width and height for current font
+        metrics = QFontMetrics(self.__font)
+        text_width = metrics.horizontalAdvance(value_string_full)
+        text_height = metrics.tightBoundingRect(value_string_full).height()
 
-            text_pos_x = 1 if text_pos_x == 0 else int(text_pos_x)
+        # Calculate text position x
+        text_margin = 5
 
-            # Calculate text position y
-            text_pos_y = int(self.height() - ((self.height() - text_height) / 2))
+        text_pos_x = self.__position_x + text_margin
+        if text_pos_x + text_width >= self.width() - text_margin:
+            text_pos_x = self.width() - text_width - text_margin
 
-            # Draw value
-            painter.drawText(text_pos_x, text_pos_y, value_string_full)
+        text_pos_x = 1 if text_pos_x == 0 else int(text_pos_x)
 
-        # Set updated canvas
-        self.__slider.setPixmap(self.__canvas)
+        # Calculate text position y
+        text_pos_y = int(self.height() - ((self.height() - text_height) / 2))
 
-        # End painter
-        painter.end()
+        # Draw value
+        painter.drawText(text_pos_x, text_pos_y, value_string_full)
 
     def getValuePosition(self) -> int:
         """Get the position of the slider's value in px
@@ -305,7 +576,7 @@ class Slider(QWidget):
         """
 
         if self.__position_x is None:
-            return self.__get_position_x_from_value(self.__value)
+            return self._get_position_x_from_value(self.__value)
         return self.__position_x
 
     def getValue(self) -> int | float:
@@ -314,7 +585,10 @@ class Slider(QWidget):
         :return: value
         """
 
-        return self.__round_cast_value(self.__value)
+        # Fixed-point values are already exact
+        if self.__fixed_point_scale is not None:
+            return self.__value
+        return self._round_cast_value(self.__value)
 
     def getValueFormatted(self) -> str:
         """Get the current formatted value shown on the slider
@@ -322,9 +596,7 @@ class Slider(QWidget):
         :return: formatted value string
         """
 
-        formatted_value = self.__format_value(self.__value, self.__is_float, self.__decimals,
-                                              self.__thousands_separator, self.__decimal_separator)
-        return self.__prefix + formatted_value + self.__suffix
+        return self._format_value_string(self.__value)
 
     def setValue(self, value: int | float):
         """Set the value of the slider
@@ -332,10 +604,13 @@ class Slider(QWidget):
         :param value: new value
         """
 
-        self.__value = self.__clamp_value(value)
+        value = self._clamp_value(value)
+        if self.__get_allowed_values_in_range() is not None:
+            value = self.__get_nearest_allowed_value(value)
+        self.__store_value(value)
         self.__position_x = None
         # Emit value changed signal
-        if self.__round_cast_value(self.__value_last_paint_event) != self.__round_cast_value(self.__value):
+        if self.__is_value_changed_since_paint():
             self.__emit_value_changed()
         # Repaint
         self.update()
@@ -356,7 +631,8 @@ class Slider(QWidget):
 
         self.__minimum = minimum
         self.__force_repaint = True
-        self.setValue(self.__value)
+        self.__update_preview_bucket_range()
+        self._on_range_changed()
 
     def getMaximum(self) -> int | float:
         """Get the maximum value of the slider
@@ -374,7 +650,8 @@ class Slider(QWidget):
 
         self.__maximum = maximum
         self.__force_repaint = True
-        self.setValue(self.__value)
+        self.__update_preview_bucket_range()
+        self._on_range_changed()
 
     def getRange(self) -> tuple[int | float, int | float]:
         """Get slider value range (minimum and maximum)
@@ -394,7 +671,8 @@ class Slider(QWidget):
         self.__minimum = minimum
         self.__maximum = maximum
         self.__force_repaint = True
-        self.setValue(self.__value)
+        self.__update_preview_bucket_range()
+        self._on_range_changed()
 
     def isFloat(self) -> bool:
         """Get whether the slider is a float slider
@@ -411,6 +689,7 @@ class Slider(QWidget):
         """
 
         self.__is_float = use_float
+        self.__update_fixed_point()
         self.__force_repaint = True
         self.update()
 
@@ -429,6 +708,27 @@ class Slider(QWidget):
         """
 
         self.__decimals = decimals
+        self.__update_fixed_point()
+        self.__force_repaint = True
+        self.update()
+
+    def isFixedPoint(self) -> bool:
+        """Get whether float values are stored as fixed-point integers
+
+        :return: whether fixed-point storage is enabled
+        """
+
+        return self.__fixed_point
+
+    def setFixedPoint(self, on: bool):
+        """Set whether float values should be stored as integer count of 10^-decimals units.
+        Stepping, comparing and formatting are then exact (e.g. stepping 0.1 three times gives 0.3)
+
+        :param on: whether fixed-point storage should be enabled
+        """
+
+        self.__fixed_point = on
+        self.__update_fixed_point()
         self.__force_repaint = True
         self.update()
 
@@ -664,6 +964,61 @@ class Slider(QWidget):
         self.__force_repaint = True
         self.update()
 
+    def getScale(self) -> Scale:
+        """Get the scale mapping between values and positions
+
+        :return: scale
+        """
+
+        return self.__scale
+
+    def setScale(self, scale: Scale):
+        """Set the scale mapping between values and positions (e.g. LogScale or PowerScale).
+        Non-linear scales use pixel to value lookup tables that are built once per width and range
+
+        :param scale: new scale
+        """
+
+        self.__scale = scale
+        self.__scale_table = None
+        self.__position_x = None
+        self.__force_repaint = True
+        self.update()
+
+    def getAllowedValues(self) -> list[int | float] | None:
+        """Get the discrete values the slider snaps to
+
+        :return: sorted allowed values or None if every value in the range is allowed
+        """
+
+        return self.__allowed_values
+
+    def setAllowedValues(self, values):
+        """Restrict the slider to a set of discrete values (e.g. standard resistor values).
+        The range is set to the smallest and largest value. Positions are mapped to the
+        nearest allowed value and keyboard and mouse wheel input step through the values.
+        If the range is changed later, the slider snaps to the allowed values inside the range
+        (every value is allowed if there are none)
+
+        :param values: allowed values (None to allow every value in the range)
+        """
+
+        self.__allowed_values_in_range = None
+        self.__allowed_values_table = None
+        if values is None:
+            self.__allowed_values = None
+        else:
+            values = sorted(set(values))
+            if len(values) < 2:
+                raise ValueError('At least two allowed values are required')
+
+            self.__allowed_values = values
+            self.setRange(values[0], values[-1])
+
+        self.__position_x = None
+        self.__force_repaint = True
+        self.update()
+
     def isKeyboardInputEnabled(self) -> bool:
         """Get whether keyboard inputs are enabled
 
@@ -696,6 +1051,437 @@ class Slider(QWidget):
 
         self.__mouse_wheel_input_enabled = enabled
 
+    def isInstrumentationEnabled(self) -> bool:
+        """Get whether paints, emissions and input events of this slider are counted
+
+        :return: whether instrumentation is enabled
+        """
+
+        return self.__render_stats is not None
+
+    def setInstrumentationEnabled(self, on: bool):
+        """Set whether paints, emissions and input events of this slider should be counted
+        (disabled instrumentation costs one None check per event)
+
+        :param on: whether instrumentation should be enabled
+        """
+
+        if on and self.__render_stats is None:
+            self.__render_stats = RenderStats()
+        elif not on:
+            self.__render_stats = None
+
+    def renderStats(self) -> dict:
+        """Get the counters of this slider (see RenderStats.toDict(), all zero if disabled)
+
+        :return: render stats
+        """
+
+        if self.__render_stats is None:
+            return RenderStats().toDict()
+        return self.__render_stats.toDict()
+
+    def resetRenderStats(self):
+        """Reset the counters of this slider"""
+
+        if self.__render_stats is not None:
+            self.__render_stats.reset()
+
+    @classmethod
+    def isGlobalInstrumentationEnabled(cls) -> bool:
+        """Get whether paints, emissions and input events of all sliders are counted
+
+        :return: whether global instrumentation is enabled
+        """
+
+        return Slider.__global_render_stats is not None
+
+    @classmethod
+    def setGlobalInstrumentationEnabled(cls, on: bool):
+        """Set whether paints, emissions and input events of all sliders should be counted together
+
+        :param on: whether global instrumentation should be enabled
+        """
+
+        if on and Slider.__global_render_stats is None:
+            Slider.__global_render_stats = RenderStats()
+        elif not on:
+            Slider.__global_render_stats = None
+
+    @classmethod
+    def globalRenderStats(cls) -> dict:
+        """Get the counters of all sliders (see RenderStats.toDict(), all zero if disabled)
+
+        :return: render stats
+        """
+
+        if Slider.__global_render_stats is None:
+            return RenderStats().toDict()
+        return Slider.__global_render_stats.toDict()
+
+    @classmethod
+    def resetGlobalRenderStats(cls):
+        """Reset the counters of all sliders"""
+
+        if Slider.__global_render_stats is not None:
+            Slider.__global_render_stats.reset()
+
+    def getLatencyTracer(self):
+        """Get the latency tracer of the slider
+
+        :return: LatencyTracer or None
+        """
+
+        return self.__latency_tracer
+
+    def setLatencyTracer(self, tracer, key=None):
+        """Set the latency tracer the input-to-paint latency and valueChanged handler times are recorded in
+        (use LatencyTracer.addSlider() instead of calling this directly)
+
+        :param tracer: LatencyTracer or None to stop tracing
+        :param key: key of the slider in the tracer
+        """
+
+        self.__latency_tracer = tracer
+        self.__latency_key = key
+        self.__unpainted_input_times.clear()
+
+    def saveState(self) -> bytes:
+        """Save value, range, float settings, steps and formatting into a compact binary state
+
+        :return: state that can be restored with restoreState()
+        """
+
+        flags = ((SliderState.FLOAT_FLAG if self.__is_float else 0)
+                 | (SliderState.FIXED_POINT_FLAG if self.__fixed_point else 0)
+                 | (SliderState.SHOWING_VALUE_FLAG if self.__showing_value else 0))
+
+        return SliderState.pack({
+            'flags': flags,
+            'decimals': self.__decimals,
+            'value': self.__value,
+            'minimum': self.__minimum,
+            'maximum': self.__maximum,
+            'single_step': self.__single_step,
+            'page_step': self.__page_step,
+            'prefix': self.__prefix,
+            'suffix': self.__suffix,
+            'thousands_separator': self.__thousands_separator,
+            'decimal_separator': self.__decimal_separator
+        })
+
+    def restoreState(self, state: bytes):
+        """Restore a state saved with saveState(). All settings are applied at once,
+        so the slider repaints once and emits valueChanged at most once
+
+        :param state: saved state
+        """
+
+        fields = SliderState.unpack(state)
+
+        self.__is_float = bool(fields['flags'] & SliderState.FLOAT_FLAG)
+        self.__fixed_point = bool(fields['flags'] & SliderState.FIXED_POINT_FLAG)
+        self.__showing_value = bool(fields['flags'] & SliderState.SHOWING_VALUE_FLAG)
+        self.__decimals = fields['decimals']
+        self.__minimum = fields['minimum']
+        self.__maximum = fields['maximum']
+        self.__single_step = fields['single_step']
+        self.__page_step = fields['page_step']
+        self.__prefix = fields['prefix']
+        self.__suffix = fields['suffix']
+        self.__thousands_separator = fields['thousands_separator']
+        self.__decimal_separator = fields['decimal_separator']
+
+        self.__value = fields['value']
+        self.__update_fixed_point()
+        self.__force_repaint = True
+        self.__update_preview_bucket_range()
+        self._on_range_changed()
+
+    def bindWorker(self, fn, executor=None):
+        """Run fn(value) off the GUI thread every time the value changes.
+        Superseded jobs are cancelled or ignored and only the result for the latest value
+        is emitted on the GUI thread with the workerFinished (or workerFailed) signal
+
+        :param fn: function that will be called with the new value
+        :param executor: concurrent.futures executor to run the jobs on (default: private single thread)
+        """
+
+        self.unbindWorker()
+
+        self.__worker_binding = WorkerBinding(fn, executor, self)
+        self.__worker_binding.finished.connect(self.workerFinished)
+        self.__worker_binding.failed.connect(self.workerFailed)
+        self.valueChanged.connect(self.__worker_binding.submit)
+
+        # Compute result for the current value right away
+        self.__worker_binding.submit(self.getValue())
+
+    def unbindWorker(self):
+        """Remove the bound worker and drop the results of all pending jobs"""
+
+        if self.__worker_binding is None:
+            return
+
+        self.valueChanged.disconnect(self.__worker_binding.submit)
+        self.__worker_binding.shutdown()
+        self.__worker_binding.deleteLater()
+        self.__worker_binding = None
+
+    def isWorkerBusy(self) -> bool:
+        """Get whether the bound worker is still computing the result for the latest value
+
+        :return: whether the bound worker is busy
+        """
+
+        return self.__worker_binding is not None and self.__worker_binding.isBusy()
+
+    def values(self, debounce: float = 0.0) -> ValueStream:
+        """Get an async iterator over the value changes of the slider.
+        Slow consumers only see the latest value, intermediate values are dropped
+
+        :param debounce: time in seconds the value has to be stable before it is yielded
+        :return: async iterator yielding the new values
+        """
+
+        return ValueStream(self, debounce)
+
+    def setPreviewProvider(self, provider, bucket_size: int | float = 1, cache_size: int = 64,
+                           prefetch: int = 2, executor=None):
+        """Set a provider for scrub previews shown above the value position while dragging.
+        The provider gets called with the start value of a bucket and has to return a QImage.
+        It is called on a thread pool, previews are cached (bounded LRU) and neighboring buckets
+        are prefetched in the drag direction
+
+        :param provider: thread-safe function returning a QImage for a bucket value (None to remove)
+        :param bucket_size: size of the value buckets that share a preview
+        :param cache_size: maximum amount of cached previews
+        :param prefetch: amount of neighboring buckets prefetched in the drag direction
+        :param executor: concurrent.futures executor to produce the previews on (optional)
+        """
+
+        if bucket_size <= 0:
+            raise ValueError('Preview bucket size must be greater than 0')
+
+        # Remove previous provider
+        if self.__preview_cache is not None:
+            self.__hide_preview()
+            self.__preview_cache.shutdown()
+            self.__preview_cache.deleteLater()
+            self.__preview_cache = None
+
+        self.__preview_provider = provider
+        self.__preview_bucket_size = bucket_size
+        if provider is None:
+            return
+
+        self.__preview_cache = PreviewCache(self.__produce_preview, cache_size, prefetch, executor, self)
+        self.__preview_cache.previewReady.connect(self.__on_preview_ready)
+        self.__update_preview_bucket_range()
+
+    def getPreviewProvider(self):
+        """Get the provider for scrub previews
+
+        :return: preview provider or None
+        """
+
+        return self.__preview_provider
+
+    def getPreviewCache(self) -> PreviewCache | None:
+        """Get the cache of the scrub previews
+
+        :return: preview cache or None if no provider is set
+        """
+
+        return self.__preview_cache
+
+    def isPreviewVisible(self) -> bool:
+        """Get whether the scrub preview popup is currently visible
+
+        :return: whether the preview is visible
+        """
+
+        return self.__preview_popup is not None and self.__preview_popup.isVisible()
+
+    def setBackgroundData(self, values):
+        """Set data (e.g. a distribution) that will be drawn behind the slider value rect.
+        The data is decimated to one min/max pair per pixel column and rendered on a worker thread.
+        Both are cached until the slider is resized or the data changes
+
+        :param values: sequence or NumPy array of numbers (None to remove the data)
+        """
+
+        if values is None:
+            if self.__background_data_layer is not None:
+                self.removeDecorationLayer(self.__background_data_layer)
+                self.__background_data_layer = None
+            return
+
+        if self.__background_data_layer is None:
+            self.__background_data_layer = BackgroundDataLayer(MinMaxDecimator(), self.__background_data_color, self)
+            self.addDecorationLayer(self.__background_data_layer)
+        self.__background_data_layer.getDecimator().setData(values)
+        self.__background_data_layer.invalidate()
+
+    def appendBackgroundData(self, values):
+        """Append data to the background data (the decimation is updated incrementally)
+
+        :param values: sequence or NumPy array of numbers
+        """
+
+        if self.__background_data_layer is None:
+            self.setBackgroundData(values)
+            return
+        self.__background_data_layer.getDecimator().append(values)
+        self.__background_data_layer.invalidate()
+
+    def getBackgroundDataSize(self) -> int:
+        """Get the amount of background data points
+
+        :return: amount of background data points
+        """
+
+        if self.__background_data_layer is None:
+            return 0
+        return self.__background_data_layer.getDecimator().size()
+
+    def getBackgroundDataColor(self) -> QColor:
+        """Get the color of the background data
+
+        :return: background data color
+        """
+
+        return self.__background_data_color
+
+    def setBackgroundDataColor(self, color: QColor):
+        """Set the color of the background data
+
+        :param color: new background data color
+        """
+
+        self.__background_data_color = color
+        if self.__background_data_layer is not None:
+            self.__background_data_layer.setColor(color)
+
+    def getTickInterval(self) -> tuple[int | float, int | float]:
+        """Get the major and minor tick interval
+
+        :return: major and minor tick interval
+        """
+
+        if self.__tick_layer is None:
+            return 0, 0
+        return self.__tick_layer.getInterval()
+
+    def setTickInterval(self, major: int | float, minor: int | float = 0):
+        """Set the interval of the major and minor tick marks
+
+        :param major: major tick interval (0 = no major ticks)
+        :param minor: minor tick interval (0 = no minor ticks)
+        """
+
+        self.__get_tick_layer().setInterval(major, minor)
+
+    def getTickPositions(self) -> tuple[list | None, list | None]:
+        """Get the explicit values of the major and minor tick marks
+
+        :return: major and minor tick values (None if the interval is used)
+        """
+
+        if self.__tick_layer is None:
+            return None, None
+        return self.__tick_layer.getPositions()
+
+    def setTickPositions(self, major, minor=None):
+        """Set explicit values of the major and minor tick marks (used instead of the interval)
+
+        :param major: major tick values (None = use the major interval)
+        :param minor: minor tick values (None = use the minor interval)
+        """
+
+        self.__get_tick_layer().setPositions(major, minor)
+
+    def isShowingTickLabels(self) -> bool:
+        """Get whether the major tick marks are labeled
+
+        :return: whether tick labels are shown
+        """
+
+        return self.__tick_layer is not None and self.__tick_layer.isLabelsVisible()
+
+    def showTickLabels(self, on: bool):
+        """Set whether the major tick marks should be labeled (with the value format of the slider)
+
+        :param on: whether tick labels should be shown
+        """
+
+        self.__get_tick_layer().setLabelsVisible(on)
+
+    def getTickColor(self) -> QColor:
+        """Get the color of the tick marks and labels
+
+        :return: tick color
+        """
+
+        if self.__tick_layer is None:
+            return QColor(TickLayer.DEFAULT_COLOR)
+        return self.__tick_layer.getColor()
+
+    def setTickColor(self, color: QColor):
+        """Set the color of the tick marks and labels
+
+        :param color: new tick color
+        """
+
+        self.__get_tick_layer().setColor(color)
+
+    def addDecorationLayer(self, layer: DecorationLayer):
+        """Add a decoration layer that will be drawn below or above the value rect.
+        Asynchronous layers are rendered into a QImage on a worker thread and
+        swapped in when ready, so dragging the slider is never blocked by them
+
+        :param layer: decoration layer
+        """
+
+        if layer in self.__decoration_layers:
+            return
+
+        self.__decoration_layers.append(layer)
+        layer.changed.connect(self.__on_decoration_changed)
+        self.__force_repaint = True
+        self.update()
+
+    def removeDecorationLayer(self, layer: DecorationLayer):
+        """Remove a decoration layer
+
+        :param layer: decoration layer
+        """
+
+        if layer not in self.__decoration_layers:
+            return
+
+        self.__decoration_layers.remove(layer)
+        layer.changed.disconnect(self.__on_decoration_changed)
+        self.__decoration_renderer.discard(layer)
+        self.__force_repaint = True
+        self.update()
+
+    def getDecorationLayers(self) -> list[DecorationLayer]:
+        """Get the decoration layers of the slider
+
+        :return: decoration layers
+        """
+
+        return list(self.__decoration_layers)
+
+    def isRenderingDecorations(self) -> bool:
+        """Get whether any decoration layer is being rendered on a worker thread
+
+        :return: whether decorations are being rendered
+        """
+
+        return self.__decoration_renderer.isPending()
+
     def __update_stylesheet(self):
         """Update the stylesheet with the current values"""
 
@@ -703,34 +1489,140 @@ class Slider(QWidget):
         self.__slider.setStyleSheet('border: 1px solid {}; border-radius: {}px;'
                                     .format(border_color_hex, self.__border_radius))
 
-    def __get_value_from_position_x(self, position_x: int) -> int | float:
+    def __create_render_context(self, device_pixel_ratio: float) -> RenderContext:
+        """Create a snapshot of the slider state used for rendering decoration layers
+
+        :param device_pixel_ratio: device pixel ratio the canvas is drawn with
+        :return: render context
+        """
+
+        return RenderContext(self.width(), self.height(), device_pixel_ratio,
+                             self.__minimum, self.__maximum, self.__font,
+                             None if self.__scale.isLinear() else self.__scale)
+
+    def __draw_decorations(self, painter: QPainter, context: RenderContext, z: int):
+        """Draw the cached images of the decoration layers with the given z
+
+        :param painter: painter of the canvas
+        :param context: render context
+        :param z: BELOW_VALUE or ABOVE_VALUE
+        """
+
+        for layer in self.__decoration_layers:
+            if layer.getZ() != z:
+                continue
+            image = self.__decoration_renderer.image(layer, context)
+            if image is not None:
+                painter.drawImage(0, 0, image)
+
+    def __get_tick_layer(self) -> TickLayer:
+        """Get the tick layer and create it if it does not exist yet
+
+        :return: tick layer
+        """
+
+        if self.__tick_layer is None:
+            self.__tick_layer = TickLayer(self._format_value_string, self.__get_format_key, self)
+            self.addDecorationLayer(self.__tick_layer)
+        return self.__tick_layer
+
+    def __get_format_key(self) -> tuple:
+        """Get a key of the current value format (used to cache formatted labels)
+
+        :return: format key
+        """
+
+        return (self.__is_float, self.__decimals, self.__thousands_separator,
+                self.__decimal_separator, self.__prefix, self.__suffix)
+
+    def __on_screen_changed(self, screen):
+        """Redraw after the window has been moved to another screen
+
+        :param screen: new screen of the window
+        """
+
+        self.__force_repaint = True
+        self.update()
+
+    def __on_decoration_changed(self):
+        """Repaint after a decoration layer changed or has been rendered"""
+
+        self.__force_repaint = True
+        self.update()
+
+    def __set_value_from_position_x(self, position_x: int):
+        """Set value and position from a position on the x-axis (e.g. the mouse position)
+
+        :param position_x: position_x value
+        """
+
+        self.__store_value(self._get_value_from_position_x(position_x))
+
+        # Discrete values are drawn at their own position instead of the mouse position
+        if self.__get_allowed_values_in_range() is not None:
+            self.__position_x = None
+        else:
+            self.__position_x = self.__clamp_position_x(position_x)
+
+    def _get_value_from_position_x(self, position_x: int) -> int | float:
         """Get slider value from position_x value
 
         :param position_x: position_x value
         :return: slider value
         """
 
+        # Discrete values
+        allowed_values = self.__get_allowed_values_in_range()
+        if allowed_values is not None:
+            index = self.__get_allowed_values_table()[self.__clamp_position_x(int(position_x))]
+            return allowed_values[index]
+
+        return self._clamp_value(self.__get_scaled_value_from_position_x(position_x))
+
+    def __get_scaled_value_from_position_x(self, position_x: int) -> int | float:
+        """Get the (unclamped) value of a position according to the scale of the slider
+
+        :param position_x: position_x value
+        :return: slider value
+        """
+
+        # Non-linear scale
+        if not self.__scale.isLinear():
+            return self.__get_scale_table().valueAt(position_x)
+
         # Get slider range
         value_range = self.__get_value_range()
 
+        # Exact integer arithmetic for int sliders (floats lose precision for ranges above 2^53)
+        if self.__is_integer_exact() and isinstance(position_x, int):
+            return self.__divide_truncated(self.__minimum * self.width() + position_x * value_range, self.width())
+
         # Calculate value
         value = position_x / self.width() * value_range
 
         if self.__minimum < 0 or self.__minimum > 0:
             value = value + self.__minimum
 
-        return self.__clamp_value(value)
+        return value
 
-    def __get_position_x_from_value(self, value: int | float) -> int:
+    def _get_position_x_from_value(self, value: int | float) -> int:
         """Get position_x value from slider value
 
         :param value: slider value
         :return: position_x value
         """
 
+        # Non-linear scale
+        if not self.__scale.isLinear():
+            return self.__get_scale_table().positionOf(value)
+
         # Get slider range
         value_range = self.__get_value_range()
 
+        # Exact integer arithmetic for int sliders
+        if self.__is_integer_exact() and isinstance(value, int):
+            return self.__divide_truncated((value - self.__minimum) * self.width(), value_range)
+
         # Calculate x position
         if self.__minimum < 0:
             position_x = (value + abs(self.__minimum)) * (self.width() / value_range)
@@ -741,6 +1633,122 @@ class Slider(QWidget):
 
         return int(position_x)
 
+    def __get_scale_table(self):
+        """Get the lookup table of the non-linear scale for the current width and range
+
+        :return: scale table
+        """
+
+        key = (self.width(), self.__minimum, self.__maximum)
+        if self.__scale_table is None or self.__scale_table_key != key:
+            self.__scale_table = self.__scale.createTable(self.__minimum, self.__maximum, self.width())
+            self.__scale_table_key = key
+        return self.__scale_table
+
+    def __get_allowed_values_table(self) -> list[int]:
+        """Get the lookup table mapping each pixel column to the index of the nearest allowed value
+
+        :return: allowed value index per pixel column
+        """
+
+        key = (self.width(), self.__minimum, self.__maximum, self.__scale)
+        if self.__allowed_values_table is None or self.__allowed_values_table_key != key:
+            allowed_values = self.__get_allowed_values_in_range()
+            self.__allowed_values_table = [
+                self.__get_nearest_allowed_index(self.__get_scaled_value_from_position_x(position_x), allowed_values)
+                for position_x in range(self.width() + 1)
+            ]
+            self.__allowed_values_table_key = key
+        return self.__allowed_values_table
+
+    def __get_nearest_allowed_value(self, value: int | float) -> int | float:
+        """Get the allowed value closest to a value (O(log n) bisection)
+
+        :param value: value
+        :return: nearest allowed value
+        """
+
+        allowed_values = self.__get_allowed_values_in_range()
+        return allowed_values[self.__get_nearest_allowed_index(value, allowed_values)]
+
+    def __get_allowed_values_in_range(self) -> list[int | float] | None:
+        """Get the allowed values inside the range (cached until the range or the allowed values change)
+
+        :return: sorted allowed values or None if every value in the range is allowed
+        """
+
+        if self.__allowed_values is None:
+            return None
+
+        key = (self.__minimum, self.__maximum)
+        if self.__allowed_values_in_range is None or self.__allowed_values_in_range_key != key:
+            start = bisect_left(self.__allowed_values, self.__minimum)
+            end = bisect_right(self.__allowed_values, self.__maximum)
+            self.__allowed_values_in_range = self.__allowed_values[start:end]
+            self.__allowed_values_in_range_key = key
+        return self.__allowed_values_in_range or None
+
+    @staticmethod
+    def __get_nearest_allowed_index(value: int | float, allowed_values: list[int | float]) -> int:
+        """Get the index of the allowed value closest to a value (O(log n) bisection)
+
+        :param value: value
+        :param allowed_values: sorted allowed values
+        :return: index of the nearest allowed value
+        """
+
+        index = bisect_left(allowed_values, value)
+        if index <= 0:
+            return 0
+        if index >= len(allowed_values):
+            return len(allowed_values) - 1
+        if value - allowed_values[index - 1] <= allowed_values[index] - value:
+            return index - 1
+        return index
+
+    def _get_stepped_value(self, value: int | float, step: int | float, default_step: float, direction: int,
+                           page: bool = False) -> int | float:
+        """Get a value after stepping in a direction. Without a custom step, the default step
+        is a fraction of the value range (or of the track length for non-linear scales).
+        With discrete values, a single step moves to the next value and a page step
+        moves by the default step fraction of the values
+
+        :param value: value to step from
+        :param step: custom step (0 = use default step)
+        :param default_step: fraction of the range used as default step
+        :param direction: 1 to increment, -1 to decrement
+        :param page: whether the step is a page step
+        :return: clamped stepped value
+        """
+
+        # Step by index through discrete values
+        allowed_values = self.__get_allowed_values_in_range()
+        if allowed_values is not None:
+            index_step = max(1, round(len(allowed_values) * default_step)) if page else 1
+            index = bisect_left(allowed_values, value) + index_step * direction
+            return allowed_values[min(max(index, 0), len(allowed_values) - 1)]
+
+        if step <= 0 and self.__scale.isLinear():
+            step = self.__get_value_range() * default_step
+
+            # Exact integer default step (e.g. range // 100) unless it is smaller than 1
+            if self.__is_integer_exact() and isinstance(value, int):
+                integer_step = self.__get_value_range() * round(default_step * 10000) // 10000
+                if integer_step > 0:
+                    step = integer_step
+
+        if step > 0:
+            # Step in integer units without accumulating rounding errors
+            if self.__fixed_point_scale is not None:
+                units = round(value * self.__fixed_point_scale) + round(step * self.__fixed_point_scale) * direction
+                return self._clamp_value(units / self.__fixed_point_scale)
+            return self._clamp_value(value + step * direction)
+
+        # Step along the track for non-linear scales
+        normalized = self.__scale.toNormalized(value, self.__minimum, self.__maximum)
+        normalized = min(max(normalized + default_step * direction, 0.0), 1.0)
+        return self._clamp_value(self.__scale.fromNormalized(normalized, self.__minimum, self.__maximum))
+
     def __get_value_range(self) -> int | float:
         """Get the range from minimum to maximum of the slider
 
@@ -752,6 +1760,27 @@ class Slider(QWidget):
         else:
             return self.__maximum - self.__minimum
 
+    def __is_integer_exact(self) -> bool:
+        """Check whether values can be mapped with exact integer arithmetic (int slider with int range)
+
+        :return: whether integer arithmetic can be used
+        """
+
+        return not self.__is_float and isinstance(self.__minimum, int) and isinstance(self.__maximum, int)
+
+    @staticmethod
+    def __divide_truncated(numerator: int, denominator: int) -> int:
+        """Divide integers and truncate towards zero like int() does for floats
+
+        :param numerator: numerator
+        :param denominator: positive denominator
+        :return: truncated quotient
+        """
+
+        if numerator < 0:
+            return -(-numerator // denominator)
+        return numerator // denominator
+
     def __clamp_position_x(self, position_x: int) -> int:
         """Make sure that position_x stays between 0 and slider width
 
@@ -765,7 +1794,7 @@ class Slider(QWidget):
             position_x = 0
         return position_x
 
-    def __clamp_value(self, value: int | float) -> int | float:
+    def _clamp_value(self, value: int | float) -> int | float:
         """Make sure that value stays in slider range
 
         :param value: value that will get clamped
@@ -778,6 +1807,20 @@ class Slider(QWidget):
             value = self.__minimum
         return value
 
+    def _format_value_string(self, value: int | float) -> str:
+        """Format a value with the format settings, prefix and suffix of the slider
+
+        :param value: value that will get formatted
+        :return: formatted value string
+        """
+
+        if self.__fixed_point_scale is not None:
+            return self.__prefix + self.__format_fixed_point(round(value * self.__fixed_point_scale)) + self.__suffix
+
+        return self.__prefix + self.__format_value(value, self.__is_float, self.__decimals,
+                                                   self.__thousands_separator,
+                                                   self.__decimal_separator) + self.__suffix
+
     def __format_value(self, value: int | float, is_float: bool, decimals: int,
                        thousands_separator: str, decimal_separator: str) -> str:
         """Format value into a string with given settings
@@ -802,15 +1845,152 @@ class Slider(QWidget):
                     .replace(temp_decimal_separator, decimal_separator))
 
         # Int slider
-        string_format = '{:,.0f}'
+        string_format = '{:,d}'
         return string_format.format(int(value)).replace(',', thousands_separator)
 
+    def __produce_preview(self, bucket: int):
+        """Call the preview provider with the start value of a bucket (runs on a worker thread)
+
+        :param bucket: bucket index
+        :return: preview image
+        """
+
+        return self.__preview_provider(self.__minimum + bucket * self.__preview_bucket_size)
+
+    def __get_preview_bucket(self, value: int | float) -> int:
+        """Get the index of the preview bucket a value is in
+
+        :param value: slider value
+        :return: bucket index
+        """
+
+        return int((value - self.__minimum) // self.__preview_bucket_size)
+
+    def __update_preview_bucket_range(self):
+        """Update the valid bucket range of the preview cache after the range changed"""
+
+        if self.__preview_cache is None:
+            return
+
+        self.__preview_cache.clear()
+        self.__preview_cache.setBucketRange(0, self.__get_preview_bucket(self.__maximum))
+
+    def __update_preview(self):
+        """Show the preview for the current value and prefetch in the drag direction"""
+
+        if self.__preview_cache is None:
+            return
+
+        bucket = self.__get_preview_bucket(self.__value)
+        direction = 0
+        if self.__preview_bucket is not None:
+            direction = (bucket > self.__preview_bucket) - (bucket < self.__preview_bucket)
+        self.__preview_bucket = bucket
+
+        # Keep showing the previous preview until the current one is ready
+        self.__preview_cache.request(bucket, direction)
+        image = self.__preview_cache.get(bucket)
+        if image is not None:
+            self.__show_preview(image)
+        elif self.isPreviewVisible():
+            self.__move_preview()
+
+    def __on_preview_ready(self, bucket: int, image):
+        """Show a produced preview if it belongs to the current bucket
+
+        :param bucket: bucket index
+        :param image: preview image
+        """
+
+        if self.__left_mouse_pressed and bucket == self.__preview_bucket:
+            self.__show_preview(image)
+
+    def __show_preview(self, image):
+        """Show an image in the preview popup above the value position
+
+        :param image: preview image
+        """
+
+        if self.__preview_popup is None:
+            self.__preview_popup = QLabel(self, Qt.WindowType.ToolTip)
+        self.__preview_popup.setPixmap(QPixmap.fromImage(image))
+        self.__preview_popup.adjustSize()
+        self.__move_preview()
+        self.__preview_popup.show()
+
+    def __move_preview(self):
+        """Move the preview popup centered above the value position"""
+
+        popup_size = self.__preview_popup.size()
+        position = QPoint(int(self.getValuePosition() - popup_size.width() / 2), -popup_size.height() - 4)
+        self.__preview_popup.move(self.mapToGlobal(position))
+
+    def __hide_preview(self):
+        """Hide the preview popup"""
+
+        self.__preview_bucket = None
+        if self.__preview_popup is not None:
+            self.__preview_popup.hide()
+
     def __emit_value_changed(self):
         """Emit signal that the value of the slider has changed"""
 
-        self.valueChanged.emit(self.__round_cast_value(self.__value))
+        start_time = self._get_trace_time()
+        self.valueChanged.emit(self.getValue())
+
+        # Count emission and the time spent in downstream handlers
+        self._record_emission(start_time)
+
+    def __is_value_changed_since_paint(self) -> bool:
+        """Check whether the (rounded) value differs from the value of the last paint event
+
+        :return: whether the value has changed
+        """
+
+        # Fixed-point values are compared as integers
+        if self.__fixed_point_scale is not None:
+            return self.__value_units != self.__value_units_last_paint_event
+        return self._round_cast_value(self.__value_last_paint_event) != self._round_cast_value(self.__value)
+
+    def __store_value(self, value: int | float):
+        """Store a new value (quantized to integer units once if fixed-point storage is enabled)
+
+        :param value: new value
+        """
+
+        if self.__fixed_point_scale is None:
+            self.__value = value
+            return
+
+        self.__value_units = round(value * self.__fixed_point_scale)
+        self.__value = self.__value_units / self.__fixed_point_scale
+
+    def __update_fixed_point(self):
+        """Update the fixed-point scale after float, decimals or fixed-point settings changed"""
+
+        if self.__fixed_point and self.__is_float:
+            self.__fixed_point_scale = 10 ** self.__decimals
+            self.__value_units_last_paint_event = round(self.__value_last_paint_event * self.__fixed_point_scale)
+        else:
+            self.__fixed_point_scale = None
+            self.__value_units = None
+            self.__value_units_last_paint_event = None
+        self.__store_value(self.__value)
+
+    def __format_fixed_point(self, units: int) -> str:
+        """Format a fixed-point value with integer operations
+
+        :param units: value as integer count of 10^-decimals units
+        :return: formatted value as a string
+        """
+
+        integer, fraction = divmod(abs(units), self.__fixed_point_scale)
+        value_string = '{:,d}'.format(integer).replace(',', self.__thousands_separator)
+        if self.__decimals > 0:
+            value_string += self.__decimal_separator + str(fraction).zfill(self.__decimals)
+        return '-' + value_string if units < 0 else value_string
 
-    def __round_cast_value(self, value: int | float) -> int | float:
+    def _round_cast_value(self, value: int | float) -> int | float:
         """Round float value or cast to int
 
         :param value: value to round or cast
@@ -0,0 +1,219 @@
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class MinMaxDecimator:
+
+    # Maximum amount of buckets per column (column edges are aligned to buckets)
+    BUCKETS_PER_COLUMN = 8
+
+    def __init__(self, values=None):
+        """Create a new MinMaxDecimator instance that reduces large data
+        to one min/max pair per pixel column
+
+        :param values: initial data (sequence or NumPy array)
+        """
+
+        self.__data = self.__new_buffer(0)
+        self.__size = 0
+
+        # Decimation for the current amount of columns (buckets of bucket_size samples each)
+        self.__columns = 0
+        self.__bucket_size = 1
+        self.__mins = []
+        self.__maxs = []
+
+        # Min/max pairs of the columns (None if they have to be combined from the buckets again)
+        self.__column_mins = None
+        self.__column_maxs = None
+
+        if values is not None:
+            self.setData(values)
+
+    def setData(self, values):
+        """Replace the data
+
+        :param values: new data (sequence or NumPy array)
+        """
+
+        values = self.__to_buffer(values)
+        self.__data = values
+        self.__size = len(values)
+        self.__columns = 0
+
+    def append(self, values):
+        """Append data and update the cached decimation incrementally
+
+        :param values: data to append (sequence or NumPy array)
+        """
+
+        values = self.__to_buffer(values)
+        if len(values) == 0:
+            return
+
+        old_size = self.__size
+        self.__reserve(old_size + len(values))
+        self.__data[old_size:old_size + len(values)] = values
+        self.__size = old_size + len(values)
+
+        if self.__columns > 0:
+            self.__extend_buckets(old_size)
+            self.__column_mins = None
+
+    def size(self) -> int:
+        """Get the amount of data points
+
+        :return: amount of data points
+        """
+
+        return self.__size
+
+    def decimate(self, columns: int) -> tuple[list[float], list[float]]:
+        """Get one min/max pair per column (or one pair per data point if there are fewer data points).
+        The data is reduced into buckets of a power of two samples once and the buckets are combined
+        into the columns, so column edges are aligned to buckets (exact for up to
+        BUCKETS_PER_COLUMN data points per column, otherwise off by less than 2 / BUCKETS_PER_COLUMN
+        of a column)
+
+        :param columns: amount of columns (e.g. width in px)
+        :return: minimums and maximums of the columns
+        """
+
+        columns = max(1, columns)
+        if columns != self.__columns:
+            self.__rebuild_buckets(columns)
+        if self.__column_mins is None:
+            self.__combine_buckets()
+        return self.__column_mins, self.__column_maxs
+
+    def __rebuild_buckets(self, columns: int):
+        """Decimate all data for the given amount of columns
+
+        :param columns: amount of columns
+        """
+
+        self.__columns = columns
+        self.__bucket_size = 1
+        while -(-self.__size // self.__bucket_size) > columns * MinMaxDecimator.BUCKETS_PER_COLUMN:
+            self.__bucket_size *= 2
+
+        self.__mins, self.__maxs = self.__reduce(0, self.__size)
+        self.__column_mins = None
+
+    def __combine_buckets(self):
+        """Combine the buckets into the columns (every column gets the buckets from
+        index * buckets // columns up to the next column)"""
+
+        buckets = len(self.__mins)
+        columns = self.__columns
+        if buckets <= columns:
+            self.__column_mins = list(self.__mins)
+            self.__column_maxs = list(self.__maxs)
+            return
+
+        if numpy is not None:
+            indices = numpy.arange(columns, dtype=numpy.int64) * buckets // columns
+            self.__column_mins = numpy.minimum.reduceat(numpy.array(self.__mins), indices).tolist()
+            self.__column_maxs = numpy.maximum.reduceat(numpy.array(self.__maxs), indices).tolist()
+            return
+
+        edges = [column * buckets // columns for column in range(columns + 1)]
+        self.__column_mins = [min(self.__mins[edges[i]:edges[i + 1]]) for i in range(columns)]
+        self.__column_maxs = [max(self.__maxs[edges[i]:edges[i + 1]]) for i in range(columns)]
+
+    def __extend_buckets(self, old_size: int):
+        """Update the decimation with data appended after old_size
+
+        :param old_size: amount of data points before appending
+        """
+
+        bucket_size = self.__bucket_size
+        start = old_size
+
+        # Complete the last partially filled bucket
+        if old_size % bucket_size != 0:
+            end = min(self.__size, old_size - old_size % bucket_size + bucket_size)
+            mins, maxs = self.__reduce(old_size, end, end - old_size)
+            self.__mins[-1] = min(self.__mins[-1], mins[0])
+            self.__maxs[-1] = max(self.__maxs[-1], maxs[0])
+            start = end
+
+        # Add new buckets
+        mins, maxs = self.__reduce(start, self.__size)
+        self.__mins += mins
+        self.__maxs += maxs
+
+        # Merge pairs of buckets until they fit into the columns again
+        while len(self.__mins) > self.__columns * MinMaxDecimator.BUCKETS_PER_COLUMN:
+            self.__bucket_size *= 2
+            self.__mins = [min(self.__mins[i:i + 2]) for i in range(0, len(self.__mins), 2)]
+            self.__maxs = [max(self.__maxs[i:i + 2]) for i in range(0, len(self.__maxs), 2)]
+
+    def __reduce(self, start: int, end: int, bucket_size: int = None) -> tuple[list[float], list[float]]:
+        """Get min/max pairs of consecutive buckets in the data range start to end
+
+        :param start: start index (inclusive)
+        :param end: end index (exclusive)
+        :param bucket_size: amount of samples per bucket (default: current bucket size)
+        :return: minimums and maximums of the buckets
+        """
+
+        if start >= end:
+            return [], []
+
+        bucket_size = bucket_size or self.__bucket_size
+        data = self.__data[start:end]
+
+        if numpy is not None:
+            indices = numpy.arange(0, end - start, bucket_size)
+            return (numpy.minimum.reduceat(data, indices).tolist(),
+                    numpy.maximum.reduceat(data, indices).tolist())
+
+        mins = [min(data[i:i + bucket_size]) for i in range(0, end - start, bucket_size)]
+        maxs = [max(data[i:i + bucket_size]) for i in range(0, end - start, bucket_size)]
+        return mins, maxs
+
+    def __reserve(self, size: int):
+        """Grow the data buffer (amortized) so that it can hold size data points
+
+        :param size: required amount of data points
+        """
+
+        if size <= len(self.__data):
+            return
+
+        # NumPy arrays can't be resized in place, so grow geometrically
+        if numpy is not None:
+            data = numpy.empty(max(size, len(self.__data) * 2), dtype=numpy.float64)
+            data[:self.__size] = self.__data[:self.__size]
+            self.__data = data
+        else:
+            self.__data.extend(array('d', bytes(8 * (size - len(self.__data)))))
+
+    @staticmethod
+    def __new_buffer(size: int):
+        """Create an empty data buffer
+
+        :param size: amount of data points
+        :return: data buffer
+        """
+
+        if numpy is not None:
+            return numpy.zeros(size, dtype=numpy.float64)
+        return array('d', bytes(8 * size))
+
+    @staticmethod
+    def __to_buffer(values):
+        """Convert data into a flat float64 buffer
+
+        :param values: data (sequence or NumPy array)
+        :return: data buffer
+        """
+
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.float64).ravel()
+        return array('d', values)
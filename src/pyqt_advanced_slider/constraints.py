@@ -0,0 +1,256 @@
+import math
+from .slider_group import SliderGroup
+
+
+class Constraint:
+
+    def __init__(self, keys):
+        """Create a new Constraint instance linking the sliders with the given keys
+
+        :param keys: keys of the linked sliders in a SliderGroup
+        """
+
+        self.__keys = list(keys)
+
+    def getKeys(self) -> list:
+        """Get the keys of the linked sliders
+
+        :return: keys
+        """
+
+        return list(self.__keys)
+
+    def solve(self, values: dict, changed: set, sliders: dict) -> dict:
+        """Compute the values of the linked sliders after some of them changed (one pass)
+
+        :param values: current values of the linked sliders (key -> value)
+        :param changed: keys of the sliders that changed and must keep their value if possible
+        :param sliders: linked sliders (key -> Slider)
+        :return: new values of the sliders that have to change (key -> value)
+        """
+
+        raise NotImplementedError
+
+
+class SumConstraint(Constraint):
+
+    def __init__(self, keys, total: int | float):
+        """Create a new SumConstraint instance keeping the sum of the linked sliders at a total.
+        When sliders change, the other sliders are rebalanced proportionally
+
+        :param keys: keys of the linked sliders in a SliderGroup
+        :param total: sum of the linked slider values
+        """
+
+        super(SumConstraint, self).__init__(keys)
+        self.__total = total
+
+    def getTotal(self) -> int | float:
+        """Get the sum of the linked slider values
+
+        :return: total
+        """
+
+        return self.__total
+
+    def solve(self, values: dict, changed: set, sliders: dict) -> dict:
+        """Rebalance the unchanged sliders proportionally to their current values"""
+
+        keys = self.getKeys()
+        fixed = [key for key in keys if key in changed]
+        free = [key for key in keys if key not in changed]
+        result = {}
+
+        # Scale the changed sliders down if they exceed the total on their own
+        fixed_sum = sum(values[key] for key in fixed)
+        if fixed_sum > self.__total:
+            scaled = self.__distribute([values[key] for key in fixed], self.__total,
+                                       [sliders[key] for key in fixed])
+            result.update(zip(fixed, scaled))
+            fixed_sum = self.__total
+
+        if len(free) == 0:
+            return result
+
+        # Distribute the remaining total proportionally (equally if all free sliders are zero)
+        remaining = self.__total - fixed_sum
+        weights = [max(0, values[key]) for key in free]
+        if sum(weights) <= 0:
+            weights = [1] * len(free)
+        result.update(zip(free, self.__distribute(weights, remaining, [sliders[key] for key in free])))
+        return result
+
+    @staticmethod
+    def __distribute(weights: list, total: int | float, sliders: list) -> list:
+        """Split a total proportionally to weights, quantized to the precision of the sliders
+        so that the rounded values still add up to the total (largest remainder method)
+
+        :param weights: weights of the shares
+        :param total: total to split
+        :param sliders: sliders receiving the shares
+        :return: shares
+        """
+
+        # Precision of the coarsest slider
+        decimals = min(slider.getDecimals() if slider.isFloat() else 0 for slider in sliders)
+        unit = 10 ** -decimals
+        total_units = round(total / unit)
+        weight_sum = sum(weights)
+
+        exact = [total_units * weight / weight_sum for weight in weights]
+        units = [math.floor(share) for share in exact]
+        remainders = sorted(range(len(exact)), key=lambda index: units[index] - exact[index])
+        for index in remainders[:total_units - sum(units)]:
+            units[index] += 1
+
+        if decimals == 0:
+            return units
+        return [round(share * unit, decimals) for share in units]
+
+
+class OrderedConstraint(Constraint):
+
+    def __init__(self, keys):
+        """Create a new OrderedConstraint instance keeping the linked sliders in ascending order
+        (e.g. lower <= middle <= upper). Changed sliders push the other sliders along
+
+        :param keys: keys of the linked sliders in ascending order
+        """
+
+        super(OrderedConstraint, self).__init__(keys)
+
+    def solve(self, values: dict, changed: set, sliders: dict) -> dict:
+        """Push the sliders before and after the changed sliders into order"""
+
+        keys = self.getKeys()
+        changed_indices = [index for index, key in enumerate(keys) if key in changed]
+        if len(changed_indices) == 0:
+            return {}
+
+        ordered = [values[key] for key in keys]
+
+        # Sliders after the changed sliders are pushed up, sliders before them are pushed down
+        for index in range(changed_indices[0] + 1, len(keys)):
+            if keys[index] not in changed:
+                ordered[index] = max(ordered[index], ordered[index - 1])
+        for index in range(changed_indices[-1] - 1, -1, -1):
+            if keys[index] not in changed:
+                ordered[index] = min(ordered[index], ordered[index + 1])
+
+        return {key: value for key, value in zip(keys, ordered) if value != values[key]}
+
+
+class ConstrainedSliderGroup(SliderGroup):
+
+    def __init__(self, parent=None):
+        """Create a new ConstrainedSliderGroup instance that keeps its sliders within constraints.
+        All linked sliders are solved in one pass, updated at once without emitting valueChanged
+        and emitted together with the next valuesChanged
+
+        :param parent: the parent object
+        """
+
+        super(ConstrainedSliderGroup, self).__init__(parent)
+
+        self.__constraints = []
+
+        # Flag to ignore the changes made while applying solved values
+        self.__solving = False
+
+    def addConstraint(self, constraint: Constraint):
+        """Add a constraint (constraints are solved in the order they have been added)
+
+        :param constraint: constraint linking sliders of this group
+        """
+
+        for key in constraint.getKeys():
+            self.getSlider(key)
+        self.__constraints.append(constraint)
+
+    def removeConstraint(self, constraint: Constraint):
+        """Remove a constraint
+
+        :param constraint: constraint to remove
+        """
+
+        self.__constraints.remove(constraint)
+
+    def getConstraints(self) -> list[Constraint]:
+        """Get all constraints
+
+        :return: constraints in solving order
+        """
+
+        return list(self.__constraints)
+
+    def setValues(self, values: dict):
+        """Set the values of multiple sliders and rebalance the linked sliders once
+
+        :param values: dict of key -> new value
+        """
+
+        self.__solving = True
+        try:
+            super(ConstrainedSliderGroup, self).setValues(values)
+        finally:
+            self.__solving = False
+        self.__solve(set(values.keys()))
+
+    def _restore_slider_states(self, states: dict):
+        """Restore the slider states without rebalancing (saved presets already satisfy the constraints)
+
+        :param states: dict of key (str) -> saved slider state
+        """
+
+        self.__solving = True
+        try:
+            super(ConstrainedSliderGroup, self)._restore_slider_states(states)
+        finally:
+            self.__solving = False
+
+    def _on_slider_value_changed(self, key, value):
+        """Record a changed slider value and rebalance the linked sliders
+
+        :param key: key of the slider
+        :param value: new value of the slider
+        """
+
+        super(ConstrainedSliderGroup, self)._on_slider_value_changed(key, value)
+        if not self.__solving:
+            self.__solve({key})
+
+    def __solve(self, changed: set):
+        """Solve all constraints once and apply the new values at once
+
+        :param changed: keys of the sliders that have been changed
+        """
+
+        changed = set(changed)
+        values = {}
+        updates = {}
+
+        for constraint in self.__constraints:
+            keys = constraint.getKeys()
+            if changed.isdisjoint(keys):
+                continue
+
+            for key in keys:
+                if key not in values:
+                    values[key] = self.getSlider(key).getValue()
+
+            solved = constraint.solve({key: values[key] for key in keys}, changed,
+                                      {key: self.getSlider(key) for key in keys})
+            values.update(solved)
+            updates.update(solved)
+
+            # Sliders solved by this constraint are fixed for the following constraints
+            changed.update(solved.keys())
+
+        if len(updates) == 0:
+            return
+
+        self.__solving = True
+        try:
+            super(ConstrainedSliderGroup, self).setValues(updates)
+        finally:
+            self.__solving = False
@@ -0,0 +1,269 @@
+import json
+from qtpy.QtCore import QObject, Signal
+from qtpy.QtNetwork import QLocalServer, QLocalSocket
+from .slider_group import SliderGroup
+
+
+class ControlServer(QObject):
+
+    # Signal (error message) emitted when a request could not be handled
+    requestFailed = Signal(str)
+
+    def __init__(self, group: SliderGroup, name: str, parent=None):
+        """Create a new ControlServer instance exposing the sliders of a group over a local socket.
+        Clients send newline-delimited JSON commands:
+        {"cmd": "set", "values": {...}}, {"cmd": "get", "keys": [...]},
+        {"cmd": "subscribe"} and {"cmd": "unsubscribe"}.
+        An optional "id" is echoed in the response
+
+        :param group: group with the exposed sliders (keys are matched as strings)
+        :param name: name of the local server (e.g. socket name or path)
+        :param parent: the parent object
+        """
+
+        super(ControlServer, self).__init__(parent)
+
+        self.__group = group
+        self.__name = name
+
+        self.__server = QLocalServer(self)
+        self.__server.newConnection.connect(self.__on_new_connection)
+
+        # Receive buffers of the connected clients and the subscribed clients
+        self.__buffers = {}
+        self.__subscribers = set()
+
+        # Subscribers get the coalesced changes of the group
+        self.__group.valuesChanged.connect(self.__on_values_changed)
+
+    def start(self) -> bool:
+        """Start listening (a stale server with the same name gets removed first)
+
+        :return: whether the server is listening
+        """
+
+        QLocalServer.removeServer(self.__name)
+        return self.__server.listen(self.__name)
+
+    def close(self):
+        """Stop listening and disconnect all clients"""
+
+        self.__server.close()
+        for socket in list(self.__buffers.keys()):
+            socket.disconnectFromServer()
+        self.__buffers.clear()
+        self.__subscribers.clear()
+
+    def isListening(self) -> bool:
+        """Get whether the server is listening
+
+        :return: whether the server is listening
+        """
+
+        return self.__server.isListening()
+
+    def getServerName(self) -> str:
+        """Get the name clients connect to
+
+        :return: server name
+        """
+
+        return self.__server.fullServerName() or self.__name
+
+    def getClientCount(self) -> int:
+        """Get the amount of connected clients
+
+        :return: amount of clients
+        """
+
+        return len(self.__buffers)
+
+    def getSubscriberCount(self) -> int:
+        """Get the amount of subscribed clients
+
+        :return: amount of subscribers
+        """
+
+        return len(self.__subscribers)
+
+    def __on_new_connection(self):
+        """Accept all pending connections"""
+
+        while self.__server.hasPendingConnections():
+            socket = self.__server.nextPendingConnection()
+            self.__buffers[socket] = b''
+            socket.readyRead.connect(lambda socket=socket: self.__on_ready_read(socket))
+            socket.disconnected.connect(lambda socket=socket: self.__on_disconnected(socket))
+
+    def __on_disconnected(self, socket: QLocalSocket):
+        """Forget a disconnected client
+
+        :param socket: socket of the client
+        """
+
+        self.__buffers.pop(socket, None)
+        self.__subscribers.discard(socket)
+        socket.deleteLater()
+
+    def __on_ready_read(self, socket: QLocalSocket):
+        """Handle all complete lines received from a client. The values of consecutive set commands
+        are applied with one setValues() call, so the sliders repaint once and the group emits once.
+        A set command changing a slider of the current batch again starts a new batch, so every
+        response contains the state at its place in the stream
+
+        :param socket: socket of the client
+        """
+
+        if socket not in self.__buffers:
+            return
+
+        lines = (self.__buffers[socket] + bytes(socket.readAll())).split(b'\n')
+        self.__buffers[socket] = lines.pop()
+
+        commands = [self.__decode_line(line) for line in lines if len(line.strip()) > 0]
+        if len(commands) == 0:
+            return
+
+        responses = []
+        batch_commands = []
+        batch = {}
+        for command in commands:
+            is_set = command['error'] is None and command['values'] is not None
+            if len(batch_commands) > 0 and (not is_set or any(key in batch for key in command['values'])):
+                responses += self.__apply_batch(socket, batch_commands, batch)
+                batch_commands = []
+                batch = {}
+
+            if is_set:
+                batch_commands.append(command)
+                batch.update(command['values'])
+            else:
+                responses.append(self.__handle_command(socket, command))
+
+        if len(batch_commands) > 0:
+            responses += self.__apply_batch(socket, batch_commands, batch)
+
+        self.__send(socket, responses)
+
+    def __apply_batch(self, socket: QLocalSocket, commands: list[dict], values: dict) -> list[dict]:
+        """Apply the values of consecutive set commands with one setValues() call. If the group
+        rejects the values, the commands are applied one by one to report the error for the failing command
+
+        :param socket: socket of the client
+        :param commands: set commands decoded with __decode_line()
+        :param values: merged values of the commands (by group key)
+        :return: responses of the commands
+        """
+
+        try:
+            self.__group.setValues(values)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            if len(commands) > 1:
+                return [response for command in commands
+                        for response in self.__apply_batch(socket, [command], command['values'])]
+
+            commands[0]['error'] = '{}: {}'.format(type(error).__name__, error)
+            self.requestFailed.emit(commands[0]['error'])
+
+        return [self.__handle_command(socket, command) for command in commands]
+
+    def __decode_line(self, line: bytes) -> dict:
+        """Decode and validate one command
+
+        :param line: JSON encoded command
+        :return: dict with the id, the request, the values of a set command (by group key) or an error
+        """
+
+        command = {'id': None, 'request': None, 'values': None, 'error': None}
+        try:
+            request = json.loads(line)
+            command['id'] = request.get('id')
+            if request['cmd'] == 'set':
+                keys = {str(key): key for key in self.__group.getKeys()}
+                values = {}
+                for name, value in request['values'].items():
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise TypeError('Value of {} is not a number'.format(name))
+                    values[keys[name]] = value
+                command['values'] = values
+            command['request'] = request
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            command['error'] = '{}: {}'.format(type(error).__name__, error)
+            self.requestFailed.emit(command['error'])
+        return command
+
+    def __handle_command(self, socket: QLocalSocket, command: dict) -> dict:
+        """Execute a decoded command (the values of set commands have already been applied)
+
+        :param socket: socket of the client
+        :param command: command decoded with __decode_line()
+        :return: response
+        """
+
+        if command['error'] is None:
+            try:
+                response = self.__handle_request(socket, command)
+            except (ValueError, KeyError, TypeError, AttributeError) as error:
+                command['error'] = '{}: {}'.format(type(error).__name__, error)
+                self.requestFailed.emit(command['error'])
+
+        if command['error'] is not None:
+            response = {'ok': False, 'error': command['error']}
+        if command['id'] is not None:
+            response['id'] = command['id']
+        return response
+
+    def __handle_request(self, socket: QLocalSocket, command: dict) -> dict:
+        """Execute a decoded request
+
+        :param socket: socket of the client
+        :param command: command decoded with __decode_line()
+        :return: response
+        """
+
+        request = command['request']
+        name = request['cmd']
+        keys = {str(key): key for key in self.__group.getKeys()}
+
+        if name == 'set':
+            return {'ok': True, 'values': {str(key): self.__group.getSlider(key).getValue()
+                                           for key in command['values']}}
+
+        if name == 'get':
+            names = request.get('keys')
+            selected = keys.values() if names is None else [keys[name] for name in names]
+            return {'ok': True, 'values': {str(key): self.__group.getSlider(key).getValue() for key in selected}}
+
+        if name == 'subscribe':
+            self.__subscribers.add(socket)
+            return {'ok': True}
+
+        if name == 'unsubscribe':
+            self.__subscribers.discard(socket)
+            return {'ok': True}
+
+        raise ValueError('Unknown command {}'.format(name))
+
+    def __on_values_changed(self, values: dict):
+        """Stream the coalesced changes of the group to all subscribers
+
+        :param values: changed values (key -> value)
+        """
+
+        if len(self.__subscribers) == 0:
+            return
+
+        event = {'event': 'valuesChanged', 'values': {str(key): value for key, value in values.items()}}
+        for socket in self.__subscribers:
+            self.__send(socket, [event])
+
+    @staticmethod
+    def __send(socket: QLocalSocket, messages: list[dict]):
+        """Send messages as newline-delimited JSON with one write
+
+        :param socket: socket of the client
+        :param messages: messages to send
+        """
+
+        socket.write(b''.join(json.dumps(message).encode('utf-8') + b'\n' for message in messages))
+        socket.flush()
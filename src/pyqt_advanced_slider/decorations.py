@@ -0,0 +1,552 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from qtpy.QtCore import QObject, Signal, Slot, Qt
+from qtpy.QtGui import QImage, QPainter, QPen, QColor, QFont, QFontMetrics
+
+
+class RenderContext:
+
+    __slots__ = ('width', 'height', 'device_pixel_ratio', 'minimum', 'maximum', 'font', 'scale')
+
+    def __init__(self, width: int, height: int, device_pixel_ratio: float,
+                 minimum: int | float, maximum: int | float, font: QFont, scale=None):
+        """Create a new RenderContext instance (snapshot of the slider state used for rendering)
+
+        :param width: width of the slider in logical px
+        :param height: height of the slider in logical px
+        :param device_pixel_ratio: device pixel ratio of the screen the slider is shown on
+        :param minimum: minimum value of the slider
+        :param maximum: maximum value of the slider
+        :param font: font of the slider
+        :param scale: scale of the slider (None = linear)
+        """
+
+        self.width = width
+        self.height = height
+        self.device_pixel_ratio = device_pixel_ratio
+        self.minimum = minimum
+        self.maximum = maximum
+        self.font = QFont(font)
+        self.scale = scale
+
+    def positionOf(self, value: int | float) -> int:
+        """Get the position of a value on the x-axis
+
+        :param value: value
+        :return: position in px
+        """
+
+        if self.scale is None:
+            normalized = (value - self.minimum) / (self.maximum - self.minimum)
+        else:
+            normalized = self.scale.toNormalized(value, self.minimum, self.maximum)
+        return int(normalized * self.width)
+
+
+class DecorationLayer(QObject):
+
+    # Where the layer is drawn
+    BELOW_VALUE = 0
+    ABOVE_VALUE = 1
+
+    # Signal emitted when the layer has to be rendered again
+    changed = Signal()
+
+    def __init__(self, z: int = BELOW_VALUE, asynchronous: bool = True, parent=None):
+        """Create a new DecorationLayer instance.
+        Subclasses implement render() and optionally snapshot() and cacheKey()
+
+        :param z: whether the layer is drawn below or above the value rect
+        :param asynchronous: whether the layer is rendered on a worker thread
+        :param parent: the parent object
+        """
+
+        super(DecorationLayer, self).__init__(parent)
+
+        self.__z = z
+        self.__asynchronous = asynchronous
+        self.__generation = 0
+
+    def getZ(self) -> int:
+        """Get whether the layer is drawn below or above the value rect
+
+        :return: BELOW_VALUE or ABOVE_VALUE
+        """
+
+        return self.__z
+
+    def isAsynchronous(self) -> bool:
+        """Get whether the layer is rendered on a worker thread
+
+        :return: whether the layer is rendered asynchronously
+        """
+
+        return self.__asynchronous
+
+    def getGeneration(self) -> int:
+        """Get the generation of the layer (incremented every time the layer is invalidated)
+
+        :return: generation
+        """
+
+        return self.__generation
+
+    def invalidate(self):
+        """Mark the layer as changed so that it gets rendered again"""
+
+        self.__generation += 1
+        self.changed.emit()
+
+    def cacheKey(self, context: RenderContext):
+        """Get the key the rendered layer is cached with (called on the GUI thread)
+
+        :param context: render context
+        :return: hashable cache key
+        """
+
+        return context.width, context.height, context.device_pixel_ratio
+
+    def snapshot(self, context: RenderContext):
+        """Get the state needed by render() (called on the GUI thread).
+        The returned state must not be modified afterwards since render() may run on a worker thread
+
+        :param context: render context
+        :return: state passed to render()
+        """
+
+        return None
+
+    def render(self, painter: QPainter, context: RenderContext, state):
+        """Render the layer (called on a worker thread for asynchronous layers)
+
+        :param painter: painter of the QImage the layer is rendered into
+        :param context: render context
+        :param state: state returned by snapshot()
+        """
+
+        raise NotImplementedError
+
+
+class BackgroundDataLayer(DecorationLayer):
+
+    def __init__(self, decimator, color: QColor, parent=None):
+        """Create a new BackgroundDataLayer instance that draws decimated data as min/max lines
+
+        :param decimator: MinMaxDecimator holding the data
+        :param color: color of the data
+        :param parent: the parent object
+        """
+
+        super(BackgroundDataLayer, self).__init__(DecorationLayer.BELOW_VALUE, True, parent)
+
+        self.__decimator = decimator
+        self.__color = QColor(color)
+
+    def getDecimator(self):
+        """Get the decimator holding the data
+
+        :return: decimator
+        """
+
+        return self.__decimator
+
+    def setColor(self, color: QColor):
+        """Set the color of the data
+
+        :param color: new color
+        """
+
+        self.__color = QColor(color)
+        self.invalidate()
+
+    def snapshot(self, context: RenderContext):
+        """Decimate the data for the current width (cached and incremental in the decimator)
+
+        :param context: render context
+        :return: copies of the minimums and maximums and the color
+        """
+
+        mins, maxs = self.__decimator.decimate(context.width)
+        return tuple(mins), tuple(maxs), QColor(self.__color)
+
+    def render(self, painter: QPainter, context: RenderContext, state):
+        """Draw one min/max line per pixel column
+
+        :param painter: painter of the QImage the layer is rendered into
+        :param context: render context
+        :param state: minimums, maximums and color
+        """
+
+        mins, maxs, color = state
+        if len(mins) == 0:
+            return
+
+        width = context.width
+        height = context.height
+        low = min(mins)
+        high = max(maxs)
+        value_range = high - low if high > low else 1
+
+        painter.setPen(QPen(color))
+
+        # Stretch buckets over the full width (one min/max line per pixel column)
+        for x in range(width):
+            bucket = x * len(mins) // width
+            y_max = int((height - 1) * (1 - (maxs[bucket] - low) / value_range))
+            y_min = int((height - 1) * (1 - (mins[bucket] - low) / value_range))
+            painter.drawLine(x, y_max, x, y_min)
+
+
+class TickLayer(DecorationLayer):
+
+    # Default color of the ticks and labels
+    DEFAULT_COLOR = QColor(0, 0, 0, 96)
+
+    def __init__(self, formatter, format_key, parent=None):
+        """Create a new TickLayer instance that draws major and minor tick marks and labels.
+        Tick positions and label layouts are computed once per size, range, font and format
+
+        :param formatter: function formatting a tick value into its label
+        :param format_key: function returning a hashable key of the current label format
+        :param parent: the parent object
+        """
+
+        super(TickLayer, self).__init__(DecorationLayer.ABOVE_VALUE, False, parent)
+
+        self.__formatter = formatter
+        self.__format_key = format_key
+        self.__major_interval = 0
+        self.__minor_interval = 0
+        self.__major_positions = None
+        self.__minor_positions = None
+        self.__labels_visible = False
+        self.__color = QColor(TickLayer.DEFAULT_COLOR)
+
+    def getInterval(self) -> tuple[int | float, int | float]:
+        """Get the major and minor tick interval
+
+        :return: major and minor tick interval (0 = no ticks)
+        """
+
+        return self.__major_interval, self.__minor_interval
+
+    def setInterval(self, major: int | float, minor: int | float = 0):
+        """Set the major and minor tick interval
+
+        :param major: major tick interval (0 = no major ticks)
+        :param minor: minor tick interval (0 = no minor ticks)
+        """
+
+        self.__major_interval = major
+        self.__minor_interval = minor
+        self.invalidate()
+
+    def getPositions(self) -> tuple[list | None, list | None]:
+        """Get the explicit major and minor tick values
+
+        :return: major and minor tick values (None = use the interval)
+        """
+
+        return self.__major_positions, self.__minor_positions
+
+    def setPositions(self, major, minor=None):
+        """Set explicit major and minor tick values (used instead of the interval)
+
+        :param major: major tick values (None = use the major interval)
+        :param minor: minor tick values (None = use the minor interval)
+        """
+
+        self.__major_positions = None if major is None else sorted(major)
+        self.__minor_positions = None if minor is None else sorted(minor)
+        self.invalidate()
+
+    def isLabelsVisible(self) -> bool:
+        """Get whether the major ticks are labeled
+
+        :return: whether labels are visible
+        """
+
+        return self.__labels_visible
+
+    def setLabelsVisible(self, on: bool):
+        """Set whether the major ticks are labeled
+
+        :param on: whether labels should be visible
+        """
+
+        self.__labels_visible = on
+        self.invalidate()
+
+    def getColor(self) -> QColor:
+        """Get the color of the ticks and labels
+
+        :return: color
+        """
+
+        return self.__color
+
+    def setColor(self, color: QColor):
+        """Set the color of the ticks and labels
+
+        :param color: new color
+        """
+
+        self.__color = QColor(color)
+        self.invalidate()
+
+    def cacheKey(self, context: RenderContext):
+        """Ticks depend on size, range, font, scale and label format
+
+        :param context: render context
+        :return: hashable cache key
+        """
+
+        return (context.width, context.height, context.device_pixel_ratio, context.minimum, context.maximum,
+                context.font.key(), context.scale, self.__format_key())
+
+    def snapshot(self, context: RenderContext):
+        """Compute the tick positions and the label layout
+
+        :param context: render context
+        :return: major and minor tick positions, labels (x, text) and color
+        """
+
+        if context.maximum <= context.minimum:
+            return [], [], [], QColor(self.__color)
+
+        major_values = self.__get_tick_values(self.__major_positions, self.__major_interval, context)
+        minor_values = self.__get_tick_values(self.__minor_positions, self.__minor_interval, context)
+
+        major = sorted({context.positionOf(value) for value in major_values})
+        minor = sorted({context.positionOf(value) for value in minor_values} - set(major))
+
+        # Lay out labels centered on the major ticks, skipping labels that would overlap
+        labels = []
+        if self.__labels_visible:
+            metrics = QFontMetrics(context.font)
+            last_right = None
+            for value in major_values:
+                text = self.__formatter(value)
+                text_width = metrics.horizontalAdvance(text)
+                text_x = min(max(context.positionOf(value) - text_width // 2, 1), context.width - text_width - 1)
+                if last_right is not None and text_x < last_right + 4:
+                    continue
+                labels.append((text_x, text))
+                last_right = text_x + text_width
+
+        return major, minor, labels, QColor(self.__color)
+
+    def render(self, painter: QPainter, context: RenderContext, state):
+        """Draw the ticks at the bottom edge and the labels above them
+
+        :param painter: painter of the QImage the layer is rendered into
+        :param context: render context
+        :param state: major and minor tick positions, labels and color
+        """
+
+        major, minor, labels, color = state
+        height = context.height
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setPen(QPen(color))
+
+        for position_x in major:
+            painter.drawLine(position_x, height - 1, position_x, height - 1 - max(2, height // 3))
+        for position_x in minor:
+            painter.drawLine(position_x, height - 1, position_x, height - 1 - max(1, height // 6))
+
+        if labels:
+            text_y = height - max(2, height // 3) - 2
+            for text_x, text in labels:
+                painter.drawText(text_x, text_y, text)
+
+    @staticmethod
+    def __get_tick_values(positions, interval: int | float, context: RenderContext) -> list[int | float]:
+        """Get the tick values inside the range (explicit values or multiples of the interval)
+
+        :param positions: explicit tick values or None
+        :param interval: tick interval (used if there are no explicit values)
+        :param context: render context
+        :return: tick values
+        """
+
+        if positions is not None:
+            return [value for value in positions if context.minimum <= value <= context.maximum]
+        if interval <= 0:
+            return []
+
+        # Multiples of the interval (computed from integer indices so there is no accumulating error)
+        if isinstance(interval, int) and isinstance(context.minimum, int) and isinstance(context.maximum, int):
+            first = -(-context.minimum // interval)
+            last = context.maximum // interval
+        else:
+            # Allow for rounding, so bounds that are multiples of the interval get a tick (e.g. 1.0 / 0.1 = 9.999...)
+            first = math.ceil(context.minimum / interval - 1e-9)
+            last = math.floor(context.maximum / interval + 1e-9)
+        if last - first > context.width:
+            # Denser than one tick per pixel
+            return []
+        return [min(max(index * interval, context.minimum), context.maximum) for index in range(first, last + 1)]
+
+
+class DecorationRenderer(QObject):
+
+    # Signal emitted on the GUI thread when a layer has been rendered
+    layerReady = Signal(object)
+
+    # Internal signal used to hand images from the worker thread back to the GUI thread
+    _render_done = Signal(object, object, object)
+
+    # Executor shared by all renderers (rendering is done one layer at a time)
+    __shared_executor = None
+
+    def __init__(self, executor=None, parent=None):
+        """Create a new DecorationRenderer instance that renders and caches decoration layers
+
+        :param executor: concurrent.futures executor to render asynchronous layers on (optional)
+        :param parent: the parent object
+        """
+
+        super(DecorationRenderer, self).__init__(parent)
+
+        self.__executor = executor
+
+        # Layer -> device pixel ratio -> (cache key, image) of the latest rendered image
+        self.__images = {}
+
+        # Layer -> cache key of the image that is being rendered
+        self.__pending = {}
+
+        self._render_done.connect(self.__on_render_done)
+
+    def image(self, layer: DecorationLayer, context: RenderContext) -> QImage | None:
+        """Get the rendered image of a layer. Images are cached per device pixel ratio.
+        Asynchronous layers return the previously rendered image (or None) until the current image is ready
+
+        :param layer: decoration layer
+        :param context: render context
+        :return: rendered image or None
+        """
+
+        device_pixel_ratio = context.device_pixel_ratio
+        key = (layer.getGeneration(), device_pixel_ratio, layer.cacheKey(context))
+        images = self.__images.setdefault(layer, {})
+        entry = images.get(device_pixel_ratio)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        # Synchronous layers are rendered right away
+        if not layer.isAsynchronous():
+            image = DecorationRenderer.renderLayer(layer, context, layer.snapshot(context))
+            images[device_pixel_ratio] = (key, image)
+            return image
+
+        # Render on worker thread if not already being rendered
+        if self.__pending.get(layer) != key:
+            self.__pending[layer] = key
+            state = layer.snapshot(context)
+            future = self.__get_executor().submit(DecorationRenderer.renderLayer, layer, context, state)
+            future.add_done_callback(lambda f: self.__on_future_done(f, layer, key))
+
+        # Fall back to an image rendered for another device pixel ratio
+        if entry is None and len(images) > 0:
+            entry = next(iter(images.values()))
+        return entry[1] if entry is not None else None
+
+    def isPending(self) -> bool:
+        """Get whether any layer is being rendered
+
+        :return: whether any layer is being rendered
+        """
+
+        return len(self.__pending) > 0
+
+    def discard(self, layer: DecorationLayer):
+        """Drop the cached image of a layer
+
+        :param layer: decoration layer
+        """
+
+        self.__images.pop(layer, None)
+        self.__pending.pop(layer, None)
+
+    def clear(self):
+        """Drop all cached images"""
+
+        self.__images.clear()
+        self.__pending.clear()
+
+    @staticmethod
+    def renderLayer(layer: DecorationLayer, context: RenderContext, state) -> QImage:
+        """Render a layer into a new transparent QImage (safe to call off the GUI thread)
+
+        :param layer: decoration layer
+        :param context: render context
+        :param state: state returned by the snapshot() method of the layer
+        :return: rendered image
+        """
+
+        image = QImage(max(1, round(context.width * context.device_pixel_ratio)),
+                       max(1, round(context.height * context.device_pixel_ratio)),
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(context.device_pixel_ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(context.font)
+        try:
+            layer.render(painter, context, state)
+        finally:
+            painter.end()
+        return image
+
+    def __get_executor(self):
+        """Get the executor asynchronous layers are rendered on
+
+        :return: executor
+        """
+
+        if self.__executor is not None:
+            return self.__executor
+        if DecorationRenderer.__shared_executor is None:
+            DecorationRenderer.__shared_executor = ThreadPoolExecutor(max_workers=1,
+                                                                      thread_name_prefix='slider-render')
+        return DecorationRenderer.__shared_executor
+
+    def __on_future_done(self, future, layer: DecorationLayer, key):
+        """Called on the worker thread when a layer has been rendered
+
+        :param future: future of the job
+        :param layer: decoration layer
+        :param key: cache key of the job
+        """
+
+        if future.cancelled():
+            return
+
+        image = None if future.exception() is not None else future.result()
+        try:
+            self._render_done.emit(layer, key, image)
+        except RuntimeError:
+            # Underlying QObject has already been deleted
+            pass
+
+    @Slot(object, object, object)
+    def __on_render_done(self, layer: DecorationLayer, key, image):
+        """Called on the GUI thread with a rendered image
+
+        :param layer: decoration layer
+        :param key: cache key of the job
+        :param image: rendered image (None if rendering failed)
+        """
+
+        # Layer has been discarded or a newer image has been requested in the meantime
+        if self.__pending.get(layer) != key:
+            return
+
+        del self.__pending[layer]
+        if image is None:
+            return
+
+        self.__images.setdefault(layer, {})[key[1]] = (key, image)
+        self.layerReady.emit(layer)
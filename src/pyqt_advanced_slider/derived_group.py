@@ -0,0 +1,248 @@
+from graphlib import TopologicalSorter, CycleError
+from .slider_group import SliderGroup
+
+
+class DerivedSliderGroup(SliderGroup):
+
+    def __init__(self, parent=None):
+        """Create a new DerivedSliderGroup instance in which slider values and ranges can be
+        derived from other sliders. Changes propagate in topological order, every dependent slider
+        is recomputed once per change and emits valueChanged at most once
+
+        :param parent: the parent object
+        """
+
+        super(DerivedSliderGroup, self).__init__(parent)
+
+        # Rules by key of the derived slider: (function, source keys)
+        self.__value_rules = {}
+        self.__range_rules = {}
+
+        # Evaluation order of all sliders with rules and direct dependents of every source
+        self.__order = []
+        self.__dependents = {}
+
+        # Flag to ignore the changes made while propagating
+        self.__propagating = False
+
+    def setDerivedValue(self, key, fn, sources):
+        """Derive the value of a slider from other sliders (value = fn(*source values)).
+        Raises ValueError if the dependency would be cyclic
+
+        :param key: key of the derived slider
+        :param fn: function computing the value from the source values
+        :param sources: keys of the source sliders
+        """
+
+        self.__set_rule(self.__value_rules, key, fn, sources)
+
+    def removeDerivedValue(self, key):
+        """Stop deriving the value of a slider
+
+        :param key: key of the derived slider
+        """
+
+        self.__value_rules.pop(key, None)
+        self.__update_order()
+
+    def setDerivedRange(self, key, fn, sources):
+        """Derive the range of a slider from other sliders ((minimum, maximum) = fn(*source values)).
+        Raises ValueError if the dependency would be cyclic
+
+        :param key: key of the derived slider
+        :param fn: function computing the range from the source values
+        :param sources: keys of the source sliders
+        """
+
+        self.__set_rule(self.__range_rules, key, fn, sources)
+
+    def removeDerivedRange(self, key):
+        """Stop deriving the range of a slider
+
+        :param key: key of the derived slider
+        """
+
+        self.__range_rules.pop(key, None)
+        self.__update_order()
+
+    def getDependencies(self, key) -> set:
+        """Get the keys of the sliders a slider is derived from
+
+        :param key: key of the slider
+        :return: source keys
+        """
+
+        dependencies = set()
+        for rules in (self.__range_rules, self.__value_rules):
+            if key in rules:
+                dependencies.update(rules[key][1])
+        return dependencies
+
+    def getEvaluationOrder(self) -> list:
+        """Get the order in which the sliders are recomputed
+
+        :return: keys in topological order
+        """
+
+        return list(self.__order)
+
+    def removeSlider(self, key):
+        """Remove a slider from the group (fails while other sliders are derived from it)
+
+        :param key: key of the slider
+        :return: removed slider
+        """
+
+        if len(self.__dependents.get(key, ())) > 0:
+            raise ValueError('Other sliders are derived from the slider {}'.format(key))
+
+        self.__value_rules.pop(key, None)
+        self.__range_rules.pop(key, None)
+        self.__update_order()
+        return super(DerivedSliderGroup, self).removeSlider(key)
+
+    def setValues(self, values: dict):
+        """Set the values of multiple sliders and propagate the changes once
+
+        :param values: dict of key -> new value
+        """
+
+        self.__propagating = True
+        try:
+            super(DerivedSliderGroup, self).setValues(values)
+        finally:
+            self.__propagating = False
+        self.__propagate(set(values.keys()))
+
+    def _restore_slider_states(self, states: dict):
+        """Restore the slider states and propagate once afterwards
+
+        :param states: dict of key (str) -> saved slider state
+        """
+
+        self.__propagating = True
+        try:
+            super(DerivedSliderGroup, self)._restore_slider_states(states)
+        finally:
+            self.__propagating = False
+        self.__propagate(set(self.getKeys()))
+
+    def _on_slider_value_changed(self, key, value):
+        """Record a changed slider value and propagate the change to the derived sliders
+
+        :param key: key of the slider
+        :param value: new value of the slider
+        """
+
+        super(DerivedSliderGroup, self)._on_slider_value_changed(key, value)
+        if not self.__propagating:
+            self.__propagate({key})
+
+    def __set_rule(self, rules: dict, key, fn, sources):
+        """Add a rule, check the graph for cycles and compute the derived slider
+
+        :param rules: value or range rules
+        :param key: key of the derived slider
+        :param fn: function computing the derived property
+        :param sources: keys of the source sliders
+        """
+
+        sources = tuple(sources)
+        for source in (key,) + sources:
+            self.getSlider(source)
+
+        old_rule = rules.get(key)
+        rules[key] = (fn, sources)
+        try:
+            self.__update_order()
+        except ValueError:
+            # Restore the previous graph
+            if old_rule is None:
+                del rules[key]
+            else:
+                rules[key] = old_rule
+            self.__update_order()
+            raise
+
+        self.__propagate({key}, include_changed=True)
+
+    def __update_order(self):
+        """Compute the evaluation order and the dependents of every source"""
+
+        predecessors = {}
+        for rules in (self.__range_rules, self.__value_rules):
+            for key, (fn, sources) in rules.items():
+                predecessors.setdefault(key, set()).update(sources)
+
+        try:
+            order = list(TopologicalSorter(predecessors).static_order())
+        except CycleError as error:
+            raise ValueError('Cyclic slider dependency: {}'.format(' -> '.join(map(str, error.args[1]))))
+
+        dependents = {}
+        for key, sources in predecessors.items():
+            for source in sources:
+                dependents.setdefault(source, set()).add(key)
+
+        self.__order = order
+        self.__dependents = dependents
+
+    def __propagate(self, changed: set, include_changed: bool = False):
+        """Recompute all sliders depending on the changed sliders in topological order.
+        Ranges and values are set with signals blocked, afterwards every slider whose value
+        changed emits valueChanged once
+
+        :param changed: keys of the changed sliders
+        :param include_changed: whether the changed sliders have to be recomputed themselves
+        """
+
+        # Collect all sliders downstream of the changed sliders
+        affected = set(changed) if include_changed else set()
+        stack = list(changed)
+        while len(stack) > 0:
+            for dependent in self.__dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+
+        if len(affected) == 0:
+            return
+
+        old_values = {}
+        self.__propagating = True
+        try:
+            for key in self.__order:
+                if key not in affected:
+                    continue
+
+                slider = self.getSlider(key)
+                old_values[key] = slider.getValue()
+
+                signals_blocked = slider.blockSignals(True)
+                try:
+                    if key in self.__range_rules:
+                        minimum, maximum = self.__evaluate(self.__range_rules[key])
+                        if (minimum, maximum) != slider.getRange():
+                            slider.setRange(minimum, maximum)
+                    if key in self.__value_rules:
+                        slider.setValue(self.__evaluate(self.__value_rules[key]))
+                finally:
+                    slider.blockSignals(signals_blocked)
+
+            # Emit once per slider whose value has changed
+            for key, old_value in old_values.items():
+                slider = self.getSlider(key)
+                if slider.getValue() != old_value:
+                    slider.valueChanged.emit(slider.getValue())
+        finally:
+            self.__propagating = False
+
+    def __evaluate(self, rule: tuple):
+        """Evaluate a rule with the current values of its sources
+
+        :param rule: (function, source keys)
+        :return: result of the function
+        """
+
+        fn, sources = rule
+        return fn(*[self.getSlider(source).getValue() for source in sources])
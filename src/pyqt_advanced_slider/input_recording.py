@@ -0,0 +1,227 @@
+import json
+import time
+from qtpy.QtCore import QObject, QEvent, QPoint, QPointF, Qt, QCoreApplication
+from qtpy.QtGui import QMouseEvent, QWheelEvent, QKeyEvent
+
+
+class InputRecorder(QObject):
+
+    # Recorded event types by Qt event type
+    EVENT_TYPES = {
+        QEvent.Type.MouseButtonPress: 'mousePress',
+        QEvent.Type.MouseButtonRelease: 'mouseRelease',
+        QEvent.Type.MouseMove: 'mouseMove',
+        QEvent.Type.Wheel: 'wheel',
+        QEvent.Type.KeyPress: 'keyPress',
+        QEvent.Type.KeyRelease: 'keyRelease'
+    }
+
+    def __init__(self, widget, parent=None):
+        """Create a new InputRecorder instance that records the mouse, wheel and key events
+        a widget (e.g. a Slider) receives together with their timing
+
+        :param widget: widget whose input is recorded
+        :param parent: the parent object
+        """
+
+        super(InputRecorder, self).__init__(parent)
+
+        self.__widget = widget
+        self.__events = []
+        self.__start_time = None
+
+    def start(self):
+        """Start recording (previously recorded events are removed)"""
+
+        self.__events = []
+        self.__start_time = time.perf_counter()
+        self.__widget.installEventFilter(self)
+
+    def stop(self):
+        """Stop recording"""
+
+        self.__widget.removeEventFilter(self)
+        self.__start_time = None
+
+    def isRecording(self) -> bool:
+        """Get whether events are being recorded
+
+        :return: whether events are being recorded
+        """
+
+        return self.__start_time is not None
+
+    def getEvents(self) -> list[dict]:
+        """Get the recorded events (time in seconds since the start of the recording)
+
+        :return: recorded events
+        """
+
+        return list(self.__events)
+
+    def save(self, path: str):
+        """Save the recorded events into a JSON file
+
+        :param path: path of the file
+        """
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.__events, file)
+
+    @staticmethod
+    def load(path: str) -> list[dict]:
+        """Load events saved with save()
+
+        :param path: path of the file
+        :return: recorded events
+        """
+
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def eventFilter(self, watched, event) -> bool:
+        """Record the input events of the widget (events are not consumed)
+
+        :param watched: watched object
+        :param event: event sent by PyQt
+        :return: False to pass the event on to the widget
+        """
+
+        event_type = InputRecorder.EVENT_TYPES.get(event.type())
+        if event_type is None or watched is not self.__widget:
+            return False
+
+        recorded = {'time': time.perf_counter() - self.__start_time, 'type': event_type,
+                    'modifiers': InputRecorder.__to_int(event.modifiers())}
+
+        if event_type == 'wheel':
+            position = event.position() if hasattr(event, 'position') else event.posF()
+            recorded.update(x=position.x(), y=position.y(),
+                            angle_delta=[event.angleDelta().x(), event.angleDelta().y()],
+                            pixel_delta=[event.pixelDelta().x(), event.pixelDelta().y()],
+                            buttons=InputRecorder.__to_int(event.buttons()))
+        elif event_type.startswith('key'):
+            recorded.update(key=event.key(), text=event.text(), auto_repeat=event.isAutoRepeat())
+        else:
+            recorded.update(x=event.pos().x(), y=event.pos().y(),
+                            button=InputRecorder.__to_int(event.button()),
+                            buttons=InputRecorder.__to_int(event.buttons()))
+
+        self.__events.append(recorded)
+        return False
+
+    @staticmethod
+    def __to_int(flag) -> int:
+        """Convert a Qt enum or flag into an int (PyQt6 enums are not ints)
+
+        :param flag: Qt enum or flag
+        :return: int value
+        """
+
+        return int(getattr(flag, 'value', flag))
+
+
+class InputReplayer(QObject):
+
+    def __init__(self, widget, parent=None):
+        """Create a new InputReplayer instance that re-injects recorded events into a widget
+        and measures paints, valueChanged emissions and handler times
+
+        :param widget: widget (e.g. a Slider) the events are sent to
+        :param parent: the parent object
+        """
+
+        super(InputReplayer, self).__init__(parent)
+
+        self.__widget = widget
+        self.__paint_count = 0
+
+    def replay(self, events: list[dict], speed: float = 1.0) -> dict:
+        """Replay events with their original timing divided by speed (0 = as fast as possible).
+        Pending events (e.g. paints) are processed after every injected event
+
+        :param events: events recorded with an InputRecorder
+        :param speed: replay speed (1 = original speed)
+        :return: dict with the amount of events, paints and emissions,
+            the total duration and the mean and maximum handler time in seconds
+        """
+
+        application = QCoreApplication.instance()
+        emissions = []
+        connection = None
+        if hasattr(self.__widget, 'valueChanged'):
+            connection = self.__widget.valueChanged.connect(emissions.append)
+
+        self.__paint_count = 0
+        self.__widget.installEventFilter(self)
+
+        handler_times = []
+        start_time = time.perf_counter()
+        try:
+            for recorded in events:
+                # Wait for the time of the event
+                if speed > 0:
+                    target_time = start_time + recorded['time'] / speed
+                    while time.perf_counter() < target_time:
+                        application.processEvents()
+                        time.sleep(min(0.001, max(0.0, target_time - time.perf_counter())))
+
+                event = self.createEvent(recorded)
+                handler_start_time = time.perf_counter()
+                application.sendEvent(self.__widget, event)
+                handler_times.append(time.perf_counter() - handler_start_time)
+                application.processEvents()
+        finally:
+            self.__widget.removeEventFilter(self)
+            if connection is not None:
+                self.__widget.valueChanged.disconnect(connection)
+
+        return {
+            'events': len(events),
+            'paints': self.__paint_count,
+            'emissions': len(emissions),
+            'duration': time.perf_counter() - start_time,
+            'handler_time_mean': sum(handler_times) / len(handler_times) if len(handler_times) > 0 else 0.0,
+            'handler_time_max': max(handler_times, default=0.0)
+        }
+
+    @staticmethod
+    def createEvent(recorded: dict) -> QEvent:
+        """Create a Qt event from a recorded event
+
+        :param recorded: recorded event
+        :return: mouse, wheel or key event
+        """
+
+        event_type = recorded['type']
+        modifiers = Qt.KeyboardModifier(recorded['modifiers'])
+
+        if event_type == 'wheel':
+            position = QPointF(recorded['x'], recorded['y'])
+            return QWheelEvent(position, position, QPoint(*recorded['pixel_delta']), QPoint(*recorded['angle_delta']),
+                               Qt.MouseButton(recorded['buttons']), modifiers, Qt.ScrollPhase.NoScrollPhase, False)
+
+        if event_type.startswith('key'):
+            key_event_type = QEvent.Type.KeyPress if event_type == 'keyPress' else QEvent.Type.KeyRelease
+            return QKeyEvent(key_event_type, recorded['key'], modifiers, recorded['text'], recorded['auto_repeat'])
+
+        mouse_event_types = {
+            'mousePress': QEvent.Type.MouseButtonPress,
+            'mouseRelease': QEvent.Type.MouseButtonRelease,
+            'mouseMove': QEvent.Type.MouseMove
+        }
+        position = QPointF(recorded['x'], recorded['y'])
+        return QMouseEvent(mouse_event_types[event_type], position, position, Qt.MouseButton(recorded['button']),
+                           Qt.MouseButton(recorded['buttons']), modifiers)
+
+    def eventFilter(self, watched, event) -> bool:
+        """Count the paint events of the widget
+
+        :param watched: watched object
+        :param event: event sent by PyQt
+        :return: False to pass the event on to the widget
+        """
+
+        if watched is self.__widget and event.type() == QEvent.Type.Paint:
+            self.__paint_count += 1
+        return False
@@ -0,0 +1,220 @@
+import json
+import math
+
+
+class LatencyHistogram:
+
+    # Bucket i holds durations from MINIMUM * GROWTH^i up to MINIMUM * GROWTH^(i + 1) seconds
+    # (1 µs up to ~100 s with ~19 % resolution, shorter and longer durations go into the first and last bucket)
+    MINIMUM = 1e-6
+    GROWTH = 2 ** 0.25
+    BUCKET_COUNT = 108
+
+    def __init__(self):
+        """Create a new LatencyHistogram instance with logarithmic buckets (constant memory)"""
+
+        self.__counts = [0] * LatencyHistogram.BUCKET_COUNT
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def add(self, duration: float):
+        """Add a duration (O(1))
+
+        :param duration: duration in seconds
+        """
+
+        if duration > LatencyHistogram.MINIMUM:
+            index = int(math.log(duration / LatencyHistogram.MINIMUM, LatencyHistogram.GROWTH))
+            self.__counts[min(index, LatencyHistogram.BUCKET_COUNT - 1)] += 1
+        else:
+            self.__counts[0] += 1
+
+        self.__count += 1
+        self.__total += duration
+        if duration > self.__max:
+            self.__max = duration
+
+    def count(self) -> int:
+        """Get the amount of added durations
+
+        :return: amount of durations
+        """
+
+        return self.__count
+
+    def percentile(self, percentile: float) -> float:
+        """Get the upper bound of the bucket containing a percentile (limited to the maximum duration)
+
+        :param percentile: percentile between 0 and 100
+        :return: duration in seconds (0 if empty)
+        """
+
+        if self.__count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.__count * percentile / 100))
+        cumulative = 0
+        for index, count in enumerate(self.__counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(self.__get_upper_bound(index), self.__max)
+        return self.__max
+
+    def reset(self):
+        """Remove all durations"""
+
+        self.__init__()
+
+    def toDict(self) -> dict:
+        """Get the statistics of the histogram
+
+        :return: dict with count, mean, max, p50, p95, p99 (in seconds)
+            and the non-empty buckets as [upper bound, count] pairs
+        """
+
+        return {
+            'count': self.__count,
+            'mean': self.__total / self.__count if self.__count > 0 else 0.0,
+            'max': self.__max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'buckets': [[self.__get_upper_bound(index), count] for index, count in enumerate(self.__counts)
+                        if count > 0]
+        }
+
+    def __get_upper_bound(self, index: int) -> float:
+        """Get the upper bound of a bucket (the last bucket is bound by the maximum duration)
+
+        :param index: index of the bucket
+        :return: upper bound in seconds
+        """
+
+        if index == LatencyHistogram.BUCKET_COUNT - 1:
+            return self.__max
+        return LatencyHistogram.MINIMUM * LatencyHistogram.GROWTH ** (index + 1)
+
+
+class LatencyTracer:
+
+    def __init__(self):
+        """Create a new LatencyTracer instance measuring the input-to-paint latency of sliders
+        (time from the start of an input handler until the end of the first paint reflecting the input)
+        and the time spent in their downstream valueChanged handlers, per slider and for all sliders together"""
+
+        self.__sliders = {}
+        self.__latencies = {}
+        self.__handler_times = {}
+        self.__global_latency = LatencyHistogram()
+        self.__global_handler_time = LatencyHistogram()
+
+    def addSlider(self, key, slider):
+        """Trace the latency of a slider
+
+        :param key: key the statistics of the slider are stored with
+        :param slider: slider to trace
+        """
+
+        if key in self.__sliders:
+            raise KeyError('Slider with key {} already exists'.format(key))
+
+        self.__sliders[key] = slider
+        self.__latencies[key] = LatencyHistogram()
+        self.__handler_times[key] = LatencyHistogram()
+        slider.setLatencyTracer(self, key)
+
+    def addGroup(self, group):
+        """Trace the latency of all sliders of a group (the keys of the group are used)
+
+        :param group: SliderGroup to trace
+        """
+
+        for key in group.getKeys():
+            self.addSlider(key, group.getSlider(key))
+
+    def removeSlider(self, key):
+        """Stop tracing a slider (its statistics are removed)
+
+        :param key: key of the slider
+        """
+
+        self.__sliders.pop(key).setLatencyTracer(None)
+        del self.__latencies[key]
+        del self.__handler_times[key]
+
+    def getKeys(self) -> list:
+        """Get the keys of all traced sliders
+
+        :return: keys
+        """
+
+        return list(self.__sliders.keys())
+
+    def addLatency(self, key, latency: float):
+        """Record the input-to-paint latency of a slider (called by the slider)
+
+        :param key: key of the slider
+        :param latency: latency in seconds
+        """
+
+        self.__latencies[key].add(latency)
+        self.__global_latency.add(latency)
+
+    def addHandlerTime(self, key, duration: float):
+        """Record the time spent in the valueChanged handlers of a slider (called by the slider)
+
+        :param key: key of the slider
+        :param duration: duration in seconds
+        """
+
+        self.__handler_times[key].add(duration)
+        self.__global_handler_time.add(duration)
+
+    def getLatency(self, key=None) -> dict:
+        """Get the input-to-paint latency statistics (see LatencyHistogram.toDict())
+
+        :param key: key of the slider (None = all sliders)
+        :return: latency statistics
+        """
+
+        return (self.__global_latency if key is None else self.__latencies[key]).toDict()
+
+    def getHandlerTime(self, key=None) -> dict:
+        """Get the statistics of the time spent in valueChanged handlers (see LatencyHistogram.toDict())
+
+        :param key: key of the slider (None = all sliders)
+        :return: handler time statistics
+        """
+
+        return (self.__global_handler_time if key is None else self.__handler_times[key]).toDict()
+
+    def reset(self):
+        """Reset the statistics of all sliders"""
+
+        for histogram in (*self.__latencies.values(), *self.__handler_times.values()):
+            histogram.reset()
+        self.__global_latency.reset()
+        self.__global_handler_time.reset()
+
+    def toDict(self) -> dict:
+        """Get all statistics
+
+        :return: dict with the global latency and handler time statistics and those of every slider (by key as str)
+        """
+
+        return {
+            'latency': self.getLatency(),
+            'handler_time': self.getHandlerTime(),
+            'sliders': {str(key): {'latency': self.getLatency(key), 'handler_time': self.getHandlerTime(key)}
+                        for key in self.__sliders}
+        }
+
+    def dump(self, path: str):
+        """Write all statistics into a JSON file
+
+        :param path: path of the file
+        """
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.toDict(), file, indent=1)
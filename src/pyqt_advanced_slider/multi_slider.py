@@ -0,0 +1,556 @@
+from bisect import bisect_left, insort
+from qtpy.QtCore import Signal, Qt, QRect, QTimer
+from qtpy.QtGui import QPainter, QPen, QBrush, QColor, QFontMetrics
+from .advanced_slider import Slider
+from .slider_state import SliderState
+
+
+class MultiSlider(Slider):
+
+    # Signal (dict: handle index -> value) emitted once per event loop iteration with all changed handles
+    valuesChanged = Signal(object)
+
+    # Width of the handles in px
+    HANDLE_WIDTH = 3
+
+    def __init__(self, parent=None):
+        """Create a new MultiSlider instance (slider with any amount of handles on one track)
+
+        :param parent: the parent widget
+        """
+
+        super(MultiSlider, self).__init__(parent)
+
+        # Sorted handle values (handles can't pass each other, so indices stay stable)
+        self.__values = []
+
+        # Handle positions in px (sorted like the values, recomputed when width or range changes)
+        self.__positions = []
+        self.__positions_key = None
+
+        # Handle that is being dragged and handle moved by keyboard and mouse wheel input
+        self.__dragged_handle = None
+        self.__active_handle = None
+
+        # Span of the value text drawn last (needed to erase it on partial repaints)
+        self.__text_span = None
+
+        # Changed handles that have not been emitted yet and whether their emission is scheduled
+        self.__pending_changes = {}
+        self.__emission_scheduled = False
+
+    def mousePressEvent(self, event):
+        """Event that happens every time a mouse button gets pressed on this widget.
+        If the left mouse button is being pressed, the nearest handle gets moved
+
+        :param event: event sent by PyQt
+        """
+
+        input_time = self._get_trace_time()
+
+        if event.button() == Qt.MouseButton.LeftButton and len(self.__values) > 0:
+            self.__dragged_handle = self.getNearestHandle(event.pos().x())
+            self.setActiveHandle(self.__dragged_handle)
+            value_changed = self.__move_handle(self.__dragged_handle, self._get_value_from_position_x(event.pos().x()))
+            self._record_input(value_changed, input_time)
+
+    def mouseReleaseEvent(self, event):
+        """Event that happens every time a mouse button gets released on this widget.
+        If the left mouse button is being released, the dragged handle gets moved one last time
+
+        :param event: event sent by PyQt
+        """
+
+        if event.button() == Qt.MouseButton.LeftButton and self.__dragged_handle is not None:
+            value_changed = self.__move_handle(self.__dragged_handle, self._get_value_from_position_x(event.pos().x()))
+            self.__dragged_handle = None
+            self._record_input(value_changed)
+
+    def mouseMoveEvent(self, event):
+        """Event that happens every time the mouse gets moved on this widget.
+        If the left mouse is being dragged, the dragged handle gets moved
+
+        :param event: event sent by PyQt
+        """
+
+        input_time = self._get_trace_time()
+
+        if self.__dragged_handle is not None:
+            value_changed = self.__move_handle(self.__dragged_handle, self._get_value_from_position_x(event.pos().x()))
+            self._record_input(value_changed, input_time)
+
+    def wheelEvent(self, event):
+        """Event that happens every time the mouse wheel is scrolled on this widget.
+        Scrolling moves the active handle by the single step
+
+        :param event: event sent by PyQt
+        """
+
+        # Check if mouse wheel input is enabled
+        if not self.isMouseWheelInputEnabled():
+            return
+
+        input_time = self._get_trace_time()
+        direction = 1 if event.angleDelta().y() > 0 else -1
+        value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, direction)
+        self._record_input(value_changed, input_time)
+
+    def keyPressEvent(self, event):
+        """Event that happens every time a key is pressed on this widget.
+        Keys move the active handle like they move the value of a Slider
+
+        :param event: event sent by PyQt
+        """
+
+        # Check if keyboard input is enabled
+        if not self.isKeyboardInputEnabled() or self.__active_handle is None:
+            return
+
+        input_time = self._get_trace_time()
+
+        # Home key
+        if event.key() == Qt.Key.Key_Home:
+            value_changed = self.__move_handle(self.__active_handle, self.getMinimum())
+
+        # End key
+        elif event.key() == Qt.Key.Key_End:
+            value_changed = self.__move_handle(self.__active_handle, self.getMaximum())
+
+        # Arrow key (up or right)
+        elif event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Up:
+            value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, 1)
+
+        # Arrow key (down or left)
+        elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Down:
+            value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, -1)
+
+        # PageUp key
+        elif event.key() == Qt.Key.Key_PageUp:
+            value_changed = self.__step_active_handle(self.getPageStep(), 0.05, 1, page=True)
+
+        # PageDown key
+        elif event.key() == Qt.Key.Key_PageDown:
+            value_changed = self.__step_active_handle(self.getPageStep(), 0.05, -1, page=True)
+
+        # Other keys are not handled by the slider
+        else:
+            return
+
+        self._record_input(value_changed, input_time)
+
+    def getValue(self) -> list[int | float]:
+        """Get the values of all handles
+
+        :return: sorted handle values
+        """
+
+        return [self._round_cast_value(value) for value in self.__values]
+
+    def setValue(self, value):
+        """Set the values of all handles
+
+        :param value: new handle values
+        """
+
+        self.setHandleValues(value)
+
+    def getValueFormatted(self) -> str:
+        """Get the formatted value of the active handle
+
+        :return: formatted value string (empty if there is no active handle)
+        """
+
+        if self.__active_handle is None:
+            return ''
+        return self._format_value_string(self.__values[self.__active_handle])
+
+    def getValuePosition(self) -> list[int]:
+        """Get the positions of all handles in px
+
+        :return: handle positions
+        """
+
+        return list(self.__get_positions())
+
+    def getHandleCount(self) -> int:
+        """Get the amount of handles
+
+        :return: amount of handles
+        """
+
+        return len(self.__values)
+
+    def getHandleValues(self) -> list[int | float]:
+        """Get the values of all handles
+
+        :return: sorted handle values
+        """
+
+        return self.getValue()
+
+    def setHandleValues(self, values):
+        """Replace all handles (values are sorted, the active handle is reset)
+
+        :param values: handle values
+        """
+
+        old_count = len(self.__values)
+        self.__values = sorted(self._clamp_value(value) for value in values)
+        self.__positions_key = None
+        self.__active_handle = None
+        self.__dragged_handle = None
+
+        # Every handle index that exists before or after has changed
+        for index in range(max(old_count, len(self.__values))):
+            self.__pending_changes[index] = self.__get_rounded_value(index)
+        self.__schedule_changes()
+        self._request_repaint()
+
+    def getHandleValue(self, index: int) -> int | float:
+        """Get the value of a handle
+
+        :param index: handle index
+        :return: handle value
+        """
+
+        return self._round_cast_value(self.__values[index])
+
+    def setHandleValue(self, index: int, value: int | float):
+        """Set the value of a handle (clamped between its neighbors)
+
+        :param index: handle index
+        :param value: new handle value
+        """
+
+        self.__move_handle(index, value)
+
+    def setHandleValuesBatch(self, values: dict):
+        """Set the values of multiple handles (emitted as one change notification).
+        Handles moving down are moved first from the lowest index up, then handles moving up
+        from the highest index down, so no handle gets blocked by a neighbor that moves out of its way
+
+        :param values: dict of handle index -> new value
+        """
+
+        moving_down = sorted(index for index, value in values.items()
+                             if self._clamp_value(value) < self.__values[index])
+        moving_up = sorted((index for index in values if index not in moving_down), reverse=True)
+        for index in moving_down + moving_up:
+            self.__move_handle(index, values[index])
+
+    def addHandle(self, value: int | float) -> int:
+        """Add a handle
+
+        :param value: value of the new handle
+        :return: index of the new handle
+        """
+
+        value = self._clamp_value(value)
+        index = bisect_left(self.__values, value)
+        insort(self.__values, value)
+        if self.__positions_key is not None:
+            self.__positions.insert(index, self._get_position_x_from_value(value))
+        if self.__active_handle is not None and self.__active_handle >= index:
+            self.__active_handle += 1
+
+        # Handles from the new index on have shifted
+        for changed_index in range(index, len(self.__values)):
+            self.__pending_changes[changed_index] = self.__get_rounded_value(changed_index)
+        self.__schedule_changes()
+        self._request_repaint()
+        return index
+
+    def removeHandle(self, index: int):
+        """Remove a handle
+
+        :param index: handle index
+        """
+
+        del self.__values[index]
+        if self.__positions_key is not None:
+            del self.__positions[index]
+        if self.__active_handle is not None:
+            if self.__active_handle == index:
+                self.__active_handle = None
+            elif self.__active_handle > index:
+                self.__active_handle -= 1
+        self.__dragged_handle = None
+
+        # Handles from the removed index on have shifted (None = removed)
+        for changed_index in range(index, len(self.__values) + 1):
+            self.__pending_changes[changed_index] = self.__get_rounded_value(changed_index)
+        self.__schedule_changes()
+        self._request_repaint()
+
+    def getActiveHandle(self) -> int | None:
+        """Get the handle moved by keyboard and mouse wheel input (its value is shown)
+
+        :return: handle index or None
+        """
+
+        return self.__active_handle
+
+    def setActiveHandle(self, index: int | None):
+        """Set the handle moved by keyboard and mouse wheel input (its value is shown)
+
+        :param index: handle index or None
+        """
+
+        if index == self.__active_handle:
+            return
+
+        old_index = self.__active_handle
+        self.__active_handle = index
+
+        # Old and new value text have to be redrawn
+        if old_index is not None and old_index < len(self.__values):
+            self.__request_handle_repaint(old_index, self.__get_positions()[old_index])
+        if index is not None:
+            self.__request_handle_repaint(index, self.__get_positions()[index])
+
+    def getNearestHandle(self, position_x: int) -> int | None:
+        """Get the handle nearest to a position (O(log n) bisection on the sorted positions)
+
+        :param position_x: position on the x-axis in px
+        :return: handle index or None if there are no handles
+        """
+
+        positions = self.__get_positions()
+        if len(positions) == 0:
+            return None
+
+        index = bisect_left(positions, position_x)
+        if index <= 0:
+            return 0
+        if index >= len(positions):
+            return len(positions) - 1
+
+        # Handles on the same position: pick the one that can move towards the position
+        if position_x - positions[index - 1] <= positions[index] - position_x:
+            index -= 1
+            while index > 0 and positions[index - 1] == positions[index] and position_x < positions[index]:
+                index -= 1
+            return index
+        while (index < len(positions) - 1 and positions[index + 1] == positions[index]
+               and position_x > positions[index]):
+            index += 1
+        return index
+
+    def saveState(self) -> bytes:
+        """Save the settings and the values of all handles into a compact binary state
+
+        :return: state that can be restored with restoreState()
+        """
+
+        fields = SliderState.unpack(super(MultiSlider, self).saveState())
+        fields['handles'] = list(self.__values)
+        return SliderState.pack(fields)
+
+    def restoreState(self, state: bytes):
+        """Restore a state saved with saveState() (the changes are emitted as one notification)
+
+        :param state: saved state
+        """
+
+        handles = SliderState.unpack(state)['handles']
+        if handles is None:
+            raise ValueError('Invalid multi slider state: expected handle values')
+
+        super(MultiSlider, self).restoreState(state)
+        self.setHandleValues(handles)
+
+    def _on_range_changed(self):
+        """Clamp all handles into the new range"""
+
+        for index, value in enumerate(self.__values):
+            clamped_value = self._clamp_value(value)
+            if clamped_value != value:
+                self.__values[index] = clamped_value
+                self.__pending_changes[index] = self.__get_rounded_value(index)
+        self.__positions_key = None
+        self.__schedule_changes()
+        self._request_repaint()
+
+    def _draw_value_rect(self, painter: QPainter):
+        """Draw the handles (only the ones inside the clip rect on partial repaints)
+
+        :param painter: painter of the canvas
+        """
+
+        positions = self.__get_positions()
+        if len(positions) == 0:
+            return
+
+        painter.setPen(QPen(self.getAccentColor()))
+        painter.setBrush(QBrush(QColor(self.getAccentColor()), Qt.BrushStyle.SolidPattern))
+
+        # Find the handles inside the dirty span by bisection
+        first, last = 0, len(positions)
+        if painter.hasClipping():
+            clip_rect = painter.clipBoundingRect()
+            first = bisect_left(positions, int(clip_rect.left()) - MultiSlider.HANDLE_WIDTH)
+            last = bisect_left(positions, int(clip_rect.right()) + MultiSlider.HANDLE_WIDTH + 1)
+
+        for index in range(first, last):
+            painter.drawRect(self.__get_handle_rect(positions[index]))
+
+    def _draw_value_text(self, painter: QPainter):
+        """Draw the formatted value of the active handle next to it
+
+        :param painter: painter of the canvas
+        """
+
+        if self.__active_handle is None:
+            self.__text_span = None
+            return
+
+        text = self.getValueFormatted()
+        text_x, text_width = self.__get_text_layout(self.__active_handle, text)
+        metrics = QFontMetrics(self.getFont())
+        text_height = metrics.tightBoundingRect(text).height()
+        text_y = int(self.height() - ((self.height() - text_height) / 2))
+
+        painter.setPen(QPen(self.getTextColor()))
+        painter.drawText(text_x, text_y, text)
+        self.__text_span = (text_x, text_x + text_width)
+
+    def __move_handle(self, index: int, value: int | float) -> bool:
+        """Move a handle without letting it pass its neighbors and repaint only the affected span
+
+        :param index: handle index
+        :param value: new value of the handle
+        :return: whether the value of the handle has changed
+        """
+
+        value = self._clamp_value(value)
+        if index > 0:
+            value = max(value, self.__values[index - 1])
+        if index < len(self.__values) - 1:
+            value = min(value, self.__values[index + 1])
+
+        if value == self.__values[index]:
+            return False
+
+        positions = self.__get_positions()
+        old_position_x = positions[index]
+        old_rounded_value = self.__get_rounded_value(index)
+
+        self.__values[index] = value
+        positions[index] = self._get_position_x_from_value(value)
+
+        self.__request_handle_repaint(index, old_position_x)
+        if self.__get_rounded_value(index) != old_rounded_value:
+            self.__pending_changes[index] = self.__get_rounded_value(index)
+            self.__schedule_changes()
+        return True
+
+    def __step_active_handle(self, step: int | float, default_step: float, direction: int,
+                             page: bool = False) -> bool:
+        """Step the active handle in a direction
+
+        :param step: custom step (0 = use default step)
+        :param default_step: fraction of the range used as default step
+        :param direction: 1 to increment, -1 to decrement
+        :param page: whether the step is a page step
+        :return: whether the value of the handle has changed
+        """
+
+        if self.__active_handle is None:
+            return False
+
+        value = self.__values[self.__active_handle]
+        return self.__move_handle(self.__active_handle,
+                                  self._get_stepped_value(value, step, default_step, direction, page))
+
+    def __request_handle_repaint(self, index: int, old_position_x: int):
+        """Repaint the span covering the old and new handle and value text
+
+        :param index: handle index
+        :param old_position_x: position of the handle before it changed
+        """
+
+        new_position_x = self.__get_positions()[index]
+        start = min(old_position_x, new_position_x) - MultiSlider.HANDLE_WIDTH
+        end = max(old_position_x, new_position_x) + MultiSlider.HANDLE_WIDTH
+
+        # Value text of the active handle (previously drawn and new one)
+        if self.__text_span is not None:
+            start = min(start, self.__text_span[0] - 1)
+            end = max(end, self.__text_span[1] + 1)
+        if index == self.__active_handle and self.isShowingValue():
+            text_x, text_width = self.__get_text_layout(index, self.getValueFormatted())
+            start = min(start, text_x - 1)
+            end = max(end, text_x + text_width + 1)
+
+        self._request_partial_repaint(start, end)
+
+    def __get_text_layout(self, index: int, text: str) -> tuple[int, int]:
+        """Get the position and width of the value text of a handle
+
+        :param index: handle index
+        :param text: value text
+        :return: x position and width of the text
+        """
+
+        text_width = QFontMetrics(self.getFont()).horizontalAdvance(text)
+        text_margin = 5
+
+        text_x = self.__get_positions()[index] + text_margin
+        if text_x + text_width >= self.width() - text_margin:
+            text_x = self.width() - text_width - text_margin
+        return max(1, int(text_x)), text_width
+
+    def __get_handle_rect(self, position_x: int) -> QRect:
+        """Get the rect of a handle
+
+        :param position_x: position of the handle
+        :return: handle rect
+        """
+
+        position_x = min(max(position_x, 1), self.width() - MultiSlider.HANDLE_WIDTH)
+        return QRect(position_x - MultiSlider.HANDLE_WIDTH // 2, 1, MultiSlider.HANDLE_WIDTH - 1,
+                     self.height() - 3)
+
+    def __get_positions(self) -> list[int]:
+        """Get the positions of all handles (recomputed when the width or the range changed)
+
+        :return: handle positions
+        """
+
+        key = (self.width(), self.getMinimum(), self.getMaximum(), self.getScale())
+        if self.__positions_key != key:
+            self.__positions = [self._get_position_x_from_value(value) for value in self.__values]
+            self.__positions_key = key
+        return self.__positions
+
+    def __get_rounded_value(self, index: int) -> int | float | None:
+        """Get the rounded value of a handle
+
+        :param index: handle index
+        :return: rounded value or None if the handle does not exist
+        """
+
+        if index >= len(self.__values):
+            return None
+        return self._round_cast_value(self.__values[index])
+
+    def __schedule_changes(self):
+        """Emit the pending changes once control returns to the event loop"""
+
+        if len(self.__pending_changes) > 0 and not self.__emission_scheduled:
+            self.__emission_scheduled = True
+            QTimer.singleShot(0, self.__emit_changes)
+
+    def __emit_changes(self):
+        """Emit all pending changes with one signal"""
+
+        self.__emission_scheduled = False
+        if len(self.__pending_changes) == 0:
+            return
+
+        changes = self.__pending_changes
+        self.__pending_changes = {}
+        start_time = self._get_trace_time()
+        self.valuesChanged.emit(changes)
+        self.valueChanged.emit(self.getValue())
+        self._record_emission(start_time)
@@ -0,0 +1,205 @@
+import mmap
+import os
+import struct
+from .slider_group import SliderGroupObserver
+
+
+class ParameterBank:
+
+    # Header (magic bytes, format version, amount of records) and records (value, flags)
+    MAGIC = b'PQPB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sII4x')
+    RECORD = struct.Struct('<dI4x')
+
+    # Flags of a record
+    VALID_FLAG = 1
+
+    def __init__(self, path: str, record_count: int):
+        """Create a new ParameterBank instance backing sliders with a memory-mapped file.
+        Every slider gets a fixed-size record (value, flags) that is written on every value change,
+        so the values survive crashes and are loaded instantly on restart
+
+        :param path: path of the bank file (created if it does not exist)
+        :param record_count: amount of records
+        """
+
+        size = ParameterBank.HEADER.size + record_count * ParameterBank.RECORD.size
+
+        # Create or grow the file and check the header of existing files
+        mode = 'r+b' if os.path.exists(path) else 'w+b'
+        self.__file = open(path, mode)
+        try:
+            existing_size = os.fstat(self.__file.fileno()).st_size
+            if existing_size > 0:
+                magic, version, _ = ParameterBank.HEADER.unpack(self.__file.read(ParameterBank.HEADER.size))
+                if magic != ParameterBank.MAGIC or version > ParameterBank.VERSION:
+                    raise ValueError('File {} is not a parameter bank'.format(path))
+            if existing_size < size:
+                self.__file.truncate(size)
+            self.__map = mmap.mmap(self.__file.fileno(), size)
+        except Exception:
+            self.__file.close()
+            raise
+
+        ParameterBank.HEADER.pack_into(self.__map, 0, ParameterBank.MAGIC, ParameterBank.VERSION, record_count)
+        self.__record_count = record_count
+
+        # Bound sliders by record index and their valueChanged connections
+        self.__sliders = {}
+        self.__connections = {}
+
+        # Bound groups
+        self.__group_observer = SliderGroupObserver(self.__write_values)
+
+    def getRecordCount(self) -> int:
+        """Get the amount of records
+
+        :return: amount of records
+        """
+
+        return self.__record_count
+
+    def bindSlider(self, slider, index: int, restore: bool = True):
+        """Back a slider with a record. The stored value is restored (if the record holds one)
+        and every value change of the slider is written into the record (use bindGroup() for sliders of a group)
+
+        :param slider: slider to bind (with a single value, not a RangeSlider or MultiSlider)
+        :param index: record index
+        :param restore: whether the slider should be set to the stored value
+        """
+
+        self.__check_index(index)
+        SliderGroupObserver.checkSlider(slider)
+        self.unbindSlider(index)
+
+        if restore and self.isValid(index):
+            slider.setValue(self.read(index))
+        else:
+            self.write(index, slider.getValue())
+
+        self.__sliders[index] = slider
+        self.__connections[index] = slider.valueChanged.connect(lambda value: self.write(index, value))
+
+    def unbindSlider(self, index: int):
+        """Stop writing the value changes of the slider bound to a record
+
+        :param index: record index
+        """
+
+        slider = self.__sliders.pop(index, None)
+        if slider is not None:
+            slider.valueChanged.disconnect(self.__connections.pop(index))
+
+    def bindGroup(self, group, indices: dict = None, restore: bool = True) -> dict:
+        """Back all sliders of a group with records. The stored values are restored with one batch
+        and the coalesced value changes of the group are written into the records (see SliderGroupObserver)
+
+        :param group: SliderGroup to bind
+        :param indices: dict of key -> record index (default: the keys of the group in order from record 0)
+        :param restore: whether the sliders should be set to the stored values
+        :return: dict of key -> record index
+        """
+
+        if indices is None:
+            indices = {key: index for index, key in enumerate(group.getKeys())}
+        for key, index in indices.items():
+            self.__check_index(index)
+            SliderGroupObserver.checkSlider(group.getSlider(key))
+        self.unbindGroup(group)
+
+        restored_values = {}
+        for key, index in indices.items():
+            if restore and self.isValid(index):
+                restored_values[key] = self.read(index)
+            else:
+                self.write(index, group.getSlider(key).getValue())
+
+        if len(restored_values) > 0:
+            group.setValues(restored_values)
+            # Emit the restored values before binding, so they are not written again
+            group.flush()
+
+        return self.__group_observer.bind(group, indices)
+
+    def unbindGroup(self, group):
+        """Stop writing the value changes of a group bound with bindGroup()
+
+        :param group: bound group
+        """
+
+        self.__group_observer.unbind(group)
+
+    def write(self, index: int, value: int | float, flags: int = VALID_FLAG):
+        """Write a record (a single pack_into into the mapping, no system call)
+
+        :param index: record index
+        :param value: value
+        :param flags: flags of the record
+        """
+
+        ParameterBank.RECORD.pack_into(self.__map, ParameterBank.HEADER.size + index * ParameterBank.RECORD.size,
+                                       value, flags)
+
+    def read(self, index: int) -> float:
+        """Read the value of a record
+
+        :param index: record index
+        :return: value
+        """
+
+        return self.readRecord(index)[0]
+
+    def readRecord(self, index: int) -> tuple[float, int]:
+        """Read the value and the flags of a record
+
+        :param index: record index
+        :return: value and flags
+        """
+
+        self.__check_index(index)
+        return ParameterBank.RECORD.unpack_from(self.__map, ParameterBank.HEADER.size
+                                                + index * ParameterBank.RECORD.size)
+
+    def isValid(self, index: int) -> bool:
+        """Get whether a record holds a stored value
+
+        :param index: record index
+        :return: whether the record is valid
+        """
+
+        return bool(self.readRecord(index)[1] & ParameterBank.VALID_FLAG)
+
+    def flush(self):
+        """Write the mapping back to the file (not needed to survive crashes of the process,
+        only to survive crashes of the operating system)"""
+
+        self.__map.flush()
+
+    def close(self):
+        """Unbind all sliders, flush and close the bank"""
+
+        for index in list(self.__sliders.keys()):
+            self.unbindSlider(index)
+        self.__group_observer.unbindAll()
+        self.__map.flush()
+        self.__map.close()
+        self.__file.close()
+
+    def __write_values(self, values: dict):
+        """Write values into their records
+
+        :param values: dict of record index -> value
+        """
+
+        for index, value in values.items():
+            self.write(index, value)
+
+    def __check_index(self, index: int):
+        """Make sure that a record index exists
+
+        :param index: record index
+        """
+
+        if index < 0 or index >= self.__record_count:
+            raise IndexError('Record {} out of range (0 to {})'.format(index, self.__record_count - 1))
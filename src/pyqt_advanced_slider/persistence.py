@@ -0,0 +1,262 @@
+import json
+import os
+import tempfile
+from qtpy.QtCore import QObject, Signal, QTimer, QSettings, QCoreApplication
+
+
+class PersistenceBackend:
+
+    def load(self) -> dict:
+        """Load all persisted values
+
+        :return: dict of key (str) -> value
+        """
+
+        raise NotImplementedError
+
+    def store(self, values: dict):
+        """Store changed values in one bulk write
+
+        :param values: dict of key (str) -> value
+        """
+
+        raise NotImplementedError
+
+
+class SettingsBackend(PersistenceBackend):
+
+    def __init__(self, settings: QSettings = None, group: str = 'sliders'):
+        """Create a new SettingsBackend instance persisting values with QSettings
+
+        :param settings: settings to write to (default: QSettings of the application)
+        :param group: settings group the values are stored in
+        """
+
+        self.__settings = settings if settings is not None else QSettings()
+        self.__group = group
+
+    def load(self) -> dict:
+        """Load all values of the settings group"""
+
+        self.__settings.beginGroup(self.__group)
+        try:
+            return {key: self.__to_number(self.__settings.value(key)) for key in self.__settings.childKeys()}
+        finally:
+            self.__settings.endGroup()
+
+    def store(self, values: dict):
+        """Write the values into the settings group and sync once"""
+
+        self.__settings.beginGroup(self.__group)
+        try:
+            for key, value in values.items():
+                self.__settings.setValue(key, value)
+        finally:
+            self.__settings.endGroup()
+        self.__settings.sync()
+
+    @staticmethod
+    def __to_number(value):
+        """Convert a value read from the settings to a number (INI files store numbers as strings)
+
+        :param value: value read from the settings
+        :return: int or float value
+        """
+
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                return float(value)
+        return value
+
+
+class JsonFileBackend(PersistenceBackend):
+
+    def __init__(self, path: str, atomic: bool = True):
+        """Create a new JsonFileBackend instance persisting values in a JSON file
+
+        :param path: path of the JSON file
+        :param atomic: whether the file should be replaced atomically (crash-safe)
+        """
+
+        self.__path = path
+        self.__atomic = atomic
+        self.__values = None
+
+    def load(self) -> dict:
+        """Load all values of the file (empty if the file does not exist)"""
+
+        try:
+            with open(self.__path, 'r', encoding='utf-8') as file:
+                self.__values = json.load(file)
+        except FileNotFoundError:
+            self.__values = {}
+        return dict(self.__values)
+
+    def store(self, values: dict):
+        """Write all values into the file with one write"""
+
+        if self.__values is None:
+            self.load()
+        self.__values.update(values)
+        data = json.dumps(self.__values, indent=1)
+
+        if not self.__atomic:
+            with open(self.__path, 'w', encoding='utf-8') as file:
+                file.write(data)
+            return
+
+        # Write a temporary file next to the target and replace the target with it
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.__path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class SliderPersistence(QObject):
+
+    # Signals (amount of values) after a flush and (exception) if a flush failed
+    flushed = Signal(int)
+    flushFailed = Signal(object)
+
+    def __init__(self, backend: PersistenceBackend, idle_interval: int = 500, parent=None):
+        """Create a new SliderPersistence instance that persists slider values with a write-behind buffer.
+        Changes are coalesced and written in one bulk write once no value changed for the idle interval,
+        on commit() and when the application is about to quit
+
+        :param backend: backend the values are written to
+        :param idle_interval: time without changes before the values are written (in ms)
+        :param parent: the parent object
+        """
+
+        super(SliderPersistence, self).__init__(parent)
+
+        self.__backend = backend
+        self.__stored_values = backend.load()
+
+        # Changed values that have not been written yet
+        self.__pending_changes = {}
+
+        # Bound sliders and groups with their connections
+        self.__connections = []
+
+        self.__idle_timer = QTimer(self)
+        self.__idle_timer.setSingleShot(True)
+        self.__idle_timer.setInterval(idle_interval)
+        self.__idle_timer.timeout.connect(self.commit)
+
+        application = QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.commit)
+
+    def addSlider(self, key: str, slider, restore: bool = True):
+        """Persist the value of a slider
+
+        :param key: key the value is stored with
+        :param slider: slider to persist
+        :param restore: whether the slider should be set to the stored value
+        """
+
+        key = str(key)
+        if restore and key in self.__stored_values:
+            slider.setValue(self.__stored_values[key])
+
+        connection = slider.valueChanged.connect(lambda value: self.__on_values_changed({key: value}))
+        self.__connections.append((slider.valueChanged, connection))
+
+    def addGroup(self, group, restore: bool = True):
+        """Persist the values of all sliders of a group (uses the coalesced valuesChanged of the group)
+
+        :param group: SliderGroup to persist
+        :param restore: whether the sliders should be set to the stored values
+        """
+
+        if restore:
+            group.setValues({key: self.__stored_values[str(key)] for key in group.getKeys()
+                             if str(key) in self.__stored_values})
+            # Emit the restored values before connecting, so they are not written again
+            group.flush()
+
+        connection = group.valuesChanged.connect(
+            lambda values: self.__on_values_changed({str(key): value for key, value in values.items()}))
+        self.__connections.append((group.valuesChanged, connection))
+
+    def getStoredValue(self, key: str):
+        """Get the last written value of a key
+
+        :param key: key of the value
+        :return: stored value or None
+        """
+
+        return self.__stored_values.get(str(key))
+
+    def getPendingCount(self) -> int:
+        """Get the amount of changed values that have not been written yet
+
+        :return: amount of pending values
+        """
+
+        return len(self.__pending_changes)
+
+    def getIdleInterval(self) -> int:
+        """Get the time without changes before the values are written
+
+        :return: idle interval in ms
+        """
+
+        return self.__idle_timer.interval()
+
+    def setIdleInterval(self, idle_interval: int):
+        """Set the time without changes before the values are written
+
+        :param idle_interval: idle interval in ms
+        """
+
+        self.__idle_timer.setInterval(idle_interval)
+
+    def commit(self):
+        """Write all pending changes now with one bulk write"""
+
+        self.__idle_timer.stop()
+        if len(self.__pending_changes) == 0:
+            return
+
+        changes = self.__pending_changes
+        self.__pending_changes = {}
+        try:
+            self.__backend.store(changes)
+        except Exception as error:
+            # Keep the changes (newer changes win) to retry with the next flush
+            changes.update(self.__pending_changes)
+            self.__pending_changes = changes
+            self.flushFailed.emit(error)
+            return
+
+        self.__stored_values.update(changes)
+        self.flushed.emit(len(changes))
+
+    def close(self):
+        """Write the pending changes and stop persisting the bound sliders"""
+
+        self.commit()
+        for signal, connection in self.__connections:
+            signal.disconnect(connection)
+        self.__connections.clear()
+
+    def __on_values_changed(self, values: dict):
+        """Buffer changed values and restart the idle timer
+
+        :param values: changed values (key -> value)
+        """
+
+        self.__pending_changes.update(values)
+        self.__idle_timer.start()
@@ -0,0 +1,188 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from qtpy.QtCore import QObject, Signal, Slot
+
+
+class PreviewCache(QObject):
+
+    # Signal (bucket, image) emitted on the GUI thread when a preview has been produced
+    previewReady = Signal(int, object)
+
+    # Internal signal used to hand previews from the worker threads back to the GUI thread
+    _preview_done = Signal(int, int, object)
+
+    def __init__(self, provider, capacity: int = 64, prefetch: int = 2, executor=None, parent=None):
+        """Create a new PreviewCache instance (bounded LRU cache with prefetching)
+
+        :param provider: thread-safe function returning a QImage for a bucket index
+        :param capacity: maximum amount of cached previews
+        :param prefetch: amount of neighboring buckets prefetched in the drag direction
+        :param executor: concurrent.futures executor to produce previews on (optional)
+        :param parent: the parent object
+        """
+
+        super(PreviewCache, self).__init__(parent)
+
+        self.__provider = provider
+        self.__capacity = max(1, capacity)
+        self.__prefetch = max(0, prefetch)
+
+        self.__owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='slider-preview')
+        self.__executor = executor
+
+        # Bucket index -> image (most recently used last)
+        self.__cache = OrderedDict()
+
+        # Bucket index -> future of previews that are being produced
+        self.__in_flight = {}
+
+        # Valid bucket indices (inclusive)
+        self.__first_bucket = 0
+        self.__last_bucket = None
+
+        # Generation used to drop previews produced before the cache was cleared
+        self.__generation = 0
+
+        self._preview_done.connect(self.__on_preview_done)
+
+    def get(self, bucket: int):
+        """Get the cached preview of a bucket
+
+        :param bucket: bucket index
+        :return: cached image or None
+        """
+
+        image = self.__cache.get(bucket)
+        if image is not None:
+            self.__cache.move_to_end(bucket)
+        return image
+
+    def request(self, bucket: int, direction: int = 0):
+        """Request the preview of a bucket and prefetch its neighbors in the given direction.
+        Queued jobs of buckets that are no longer wanted are cancelled
+
+        :param bucket: bucket index
+        :param direction: drag direction (1 = increasing, -1 = decreasing, 0 = unknown)
+        """
+
+        wanted = [bucket]
+        if direction != 0:
+            wanted += [bucket + direction * i for i in range(1, self.__prefetch + 1)]
+        wanted = [b for b in wanted if self.__is_valid_bucket(b)]
+
+        # Cancel jobs that have not started yet and are not wanted anymore
+        for b in list(self.__in_flight):
+            if b not in wanted and self.__in_flight[b].cancel():
+                del self.__in_flight[b]
+
+        for b in wanted:
+            if b not in self.__cache and b not in self.__in_flight:
+                self.__submit(b)
+
+    def setBucketRange(self, first_bucket: int, last_bucket: int):
+        """Set the range of valid bucket indices (prefetching stops at the bounds)
+
+        :param first_bucket: first valid bucket index
+        :param last_bucket: last valid bucket index
+        """
+
+        self.__first_bucket = first_bucket
+        self.__last_bucket = last_bucket
+
+    def getCapacity(self) -> int:
+        """Get the maximum amount of cached previews
+
+        :return: capacity
+        """
+
+        return self.__capacity
+
+    def size(self) -> int:
+        """Get the amount of cached previews
+
+        :return: amount of cached previews
+        """
+
+        return len(self.__cache)
+
+    def clear(self):
+        """Drop all cached previews and cancel pending jobs"""
+
+        self.__generation += 1
+        for future in self.__in_flight.values():
+            future.cancel()
+        self.__in_flight.clear()
+        self.__cache.clear()
+
+    def shutdown(self):
+        """Clear the cache and stop the private executor"""
+
+        self.clear()
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __is_valid_bucket(self, bucket: int) -> bool:
+        """Check whether a bucket index is inside the valid range
+
+        :param bucket: bucket index
+        :return: whether the bucket is valid
+        """
+
+        if bucket < self.__first_bucket:
+            return False
+        return self.__last_bucket is None or bucket <= self.__last_bucket
+
+    def __submit(self, bucket: int):
+        """Produce the preview of a bucket on the executor
+
+        :param bucket: bucket index
+        """
+
+        generation = self.__generation
+        future = self.__executor.submit(self.__provider, bucket)
+        future.add_done_callback(lambda f: self.__on_future_done(f, generation, bucket))
+        self.__in_flight[bucket] = future
+
+    def __on_future_done(self, future, generation: int, bucket: int):
+        """Called on the worker thread when a preview has been produced
+
+        :param future: future of the job
+        :param generation: cache generation the job was submitted in
+        :param bucket: bucket index
+        """
+
+        if future.cancelled() or generation != self.__generation:
+            return
+
+        image = None if future.exception() is not None else future.result()
+        try:
+            self._preview_done.emit(generation, bucket, image)
+        except RuntimeError:
+            # Underlying QObject has already been deleted
+            pass
+
+    @Slot(int, int, object)
+    def __on_preview_done(self, generation: int, bucket: int, image):
+        """Called on the GUI thread with a produced preview
+
+        :param generation: cache generation the job was submitted in
+        :param bucket: bucket index
+        :param image: produced image (None if the provider failed)
+        """
+
+        if generation != self.__generation:
+            return
+
+        self.__in_flight.pop(bucket, None)
+        if image is None:
+            return
+
+        # Insert as most recently used and evict least recently used previews
+        self.__cache[bucket] = image
+        self.__cache.move_to_end(bucket)
+        while len(self.__cache) > self.__capacity:
+            self.__cache.popitem(last=False)
+
+        self.previewReady.emit(bucket, image)
@@ -0,0 +1,409 @@
+from qtpy.QtCore import Signal, Qt, QRect
+from qtpy.QtGui import QPainter, QPen, QBrush, QColor, QFontMetrics
+from .advanced_slider import Slider
+from .slider_state import SliderState
+
+
+class RangeSlider(Slider):
+
+    # Signal (low, high) emitted once per event in which the range changed
+    rangeChanged = Signal(object, object)
+
+    # Handles
+    LOW_HANDLE = 0
+    HIGH_HANDLE = 1
+
+    def __init__(self, parent=None):
+        """Create a new RangeSlider instance (slider with a low and a high handle)
+
+        :param parent: the parent widget
+        """
+
+        super(RangeSlider, self).__init__(parent)
+
+        # Low and high value
+        self.__low = self.getMinimum()
+        self.__high = self.getMaximum()
+
+        # Handle that is being dragged and handle moved by keyboard and mouse wheel input
+        self.__dragged_handle = None
+        self.__active_handle = RangeSlider.HIGH_HANDLE
+
+        # Last emitted values to only emit once per event if the range has changed
+        self.__low_last_emitted = self.__low
+        self.__high_last_emitted = self.__high
+
+        # Separator between low and high value in the formatted string
+        self.__range_separator = ' - '
+
+    def mousePressEvent(self, event):
+        """Event that happens every time a mouse button gets pressed on this widget.
+        If the left mouse button is being pressed, the handle nearest to the mouse gets moved
+
+        :param event: event sent by PyQt
+        """
+
+        input_time = self._get_trace_time()
+
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.__dragged_handle = self.__get_nearest_handle(event.pos().x())
+            self.__active_handle = self.__dragged_handle
+            value_changed = self.__move_handle_to_position_x(self.__dragged_handle, event.pos().x())
+            self._record_input(value_changed, input_time)
+
+    def mouseReleaseEvent(self, event):
+        """Event that happens every time a mouse button gets released on this widget.
+        If the left mouse button is being released, the dragged handle gets moved one last time
+
+        :param event: event sent by PyQt
+        """
+
+        if event.button() == Qt.MouseButton.LeftButton and self.__dragged_handle is not None:
+            value_changed = self.__move_handle_to_position_x(self.__dragged_handle, event.pos().x())
+            self.__dragged_handle = None
+            self._record_input(value_changed)
+
+    def mouseMoveEvent(self, event):
+        """Event that happens every time the mouse gets moved on this widget.
+        If the left mouse is being dragged, the dragged handle gets moved
+
+        :param event: event sent by PyQt
+        """
+
+        input_time = self._get_trace_time()
+
+        if self.__dragged_handle is not None:
+            value_changed = self.__move_handle_to_position_x(self.__dragged_handle, event.pos().x())
+            self._record_input(value_changed, input_time)
+
+    def wheelEvent(self, event):
+        """Event that happens every time the mouse wheel is scrolled on this widget.
+        Scrolling moves the active handle (last pressed handle) by the single step
+
+        :param event: event sent by PyQt
+        """
+
+        # Check if mouse wheel input is enabled
+        if not self.isMouseWheelInputEnabled():
+            return
+
+        input_time = self._get_trace_time()
+        direction = 1 if event.angleDelta().y() > 0 else -1
+        value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, direction)
+        self._record_input(value_changed, input_time)
+
+    def keyPressEvent(self, event):
+        """Event that happens every time a key is pressed on this widget.
+        Keys move the active handle (last pressed handle) like they move the value of a Slider
+
+        :param event: event sent by PyQt
+        """
+
+        # Check if keyboard input is enabled
+        if not self.isKeyboardInputEnabled():
+            return
+
+        input_time = self._get_trace_time()
+
+        # Home key
+        if event.key() == Qt.Key.Key_Home:
+            value_changed = self.__set_handle_value(self.__active_handle, self.getMinimum())
+
+        # End key
+        elif event.key() == Qt.Key.Key_End:
+            value_changed = self.__set_handle_value(self.__active_handle, self.getMaximum())
+
+        # Arrow key (up or right)
+        elif event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Up:
+            value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, 1)
+
+        # Arrow key (down or left)
+        elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Down:
+            value_changed = self.__step_active_handle(self.getSingleStep(), 0.01, -1)
+
+        # PageUp key
+        elif event.key() == Qt.Key.Key_PageUp:
+            value_changed = self.__step_active_handle(self.getPageStep(), 0.05, 1, page=True)
+
+        # PageDown key
+        elif event.key() == Qt.Key.Key_PageDown:
+            value_changed = self.__step_active_handle(self.getPageStep(), 0.05, -1, page=True)
+
+        # Other keys are not handled by the slider
+        else:
+            return
+
+        self._record_input(value_changed, input_time)
+
+    def getValue(self) -> tuple[int | float, int | float]:
+        """Get the current low and high value of the slider
+
+        :return: low and high value
+        """
+
+        return self._round_cast_value(self.__low), self._round_cast_value(self.__high)
+
+    def setValue(self, value: tuple[int | float, int | float]):
+        """Set the low and high value of the slider
+
+        :param value: new low and high value
+        """
+
+        self.setValues(value[0], value[1])
+
+    def getValues(self) -> tuple[int | float, int | float]:
+        """Get the current low and high value of the slider
+
+        :return: low and high value
+        """
+
+        return self.getValue()
+
+    def setValues(self, low: int | float, high: int | float):
+        """Set the low and high value of the slider (emits rangeChanged at most once)
+
+        :param low: new low value
+        :param high: new high value
+        """
+
+        low = self._clamp_value(low)
+        high = self._clamp_value(high)
+        if low > high:
+            low, high = high, low
+
+        self.__low = low
+        self.__high = high
+        self.__emit_range_changed()
+        self._request_repaint()
+
+    def getLowValue(self) -> int | float:
+        """Get the current low value of the slider
+
+        :return: low value
+        """
+
+        return self._round_cast_value(self.__low)
+
+    def setLowValue(self, low: int | float):
+        """Set the low value of the slider (clamped to the high value)
+
+        :param low: new low value
+        """
+
+        self.__set_handle_value(RangeSlider.LOW_HANDLE, low)
+
+    def getHighValue(self) -> int | float:
+        """Get the current high value of the slider
+
+        :return: high value
+        """
+
+        return self._round_cast_value(self.__high)
+
+    def setHighValue(self, high: int | float):
+        """Set the high value of the slider (clamped to the low value)
+
+        :param high: new high value
+        """
+
+        self.__set_handle_value(RangeSlider.HIGH_HANDLE, high)
+
+    def getValueFormatted(self) -> str:
+        """Get the current formatted range shown on the slider
+
+        :return: formatted low and high value string
+        """
+
+        return (self._format_value_string(self.__low) + self.__range_separator
+                + self._format_value_string(self.__high))
+
+    def getValuePosition(self) -> tuple[int, int]:
+        """Get the positions of the low and high handle in px
+
+        :return: low and high position
+        """
+
+        return self._get_position_x_from_value(self.__low), self._get_position_x_from_value(self.__high)
+
+    def getRangeSeparator(self) -> str:
+        """Get the separator between low and high value in the formatted string
+
+        :return: range separator
+        """
+
+        return self.__range_separator
+
+    def setRangeSeparator(self, range_separator: str):
+        """Set the separator between low and high value in the formatted string
+
+        :param range_separator: new range separator
+        """
+
+        self.__range_separator = range_separator
+        self._request_repaint()
+
+    def getActiveHandle(self) -> int:
+        """Get the handle moved by keyboard and mouse wheel input
+
+        :return: LOW_HANDLE or HIGH_HANDLE
+        """
+
+        return self.__active_handle
+
+    def setActiveHandle(self, handle: int):
+        """Set the handle moved by keyboard and mouse wheel input
+
+        :param handle: LOW_HANDLE or HIGH_HANDLE
+        """
+
+        self.__active_handle = handle
+
+    def saveState(self) -> bytes:
+        """Save the settings and the low and high value into a compact binary state
+
+        :return: state that can be restored with restoreState()
+        """
+
+        fields = SliderState.unpack(super(RangeSlider, self).saveState())
+        fields['handles'] = [self.__low, self.__high]
+        return SliderState.pack(fields)
+
+    def restoreState(self, state: bytes):
+        """Restore a state saved with saveState() (emits rangeChanged at most once)
+
+        :param state: saved state
+        """
+
+        handles = SliderState.unpack(state)['handles']
+        if handles is None or len(handles) != 2:
+            raise ValueError('Invalid range slider state: expected low and high value')
+
+        # Clamped into the restored range and emitted once by _on_range_changed()
+        self.__low, self.__high = handles
+        super(RangeSlider, self).restoreState(state)
+
+    def _on_range_changed(self):
+        """Clamp low and high value into the new range"""
+
+        self.setValues(self.__low, self.__high)
+
+    def _draw_value_rect(self, painter: QPainter):
+        """Draw the filled span between the low and the high handle
+
+        :param painter: painter of the canvas
+        """
+
+        low_x, high_x = self.getValuePosition()
+
+        painter.setPen(QPen(self.getAccentColor()))
+        painter.setBrush(QBrush(QColor(self.getAccentColor()), Qt.BrushStyle.SolidPattern))
+
+        # Keep the span inside the border and at least one px wide
+        low_x = min(max(low_x, 0), self.width() - 3)
+        high_x = min(max(high_x, low_x + 1), self.width() - 2)
+        rect = QRect(low_x, 1, high_x - low_x, self.height() - 2)
+        painter.drawRoundedRect(rect, self.getBorderRadius(), self.getBorderRadius())
+
+    def _draw_value_text(self, painter: QPainter):
+        """Draw the formatted range next to the high handle
+
+        :param painter: painter of the canvas
+        """
+
+        painter.setPen(QPen(self.getTextColor()))
+
+        value_string_full = self.getValueFormatted()
+
+        # Get string width and height for current font
+        metrics = QFontMetrics(self.getFont())
+        text_width = metrics.horizontalAdvance(value_string_full)
+        text_height = metrics.tightBoundingRect(value_string_full).height()
+
+        # Calculate text position x
+        text_margin = 5
+
+        text_pos_x = self._get_position_x_from_value(self.__high) + text_margin
+        if text_pos_x + text_width >= self.width() - text_margin:
+            text_pos_x = self.width() - text_width - text_margin
+
+        text_pos_x = max(1, int(text_pos_x))
+
+        # Calculate text position y
+        text_pos_y = int(self.height() - ((self.height() - text_height) / 2))
+
+        painter.drawText(text_pos_x, text_pos_y, value_string_full)
+
+    def __get_nearest_handle(self, position_x: int) -> int:
+        """Get the handle nearest to a position (outside of the span the nearer handle wins,
+        on top of each other the handle on the side of the position wins)
+
+        :param position_x: position on the x-axis in px
+        :return: LOW_HANDLE or HIGH_HANDLE
+        """
+
+        low_x, high_x = self.getValuePosition()
+        if position_x <= low_x:
+            return RangeSlider.LOW_HANDLE
+        if position_x >= high_x:
+            return RangeSlider.HIGH_HANDLE
+        if position_x - low_x < high_x - position_x:
+            return RangeSlider.LOW_HANDLE
+        return RangeSlider.HIGH_HANDLE
+
+    def __move_handle_to_position_x(self, handle: int, position_x: int) -> bool:
+        """Move a handle to a position on the x-axis
+
+        :param handle: LOW_HANDLE or HIGH_HANDLE
+        :param position_x: position on the x-axis in px
+        :return: whether the value of the handle has changed
+        """
+
+        return self.__set_handle_value(handle, self._get_value_from_position_x(position_x))
+
+    def __step_active_handle(self, step: int | float, default_step: float, direction: int,
+                             page: bool = False) -> bool:
+        """Step the active handle in a direction
+
+        :param step: custom step (0 = use default step)
+        :param default_step: fraction of the range used as default step
+        :param direction: 1 to increment, -1 to decrement
+        :param page: whether the step is a page step
+        :return: whether the value of the handle has changed
+        """
+
+        value = self.__low if self.__active_handle == RangeSlider.LOW_HANDLE else self.__high
+        return self.__set_handle_value(self.__active_handle,
+                                       self._get_stepped_value(value, step, default_step, direction, page))
+
+    def __set_handle_value(self, handle: int, value: int | float) -> bool:
+        """Set the value of a handle without letting it pass the other handle
+
+        :param handle: LOW_HANDLE or HIGH_HANDLE
+        :param value: new value of the handle
+        :return: whether the value of the handle has changed
+        """
+
+        old_values = (self.__low, self.__high)
+        value = self._clamp_value(value)
+        if handle == RangeSlider.LOW_HANDLE:
+            self.__low = min(value, self.__high)
+        else:
+            self.__high = max(value, self.__low)
+
+        self.__emit_range_changed()
+        self._request_repaint()
+        return (self.__low, self.__high) != old_values
+
+    def __emit_range_changed(self):
+        """Emit rangeChanged (and valueChanged with the tuple) if the rounded range has changed"""
+
+        low, high = self.getValue()
+        if (low, high) == (self.__low_last_emitted, self.__high_last_emitted):
+            return
+
+        self.__low_last_emitted = low
+        self.__high_last_emitted = high
+        start_time = self._get_trace_time()
+        self.rangeChanged.emit(low, high)
+        self.valueChanged.emit((low, high))
+        self._record_emission(start_time)
@@ -0,0 +1,66 @@
+class RenderStats:
+
+    def __init__(self):
+        """Create a new RenderStats instance counting paints, emissions and input events"""
+
+        self.__paints_performed = 0
+        self.__paints_skipped = 0
+        self.__paint_time = 0.0
+        self.__paint_time_max = 0.0
+        self.__emissions = 0
+        self.__inputs_handled = 0
+        self.__inputs_coalesced = 0
+
+    def addPaint(self, duration: float):
+        """Count a performed paint
+
+        :param duration: time spent in paintEvent in seconds
+        """
+
+        self.__paints_performed += 1
+        self.__paint_time += duration
+        if duration > self.__paint_time_max:
+            self.__paint_time_max = duration
+
+    def addSkippedPaint(self):
+        """Count a paint event that was skipped because nothing changed"""
+
+        self.__paints_skipped += 1
+
+    def addEmission(self):
+        """Count a valueChanged emission"""
+
+        self.__emissions += 1
+
+    def addInput(self, coalesced: bool):
+        """Count a handled input event
+
+        :param coalesced: whether the event did not change the value (no emission, no repaint needed)
+        """
+
+        self.__inputs_handled += 1
+        if coalesced:
+            self.__inputs_coalesced += 1
+
+    def reset(self):
+        """Reset all counters"""
+
+        self.__init__()
+
+    def toDict(self) -> dict:
+        """Get all counters
+
+        :return: dict with paints_performed, paints_skipped, paint_time, paint_time_mean, paint_time_max
+            (in seconds), emissions, inputs_handled and inputs_coalesced
+        """
+
+        return {
+            'paints_performed': self.__paints_performed,
+            'paints_skipped': self.__paints_skipped,
+            'paint_time': self.__paint_time,
+            'paint_time_mean': self.__paint_time / self.__paints_performed if self.__paints_performed > 0 else 0.0,
+            'paint_time_max': self.__paint_time_max,
+            'emissions': self.__emissions,
+            'inputs_handled': self.__inputs_handled,
+            'inputs_coalesced': self.__inputs_coalesced
+        }
@@ -0,0 +1,212 @@
+import math
+from bisect import bisect_left
+
+
+class Scale:
+
+    def toNormalized(self, value: int | float, minimum: int | float, maximum: int | float) -> float:
+        """Map a value to its normalized position (0 = minimum, 1 = maximum)
+
+        :param value: slider value
+        :param minimum: minimum value of the slider
+        :param maximum: maximum value of the slider
+        :return: normalized position
+        """
+
+        raise NotImplementedError
+
+    def fromNormalized(self, normalized: float, minimum: int | float, maximum: int | float) -> float:
+        """Map a normalized position (0 = minimum, 1 = maximum) to its value
+
+        :param normalized: normalized position
+        :param minimum: minimum value of the slider
+        :param maximum: maximum value of the slider
+        :return: slider value
+        """
+
+        raise NotImplementedError
+
+    def isLinear(self) -> bool:
+        """Get whether the scale is linear (linear scales don't need lookup tables)
+
+        :return: whether the scale is linear
+        """
+
+        return False
+
+    def createTable(self, minimum: int | float, maximum: int | float, width: int) -> 'ScaleTable':
+        """Create a lookup table mapping each pixel column to its value
+
+        :param minimum: minimum value of the slider
+        :param maximum: maximum value of the slider
+        :param width: width of the slider in px
+        :return: lookup table
+        """
+
+        return ScaleTable(self, minimum, maximum, width)
+
+
+class LinearScale(Scale):
+
+    def toNormalized(self, value: int | float, minimum: int | float, maximum: int | float) -> float:
+        """Map a value to its normalized position"""
+
+        return (value - minimum) / (maximum - minimum)
+
+    def fromNormalized(self, normalized: float, minimum: int | float, maximum: int | float) -> float:
+        """Map a normalized position to its value"""
+
+        return minimum + normalized * (maximum - minimum)
+
+    def isLinear(self) -> bool:
+        """Linear scale is handled without lookup tables"""
+
+        return True
+
+
+class LogScale(Scale):
+
+    def toNormalized(self, value: int | float, minimum: int | float, maximum: int | float) -> float:
+        """Map a value to its normalized position"""
+
+        self.__check_range(minimum)
+        return math.log(value / minimum) / math.log(maximum / minimum)
+
+    def fromNormalized(self, normalized: float, minimum: int | float, maximum: int | float) -> float:
+        """Map a normalized position to its value"""
+
+        self.__check_range(minimum)
+        return minimum * (maximum / minimum) ** normalized
+
+    @staticmethod
+    def __check_range(minimum: int | float):
+        """Make sure that the range can be mapped logarithmically
+
+        :param minimum: minimum value of the slider
+        """
+
+        if minimum <= 0:
+            raise ValueError('Slider minimum must be greater than 0 for a logarithmic scale')
+
+
+class PowerScale(Scale):
+
+    def __init__(self, exponent: float):
+        """Create a new PowerScale instance (value = minimum + range * normalized ** exponent)
+
+        :param exponent: exponent of the curve (> 1 gives finer control near the minimum)
+        """
+
+        if exponent <= 0:
+            raise ValueError('Exponent must be greater than 0')
+        self.__exponent = exponent
+
+    def getExponent(self) -> float:
+        """Get the exponent of the curve
+
+        :return: exponent
+        """
+
+        return self.__exponent
+
+    def toNormalized(self, value: int | float, minimum: int | float, maximum: int | float) -> float:
+        """Map a value to its normalized position"""
+
+        return max(0.0, (value - minimum) / (maximum - minimum)) ** (1 / self.__exponent)
+
+    def fromNormalized(self, normalized: float, minimum: int | float, maximum: int | float) -> float:
+        """Map a normalized position to its value"""
+
+        return minimum + (maximum - minimum) * normalized ** self.__exponent
+
+
+class FunctionScale(Scale):
+
+    def __init__(self, forward, inverse=None):
+        """Create a new FunctionScale instance from a strictly increasing function.
+        Without an inverse function, values are found by bisection when building lookup tables
+
+        :param forward: strictly increasing function mapping values into the scale space
+        :param inverse: inverse of the forward function (optional)
+        """
+
+        self.__forward = forward
+        self.__inverse = inverse
+
+    def toNormalized(self, value: int | float, minimum: int | float, maximum: int | float) -> float:
+        """Map a value to its normalized position"""
+
+        low = self.__forward(minimum)
+        return (self.__forward(value) - low) / (self.__forward(maximum) - low)
+
+    def fromNormalized(self, normalized: float, minimum: int | float, maximum: int | float) -> float:
+        """Map a normalized position to its value"""
+
+        low = self.__forward(minimum)
+        target = low + normalized * (self.__forward(maximum) - low)
+        if self.__inverse is not None:
+            return self.__inverse(target)
+
+        # Bisection on the forward function
+        lower, upper = float(minimum), float(maximum)
+        for _ in range(64):
+            middle = (lower + upper) / 2
+            if self.__forward(middle) < target:
+                lower = middle
+            else:
+                upper = middle
+        return (lower + upper) / 2
+
+
+class ScaleTable:
+
+    def __init__(self, scale: Scale, minimum: int | float, maximum: int | float, width: int):
+        """Create a new ScaleTable instance holding the value of every pixel column
+
+        :param scale: scale the table is built for
+        :param minimum: minimum value of the slider
+        :param maximum: maximum value of the slider
+        :param width: width of the slider in px
+        """
+
+        self.__width = max(1, width)
+        self.__values = [scale.fromNormalized(x / self.__width, minimum, maximum)
+                         for x in range(self.__width + 1)]
+
+        # Make sure the ends are exact despite rounding errors of the scale
+        self.__values[0] = minimum
+        self.__values[-1] = maximum
+
+    def getWidth(self) -> int:
+        """Get the width the table has been built for
+
+        :return: width in px
+        """
+
+        return self.__width
+
+    def valueAt(self, position_x: int | float) -> int | float:
+        """Get the value of a pixel column (O(1))
+
+        :param position_x: position on the x-axis in px
+        :return: value
+        """
+
+        position_x = min(max(int(position_x), 0), self.__width)
+        return self.__values[position_x]
+
+    def positionOf(self, value: int | float) -> int:
+        """Get the pixel column closest to a value (O(log n) bisection)
+
+        :param value: value
+        :return: position on the x-axis in px
+        """
+
+        index = bisect_left(self.__values, value)
+        if index <= 0:
+            return 0
+        if index > self.__width:
+            return self.__width
+        if value - self.__values[index - 1] < self.__values[index] - value:
+            return index - 1
+        return index
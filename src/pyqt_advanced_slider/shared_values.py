@@ -0,0 +1,234 @@
+import struct
+from multiprocessing import shared_memory
+from .slider_group import SliderGroupObserver
+
+
+class SharedValueBinding:
+
+    # Header (magic bytes, format version, amount of slots) and slots (sequence counter, value)
+    MAGIC = b'PQSV'
+    VERSION = 1
+    HEADER = struct.Struct('<4sII4x')
+    SLOT = struct.Struct('<Qd')
+    VALUE = struct.Struct('<d')
+
+    def __init__(self, slot_count: int, name: str = None):
+        """Create a new SharedValueBinding instance that exports slider values into a shared memory block.
+        Every slot holds a float64 value and a sequence counter that is odd while the slot is written,
+        so readers in other processes can detect torn reads without any IPC messages
+
+        :param slot_count: amount of value slots
+        :param name: name of the shared memory block (optional, generated if None)
+        """
+
+        size = SharedValueBinding.HEADER.size + slot_count * SharedValueBinding.SLOT.size
+        self.__memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        SharedValueBinding.HEADER.pack_into(self.__memory.buf, 0, SharedValueBinding.MAGIC,
+                                            SharedValueBinding.VERSION, slot_count)
+
+        self.__slot_count = slot_count
+        self.__sequences = [0] * slot_count
+
+        # Bound sliders by slot and their valueChanged connections
+        self.__sliders = {}
+        self.__connections = {}
+
+        # Bound groups
+        self.__group_observer = SliderGroupObserver(self.__write_values)
+
+    def getName(self) -> str:
+        """Get the name of the shared memory block (needed by readers to attach)
+
+        :return: name of the shared memory block
+        """
+
+        return self.__memory.name
+
+    def getSlotCount(self) -> int:
+        """Get the amount of value slots
+
+        :return: amount of slots
+        """
+
+        return self.__slot_count
+
+    def bindSlider(self, slider, slot: int):
+        """Write the current value and every value change of a slider into a slot
+        (use bindGroup() for sliders of a group)
+
+        :param slider: slider to bind (with a single value, not a RangeSlider or MultiSlider)
+        :param slot: slot index
+        """
+
+        self.__check_slot(slot)
+        SliderGroupObserver.checkSlider(slider)
+        self.unbindSlider(slot)
+
+        self.__sliders[slot] = slider
+        self.__connections[slot] = slider.valueChanged.connect(lambda value: self.write(slot, value))
+        self.write(slot, slider.getValue())
+
+    def unbindSlider(self, slot: int):
+        """Stop writing the value changes of the slider bound to a slot
+
+        :param slot: slot index
+        """
+
+        slider = self.__sliders.pop(slot, None)
+        if slider is not None:
+            slider.valueChanged.disconnect(self.__connections.pop(slot))
+
+    def bindGroup(self, group, slots: dict = None) -> dict:
+        """Write the current values and the coalesced value changes of all sliders of a group into slots
+        (see SliderGroupObserver)
+
+        :param group: SliderGroup to bind
+        :param slots: dict of key -> slot index (default: the keys of the group in order from slot 0)
+        :return: dict of key -> slot index
+        """
+
+        if slots is None:
+            slots = {key: slot for slot, key in enumerate(group.getKeys())}
+        for slot in slots.values():
+            self.__check_slot(slot)
+
+        slots = self.__group_observer.bind(group, slots)
+        self.__write_values({slot: group.getSlider(key).getValue() for key, slot in slots.items()})
+        return slots
+
+    def unbindGroup(self, group):
+        """Stop writing the value changes of a group bound with bindGroup()
+
+        :param group: bound group
+        """
+
+        self.__group_observer.unbind(group)
+
+    def write(self, slot: int, value: int | float):
+        """Write a value into a slot (the sequence counter is odd while writing)
+
+        :param slot: slot index
+        :param value: new value
+        """
+
+        # Pack the value first, so a value that can't be packed does not leave the slot odd
+        packed_value = SharedValueBinding.VALUE.pack(value)
+
+        offset = SharedValueBinding.HEADER.size + slot * SharedValueBinding.SLOT.size
+        sequence = self.__sequences[slot]
+        buffer = self.__memory.buf
+
+        struct.pack_into('<Q', buffer, offset, sequence + 1)
+        buffer[offset + 8:offset + 16] = packed_value
+        struct.pack_into('<Q', buffer, offset, sequence + 2)
+        self.__sequences[slot] = sequence + 2
+
+    def close(self, unlink: bool = True):
+        """Unbind all sliders and close (and by default unlink) the shared memory block
+
+        :param unlink: whether the shared memory block should be removed
+        """
+
+        for slot in list(self.__sliders.keys()):
+            self.unbindSlider(slot)
+        self.__group_observer.unbindAll()
+        self.__memory.close()
+        if unlink:
+            self.__memory.unlink()
+
+    def __write_values(self, values: dict):
+        """Write values into their slots
+
+        :param values: dict of slot index -> value
+        """
+
+        for slot, value in values.items():
+            self.write(slot, value)
+
+    def __check_slot(self, slot: int):
+        """Make sure that a slot index exists
+
+        :param slot: slot index
+        """
+
+        if slot < 0 or slot >= self.__slot_count:
+            raise IndexError('Slot {} out of range (0 to {})'.format(slot, self.__slot_count - 1))
+
+
+class SharedValueReader:
+
+    def __init__(self, name: str, retries: int = 10000):
+        """Create a new SharedValueReader instance that reads slider values exported by a
+        SharedValueBinding (e.g. in a worker process)
+
+        :param name: name of the shared memory block
+        :param retries: maximum amount of attempts to get a consistent read of a slot
+        """
+
+        try:
+            # Python 3.13+: the writing process owns the block
+            self.__memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            self.__memory = shared_memory.SharedMemory(name=name)
+
+        magic, version, slot_count = SharedValueBinding.HEADER.unpack_from(self.__memory.buf, 0)
+        if magic != SharedValueBinding.MAGIC or version > SharedValueBinding.VERSION:
+            self.__memory.close()
+            raise ValueError('Shared memory block {} holds no slider values'.format(name))
+
+        self.__slot_count = slot_count
+        self.__retries = retries
+
+    def getSlotCount(self) -> int:
+        """Get the amount of value slots
+
+        :return: amount of slots
+        """
+
+        return self.__slot_count
+
+    def read(self, slot: int) -> float:
+        """Read the value of a slot (retried while the slot is being written)
+
+        :param slot: slot index
+        :return: value
+        """
+
+        return self.readWithSequence(slot)[0]
+
+    def readWithSequence(self, slot: int) -> tuple[float, int]:
+        """Read the value and the sequence counter of a slot. The sequence counter
+        increases by 2 with every write, so readers can tell whether a value is new
+
+        :param slot: slot index
+        :return: value and sequence counter
+        """
+
+        if slot < 0 or slot >= self.__slot_count:
+            raise IndexError('Slot {} out of range (0 to {})'.format(slot, self.__slot_count - 1))
+
+        offset = SharedValueBinding.HEADER.size + slot * SharedValueBinding.SLOT.size
+        buffer = self.__memory.buf
+
+        for _ in range(self.__retries):
+            sequence, = struct.unpack_from('<Q', buffer, offset)
+            if sequence % 2 == 1:
+                continue
+            value, = struct.unpack_from('<d', buffer, offset + 8)
+            if struct.unpack_from('<Q', buffer, offset)[0] == sequence:
+                return value, sequence
+
+        raise RuntimeError('Could not get a consistent read of slot {}'.format(slot))
+
+    def readAll(self) -> list[float]:
+        """Read the values of all slots
+
+        :return: values
+        """
+
+        return [self.read(slot) for slot in range(self.__slot_count)]
+
+    def close(self):
+        """Detach from the shared memory block"""
+
+        self.__memory.close()
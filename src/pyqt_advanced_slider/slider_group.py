@@ -0,0 +1,267 @@
+from qtpy.QtCore import QObject, Signal, QTimer
+from .advanced_slider import Slider
+from .slider_state import SliderState
+
+
+class SliderGroup(QObject):
+
+    # Signal (dict: key -> value) emitted once per event loop iteration with all changed sliders
+    valuesChanged = Signal(object)
+
+    def __init__(self, parent=None):
+        """Create a new SliderGroup instance that batches the value changes of many sliders
+
+        :param parent: the parent object
+        """
+
+        super(SliderGroup, self).__init__(parent)
+
+        # Sliders by key (in insertion order) and their valueChanged connections
+        self.__sliders = {}
+        self.__connections = {}
+
+        # Changed sliders that have not been emitted yet and whether their emission is scheduled
+        self.__pending_changes = {}
+        self.__emission_scheduled = False
+
+    def addSlider(self, key, slider: Slider):
+        """Add a slider to the group
+
+        :param key: key of the slider in the group (e.g. name or index)
+        :param slider: slider to add
+        """
+
+        if key in self.__sliders:
+            raise KeyError('Slider with key {} already exists in the group'.format(key))
+
+        connection = slider.valueChanged.connect(lambda value: self._on_slider_value_changed(key, value))
+        self.__sliders[key] = slider
+        self.__connections[key] = connection
+
+    def removeSlider(self, key) -> Slider:
+        """Remove a slider from the group
+
+        :param key: key of the slider
+        :return: removed slider
+        """
+
+        slider = self.__sliders.pop(key)
+        slider.valueChanged.disconnect(self.__connections.pop(key))
+        self.__pending_changes.pop(key, None)
+        return slider
+
+    def getSlider(self, key) -> Slider:
+        """Get a slider of the group
+
+        :param key: key of the slider
+        :return: slider
+        """
+
+        return self.__sliders[key]
+
+    def getKeys(self) -> list:
+        """Get the keys of all sliders in the group
+
+        :return: keys in insertion order
+        """
+
+        return list(self.__sliders.keys())
+
+    def size(self) -> int:
+        """Get the amount of sliders in the group
+
+        :return: amount of sliders
+        """
+
+        return len(self.__sliders)
+
+    def getValues(self) -> dict:
+        """Get the values of all sliders in the group
+
+        :return: dict of key -> value
+        """
+
+        return {key: slider.getValue() for key, slider in self.__sliders.items()}
+
+    def setValues(self, values: dict):
+        """Set the values of multiple sliders without each slider emitting valueChanged.
+        The sliders repaint once in the next paint pass and the changed values are emitted
+        with the next valuesChanged
+
+        :param values: dict of key -> new value
+        """
+
+        for key, value in values.items():
+            slider = self.__sliders[key]
+            old_value = slider.getValue()
+
+            signals_blocked = slider.blockSignals(True)
+            try:
+                slider.setValue(value)
+            finally:
+                slider.blockSignals(signals_blocked)
+
+            new_value = slider.getValue()
+            if new_value != old_value:
+                self._on_slider_value_changed(key, new_value)
+
+    def saveState(self) -> bytes:
+        """Save the states of all sliders into one compact binary preset
+
+        :return: state that can be restored with restoreState()
+        """
+
+        return SliderState.packGroup({str(key): slider.saveState() for key, slider in self.__sliders.items()})
+
+    def restoreState(self, state: bytes):
+        """Restore the states of all sliders saved with saveState() (matched by key).
+        The sliders don't emit valueChanged individually, they repaint once in the next paint pass
+        and the changed values are emitted immediately with one valuesChanged
+
+        :param state: saved state
+        """
+
+        self._restore_slider_states(SliderState.unpackGroup(state))
+        self.flush()
+
+    def flush(self):
+        """Emit the pending changes immediately instead of in the next event loop iteration"""
+
+        self.__emit_changes()
+
+    def _restore_slider_states(self, states: dict):
+        """Restore the slider states of a group state with the signals of the sliders blocked
+
+        :param states: dict of key (str) -> saved slider state
+        """
+
+        for key, slider in self.__sliders.items():
+            slider_state = states.get(str(key))
+            if slider_state is None:
+                continue
+
+            old_value = slider.getValue()
+
+            signals_blocked = slider.blockSignals(True)
+            try:
+                slider.restoreState(slider_state)
+            finally:
+                slider.blockSignals(signals_blocked)
+
+            new_value = slider.getValue()
+            if new_value != old_value:
+                self._on_slider_value_changed(key, new_value)
+
+    def _on_slider_value_changed(self, key, value):
+        """Record a changed slider value and schedule the emission
+
+        :param key: key of the slider
+        :param value: new value of the slider
+        """
+
+        self.__pending_changes[key] = value
+        if not self.__emission_scheduled:
+            self.__emission_scheduled = True
+            QTimer.singleShot(0, self.__emit_changes)
+
+    def __emit_changes(self):
+        """Emit all pending changes with one signal"""
+
+        self.__emission_scheduled = False
+        if len(self.__pending_changes) == 0:
+            return
+
+        changes = self.__pending_changes
+        self.__pending_changes = {}
+        self.valuesChanged.emit(changes)
+
+
+class SliderGroupObserver:
+
+    def __init__(self, callback):
+        """Create a new SliderGroupObserver instance forwarding the coalesced value changes of groups.
+        Groups apply some values with the signals of their sliders blocked (e.g. setValues(), restoreState()
+        and constraint rebalancing), so observers of a group connect to its valuesChanged signal
+        instead of the valueChanged signals of its sliders
+
+        :param callback: function called with a dict of target -> value for every valuesChanged emission
+        """
+
+        self.__callback = callback
+
+        # Bound groups with their targets (key -> target) and valuesChanged connections
+        self.__bindings = []
+
+    def bind(self, group: SliderGroup, targets: dict = None) -> dict:
+        """Forward the value changes of the sliders of a group to their targets
+
+        :param group: group to observe (all sliders must have a single value)
+        :param targets: dict of key -> target, e.g. slot or channel (default: the keys of the group in order from 0)
+        :return: dict of key -> target
+        """
+
+        if targets is None:
+            targets = {key: target for target, key in enumerate(group.getKeys())}
+        else:
+            targets = dict(targets)
+        for key in targets:
+            SliderGroupObserver.checkSlider(group.getSlider(key))
+        self.unbind(group)
+
+        connection = group.valuesChanged.connect(lambda values: self.__on_values_changed(targets, values))
+        self.__bindings.append((group, targets, connection))
+        return dict(targets)
+
+    def unbind(self, group: SliderGroup):
+        """Stop forwarding the value changes of a group
+
+        :param group: bound group
+        """
+
+        remaining_bindings = []
+        for binding in self.__bindings:
+            if binding[0] is group:
+                group.valuesChanged.disconnect(binding[2])
+            else:
+                remaining_bindings.append(binding)
+        self.__bindings = remaining_bindings
+
+    def unbindAll(self):
+        """Stop forwarding the value changes of all groups"""
+
+        for group, _, connection in self.__bindings:
+            group.valuesChanged.disconnect(connection)
+        self.__bindings = []
+
+    def getTargets(self, group: SliderGroup) -> dict | None:
+        """Get the targets of a bound group
+
+        :param group: bound group
+        :return: dict of key -> target or None if the group is not bound
+        """
+
+        for bound_group, targets, _ in self.__bindings:
+            if bound_group is group:
+                return dict(targets)
+        return None
+
+    @staticmethod
+    def checkSlider(slider: Slider):
+        """Make sure that a slider has a single value (not a RangeSlider or MultiSlider)
+
+        :param slider: slider to check
+        """
+
+        if isinstance(slider.getValue(), (tuple, list)):
+            raise TypeError('Only sliders with a single value can be bound, not {}'.format(type(slider).__name__))
+
+    def __on_values_changed(self, targets: dict, values: dict):
+        """Forward the changed values of a bound group to the callback
+
+        :param targets: dict of key -> target
+        :param values: changed values (key -> value)
+        """
+
+        changes = {targets[key]: value for key, value in values.items() if key in targets}
+        if len(changes) > 0:
+            self.__callback(changes)
@@ -0,0 +1,201 @@
+import struct
+
+
+class SliderState:
+
+    # Header of slider states and of group states (magic bytes and format version)
+    MAGIC = b'PQAS'
+    GROUP_MAGIC = b'PQAG'
+    VERSION = 1
+
+    # Flags
+    FLOAT_FLAG = 1
+    FIXED_POINT_FLAG = 2
+    SHOWING_VALUE_FLAG = 4
+    HANDLES_FLAG = 8
+
+    # Number tags
+    __FLOAT_TAG = 0
+    __INT_TAG = 1
+    __BIG_INT_TAG = 2
+
+    __header = struct.Struct('<4sB')
+    __settings = struct.Struct('<BB')
+    __length = struct.Struct('<H')
+    __count = struct.Struct('<I')
+
+    @staticmethod
+    def pack(fields: dict) -> bytes:
+        """Pack the fields of a slider into the compact binary format
+
+        :param fields: dict with value, minimum, maximum, single_step, page_step, decimals,
+            flags, prefix, suffix, thousands_separator, decimal_separator
+            and optionally handles (values of the handles of range and multi sliders)
+        :return: packed state
+        """
+
+        handles = fields.get('handles')
+        flags = fields['flags'] & ~SliderState.HANDLES_FLAG
+        if handles is not None:
+            flags |= SliderState.HANDLES_FLAG
+
+        parts = [SliderState.__header.pack(SliderState.MAGIC, SliderState.VERSION),
+                 SliderState.__settings.pack(flags, fields['decimals'])]
+        for name in ('value', 'minimum', 'maximum', 'single_step', 'page_step'):
+            parts.append(SliderState.__pack_number(fields[name]))
+        for name in ('prefix', 'suffix', 'thousands_separator', 'decimal_separator'):
+            parts.append(SliderState.__pack_bytes(fields[name].encode('utf-8')))
+        if handles is not None:
+            parts.append(SliderState.__count.pack(len(handles)))
+            parts.extend(SliderState.__pack_number(handle) for handle in handles)
+        return b''.join(parts)
+
+    @staticmethod
+    def unpack(data: bytes) -> dict:
+        """Unpack a state packed with pack()
+
+        :param data: packed state
+        :return: dict of fields (handles is None if the state has no handle values)
+        """
+
+        try:
+            offset = SliderState.__unpack_header(data, SliderState.MAGIC)
+            flags, decimals = SliderState.__settings.unpack_from(data, offset)
+            offset += SliderState.__settings.size
+            fields = {'flags': flags, 'decimals': decimals}
+
+            for name in ('value', 'minimum', 'maximum', 'single_step', 'page_step'):
+                fields[name], offset = SliderState.__unpack_number(data, offset)
+            for name in ('prefix', 'suffix', 'thousands_separator', 'decimal_separator'):
+                string, offset = SliderState.__unpack_bytes(data, offset)
+                fields[name] = string.decode('utf-8')
+
+            fields['handles'] = None
+            if flags & SliderState.HANDLES_FLAG:
+                count, = SliderState.__count.unpack_from(data, offset)
+                offset += SliderState.__count.size
+                fields['handles'] = []
+                for _ in range(count):
+                    handle, offset = SliderState.__unpack_number(data, offset)
+                    fields['handles'].append(handle)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ValueError('Invalid slider state: {}'.format(error))
+
+        if offset != len(data):
+            raise ValueError('Invalid slider state: unexpected trailing data')
+        return fields
+
+    @staticmethod
+    def packGroup(states: dict) -> bytes:
+        """Pack the states of multiple sliders
+
+        :param states: dict of key (str) -> packed slider state
+        :return: packed group state
+        """
+
+        parts = [SliderState.__header.pack(SliderState.GROUP_MAGIC, SliderState.VERSION),
+                 SliderState.__count.pack(len(states))]
+        for key, state in states.items():
+            parts.append(SliderState.__pack_bytes(key.encode('utf-8')))
+            parts.append(SliderState.__pack_bytes(state))
+        return b''.join(parts)
+
+    @staticmethod
+    def unpackGroup(data: bytes) -> dict:
+        """Unpack a group state packed with packGroup()
+
+        :param data: packed group state
+        :return: dict of key (str) -> packed slider state
+        """
+
+        try:
+            offset = SliderState.__unpack_header(data, SliderState.GROUP_MAGIC)
+            count, = SliderState.__count.unpack_from(data, offset)
+            offset += SliderState.__count.size
+
+            states = {}
+            for _ in range(count):
+                key, offset = SliderState.__unpack_bytes(data, offset)
+                state, offset = SliderState.__unpack_bytes(data, offset)
+                states[key.decode('utf-8')] = state
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ValueError('Invalid slider group state: {}'.format(error))
+        return states
+
+    @staticmethod
+    def __unpack_header(data: bytes, magic: bytes) -> int:
+        """Check magic bytes and version of packed data
+
+        :param data: packed data
+        :param magic: expected magic bytes
+        :return: offset after the header
+        """
+
+        data_magic, version = SliderState.__header.unpack_from(data, 0)
+        if data_magic != magic:
+            raise ValueError('Invalid slider state: unknown format')
+        if version > SliderState.VERSION:
+            raise ValueError('Unsupported slider state version {}'.format(version))
+        return SliderState.__header.size
+
+    @staticmethod
+    def __pack_number(number: int | float) -> bytes:
+        """Pack an int (int64 or arbitrary size) or float (float64) with a type tag
+
+        :param number: number to pack
+        :return: packed number
+        """
+
+        if isinstance(number, int):
+            if -2 ** 63 <= number < 2 ** 63:
+                return struct.pack('<Bq', SliderState.__INT_TAG, number)
+            length = (number.bit_length() + 8) // 8
+            return struct.pack('<BB', SliderState.__BIG_INT_TAG, length) + number.to_bytes(length, 'little', signed=True)
+        return struct.pack('<Bd', SliderState.__FLOAT_TAG, number)
+
+    @staticmethod
+    def __unpack_number(data: bytes, offset: int) -> tuple[int | float, int]:
+        """Unpack a number packed with __pack_number
+
+        :param data: packed data
+        :param offset: offset of the number
+        :return: number and offset after the number
+        """
+
+        tag = data[offset]
+        if tag == SliderState.__INT_TAG:
+            return struct.unpack_from('<q', data, offset + 1)[0], offset + 9
+        if tag == SliderState.__FLOAT_TAG:
+            return struct.unpack_from('<d', data, offset + 1)[0], offset + 9
+        if tag == SliderState.__BIG_INT_TAG:
+            length = data[offset + 1]
+            end = offset + 2 + length
+            if end > len(data):
+                raise struct.error('big int exceeds data')
+            return int.from_bytes(data[offset + 2:end], 'little', signed=True), end
+        raise ValueError('Invalid slider state: unknown number tag {}'.format(tag))
+
+    @staticmethod
+    def __pack_bytes(value: bytes) -> bytes:
+        """Pack bytes with a length prefix
+
+        :param value: bytes to pack
+        :return: packed bytes
+        """
+
+        return SliderState.__length.pack(len(value)) + value
+
+    @staticmethod
+    def __unpack_bytes(data: bytes, offset: int) -> tuple[bytes, int]:
+        """Unpack bytes packed with __pack_bytes
+
+        :param data: packed data
+        :param offset: offset of the length prefix
+        :return: bytes and offset after them
+        """
+
+        length, = SliderState.__length.unpack_from(data, offset)
+        start = offset + SliderState.__length.size
+        if start + length > len(data):
+            raise struct.error('length exceeds data')
+        return bytes(data[start:start + length]), start + length
@@ -0,0 +1,220 @@
+import struct
+import sys
+import time
+from array import array
+from .slider_group import SliderGroupObserver
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ValueHistory:
+
+    # Header of the bytes export (magic bytes, format version, amount of entries)
+    MAGIC = b'PQVH'
+    VERSION = 1
+    HEADER = struct.Struct('<4sII')
+
+    def __init__(self, capacity: int = 65536):
+        """Create a new ValueHistory instance recording (timestamp, channel, value) entries
+        in a fixed-capacity ring buffer (the oldest entries are overwritten when it is full)
+
+        :param capacity: maximum amount of entries
+        """
+
+        if capacity <= 0:
+            raise ValueError('Capacity must be greater than 0')
+
+        self.__capacity = capacity
+        self.__timestamps = array('d', bytes(8 * capacity))
+        self.__channels = array('I', bytes(4 * capacity))
+        self.__values = array('d', bytes(8 * capacity))
+
+        # Index of the next entry and amount of entries
+        self.__head = 0
+        self.__size = 0
+
+        # Next channel of bound groups, valueChanged connections of bound sliders and bound groups
+        self.__next_channel = 0
+        self.__connections = []
+        self.__group_observer = SliderGroupObserver(self.__append_values)
+
+    def append(self, value: int | float, channel: int = 0, timestamp: float = None):
+        """Record a value (O(1), overwrites the oldest entry if the buffer is full)
+
+        :param value: value
+        :param channel: channel of the value (e.g. index of the slider)
+        :param timestamp: monotonic timestamp in seconds (default: time.monotonic())
+        """
+
+        head = self.__head
+        self.__timestamps[head] = time.monotonic() if timestamp is None else timestamp
+        self.__channels[head] = channel
+        self.__values[head] = value
+
+        self.__head = head + 1 if head + 1 < self.__capacity else 0
+        if self.__size < self.__capacity:
+            self.__size += 1
+
+    def bindSlider(self, slider, channel: int = 0):
+        """Record every value change of a slider
+
+        :param slider: slider to record (with a single value, not a RangeSlider or MultiSlider)
+        :param channel: channel the values are recorded with
+        """
+
+        SliderGroupObserver.checkSlider(slider)
+        connection = slider.valueChanged.connect(lambda value: self.append(value, channel))
+        self.__connections.append((slider.valueChanged, connection))
+
+    def bindGroup(self, group, channels: dict = None) -> dict:
+        """Record the coalesced value changes of all sliders of a group in this buffer
+        (every slider gets its own channel, see SliderGroupObserver)
+
+        :param group: SliderGroup to record
+        :param channels: dict of key -> channel (default: channels after the ones of all previously bound groups)
+        :return: dict of key -> channel
+        """
+
+        if channels is None:
+            channels = self.__group_observer.getTargets(group) or {}
+            for key in group.getKeys():
+                if key not in channels:
+                    channels[key] = self.__next_channel
+                    self.__next_channel += 1
+        else:
+            self.__next_channel = max([self.__next_channel] + [channel + 1 for channel in channels.values()])
+
+        return self.__group_observer.bind(group, channels)
+
+    def getChannels(self, group) -> dict | None:
+        """Get the channels of a group bound with bindGroup()
+
+        :param group: bound group
+        :return: dict of key -> channel or None if the group is not bound
+        """
+
+        return self.__group_observer.getTargets(group)
+
+    def unbindAll(self):
+        """Stop recording all bound sliders"""
+
+        for signal, connection in self.__connections:
+            signal.disconnect(connection)
+        self.__connections.clear()
+        self.__group_observer.unbindAll()
+
+    def getCapacity(self) -> int:
+        """Get the maximum amount of entries
+
+        :return: capacity
+        """
+
+        return self.__capacity
+
+    def size(self) -> int:
+        """Get the amount of recorded entries
+
+        :return: amount of entries
+        """
+
+        return self.__size
+
+    def clear(self):
+        """Remove all entries"""
+
+        self.__head = 0
+        self.__size = 0
+
+    def toLists(self) -> tuple[list[float], list[int], list[float]]:
+        """Get all entries from oldest to newest
+
+        :return: timestamps, channels and values
+        """
+
+        return (self.__ordered(self.__timestamps).tolist(), self.__ordered(self.__channels).tolist(),
+                self.__ordered(self.__values).tolist())
+
+    def toNumpy(self) -> tuple:
+        """Get all entries from oldest to newest as NumPy arrays (requires NumPy)
+
+        :return: timestamps (float64), channels (uint32) and values (float64)
+        """
+
+        if numpy is None:
+            raise ImportError('NumPy is required to export the history as NumPy arrays')
+
+        return (numpy.frombuffer(self.__ordered(self.__timestamps), dtype=numpy.float64),
+                numpy.frombuffer(self.__ordered(self.__channels), dtype=numpy.uint32),
+                numpy.frombuffer(self.__ordered(self.__values), dtype=numpy.float64))
+
+    def toBytes(self) -> bytes:
+        """Export all entries from oldest to newest into a compact little-endian format
+        (header followed by the timestamp, channel and value columns)
+
+        :return: exported entries
+        """
+
+        columns = [self.__ordered(self.__timestamps), self.__ordered(self.__channels), self.__ordered(self.__values)]
+        if sys.byteorder == 'big':
+            for column in columns:
+                column.byteswap()
+
+        return (ValueHistory.HEADER.pack(ValueHistory.MAGIC, ValueHistory.VERSION, self.__size)
+                + b''.join(column.tobytes() for column in columns))
+
+    @staticmethod
+    def fromBytes(data: bytes, capacity: int = None) -> 'ValueHistory':
+        """Create a history from entries exported with toBytes()
+
+        :param data: exported entries
+        :param capacity: capacity of the new history (default: amount of entries)
+        :return: history with the entries
+        """
+
+        try:
+            magic, version, size = ValueHistory.HEADER.unpack_from(data, 0)
+        except struct.error as error:
+            raise ValueError('Invalid value history: {}'.format(error))
+        if magic != ValueHistory.MAGIC or version > ValueHistory.VERSION:
+            raise ValueError('Invalid value history: unknown format or version')
+        if len(data) != ValueHistory.HEADER.size + size * 20:
+            raise ValueError('Invalid value history: unexpected length')
+
+        offset = ValueHistory.HEADER.size
+        columns = []
+        for typecode, item_size in (('d', 8), ('I', 4), ('d', 8)):
+            column = array(typecode)
+            column.frombytes(data[offset:offset + size * item_size])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            columns.append(column)
+            offset += size * item_size
+
+        history = ValueHistory(capacity or max(1, size))
+        for timestamp, channel, value in zip(*columns):
+            history.append(value, channel, timestamp)
+        return history
+
+    def __append_values(self, values: dict):
+        """Record the changed values of a bound group with one timestamp
+
+        :param values: dict of channel -> value
+        """
+
+        timestamp = time.monotonic()
+        for channel, value in values.items():
+            self.append(value, channel, timestamp)
+
+    def __ordered(self, column: array) -> array:
+        """Get the entries of a column from oldest to newest
+
+        :param column: timestamp, channel or value column
+        :return: ordered copy of the column
+        """
+
+        if self.__size < self.__capacity:
+            return column[:self.__size]
+        return column[self.__head:] + column[:self.__head]
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+
+
+class ValueStream:
+
+    def __init__(self, slider, debounce: float = 0.0):
+        """Create a new ValueStream instance that yields the value changes of a slider.
+        Only the latest value is kept, so slow consumers never see a backlog.
+        Leaving an async for loop over the stream (e.g. with break) closes the stream
+
+        :param slider: the slider whose value changes will be streamed
+        :param debounce: time in seconds the value has to be stable before it is yielded
+        """
+
+        self.__slider = slider
+        self.__debounce = debounce
+
+        # Latest value (size one buffer) and whether it has not been consumed yet
+        self.__latest = None
+        self.__pending = False
+        self.__closed = False
+
+        # Event loop the stream is consumed on (bound on first iteration)
+        self.__loop = None
+        self.__loop_thread_id = None
+        self.__event = None
+
+        slider.valueChanged.connect(self.__on_value_changed)
+        slider.destroyed.connect(self.close)
+
+    def __aiter__(self):
+        return self.__iterate()
+
+    async def __iterate(self):
+        """Yield the values until the stream is closed. The stream is closed when the iteration ends
+        (also when a loop is left early, the event loop then finalizes the generator)
+
+        :return: async generator yielding the new values
+        """
+
+        try:
+            while True:
+                try:
+                    value = await self.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield value
+        finally:
+            self.close()
+
+    async def __anext__(self):
+        """Wait for the next value
+
+        :return: latest value of the slider
+        """
+
+        self.__bind_loop()
+
+        # Wait until there is an unconsumed value
+        while True:
+            self.__event.clear()
+            if self.__closed:
+                raise StopAsyncIteration
+            if self.__pending:
+                break
+            await self.__event.wait()
+
+        # Wait until the value has been stable for the debounce period
+        while self.__debounce > 0 and not self.__closed:
+            self.__event.clear()
+            try:
+                await asyncio.wait_for(self.__event.wait(), self.__debounce)
+            except asyncio.TimeoutError:
+                break
+
+        self.__pending = False
+        return self.__latest
+
+    def isClosed(self) -> bool:
+        """Get whether the stream has been closed
+
+        :return: whether the stream is closed
+        """
+
+        return self.__closed
+
+    def close(self):
+        """Stop streaming values and end all pending iterations"""
+
+        if self.__closed:
+            return
+
+        self.__closed = True
+        try:
+            self.__slider.valueChanged.disconnect(self.__on_value_changed)
+            self.__slider.destroyed.disconnect(self.close)
+        except (RuntimeError, TypeError):
+            # Slider has already been deleted
+            pass
+        self.__wake()
+
+    async def aclose(self):
+        """Stop streaming values (async variant for use with contextlib.aclosing)"""
+
+        self.close()
+
+    def __bind_loop(self):
+        """Bind the stream to the running event loop"""
+
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            self.__loop = loop
+            self.__loop_thread_id = threading.get_ident()
+            self.__event = asyncio.Event()
+
+    def __on_value_changed(self, value):
+        """Store the new value and wake up the consumer
+
+        :param value: new value of the slider
+        """
+
+        self.__latest = value
+        self.__pending = True
+        self.__wake()
+
+    def __wake(self):
+        """Wake up the consumer waiting on the event loop"""
+
+        if self.__loop is None or self.__loop.is_closed():
+            return
+
+        # Slider and consumer share a thread (e.g. Qt integrated asyncio loop)
+        if threading.get_ident() == self.__loop_thread_id:
+            self.__event.set()
+        else:
+            self.__loop.call_soon_threadsafe(self.__event.set)
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from qtpy.QtCore import QObject, Signal, Slot
+
+
+class WorkerBinding(QObject):
+
+    # Signals (value, result) and (value, exception) for the latest submitted value only
+    finished = Signal(object, object)
+    failed = Signal(object, object)
+
+    # Internal signal used to hand results from the worker thread back to the GUI thread
+    _job_done = Signal(int, object, object, object)
+
+    def __init__(self, fn, executor=None, parent=None):
+        """Create a new WorkerBinding instance that runs fn(value) off the GUI thread
+
+        :param fn: function that will be called with the submitted value
+        :param executor: concurrent.futures executor to run the jobs on (optional)
+        :param parent: the parent object
+        """
+
+        super(WorkerBinding, self).__init__(parent)
+
+        self.__fn = fn
+
+        # Use a private single worker executor if none is given
+        self.__owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='slider-worker')
+        self.__executor = executor
+
+        # Generation of the latest job, used to drop results of superseded jobs
+        self.__generation = 0
+        self.__future = None
+        self.__closed = False
+
+        # Queued to the GUI thread since the signal gets emitted from the worker thread
+        self._job_done.connect(self.__on_job_done)
+
+    def submit(self, value):
+        """Submit a new job for the given value and supersede all previous jobs
+
+        :param value: value that will be passed to the function
+        """
+
+        if self.__closed:
+            return
+
+        self.__generation += 1
+        generation = self.__generation
+
+        # Cancel previous job if it has not started yet (otherwise its result gets ignored)
+        if self.__future is not None:
+            self.__future.cancel()
+
+        self.__future = self.__executor.submit(self.__fn, value)
+        self.__future.add_done_callback(lambda future: self.__on_future_done(future, generation, value))
+
+    def isBusy(self) -> bool:
+        """Get whether the job for the latest value is still pending or running
+
+        :return: whether the latest job is still pending or running
+        """
+
+        return self.__future is not None and not self.__future.done()
+
+    def shutdown(self):
+        """Cancel the pending job and stop delivering results"""
+
+        self.__closed = True
+        self.__generation += 1
+        if self.__future is not None:
+            self.__future.cancel()
+            self.__future = None
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __on_future_done(self, future, generation: int, value):
+        """Called on the worker thread when a job is done
+
+        :param future: future of the job
+        :param generation: generation of the job
+        :param value: value the job was submitted with
+        """
+
+        # Superseded or cancelled jobs are dropped as early as possible
+        if future.cancelled() or generation != self.__generation or self.__closed:
+            return
+
+        exception = future.exception()
+        result = None if exception is not None else future.result()
+        try:
+            self._job_done.emit(generation, value, result, exception)
+        except RuntimeError:
+            # Underlying QObject has already been deleted
+            pass
+
+    @Slot(int, object, object, object)
+    def __on_job_done(self, generation: int, value, result, exception):
+        """Called on the GUI thread with the result of a job
+
+        :param generation: generation of the job
+        :param value: value the job was submitted with
+        :param result: return value of the function
+        :param exception: exception raised by the function or None
+        """
+
+        # A newer job has been submitted in the meantime
+        if generation != self.__generation or self.__closed:
+            return
+
+        if exception is not None:
+            self.failed.emit(value, exception)
+        else:
+            self.finished.emit(value, result)
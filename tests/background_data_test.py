@@ -0,0 +1,103 @@
+import random
+import pytest
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QPaintEvent
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+
+
+from src.pyqt_advanced_slider import Slider, MinMaxDecimator
+from src.pyqt_advanced_slider import background_data
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    """Run the test with and without NumPy"""
+
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(background_data, 'numpy', None)
+    return request.param
+
+
+def brute_force_decimate(values, columns):
+    """Reference decimation using the same power of two buckets combined into the columns"""
+
+    bucket_size = 1
+    while -(-len(values) // bucket_size) > columns * MinMaxDecimator.BUCKETS_PER_COLUMN:
+        bucket_size *= 2
+    buckets = [values[i:i + bucket_size] for i in range(0, len(values), bucket_size)]
+    if len(buckets) > columns:
+        buckets = [sum(buckets[i * len(buckets) // columns:(i + 1) * len(buckets) // columns], [])
+                   for i in range(columns)]
+    return [min(b) for b in buckets], [max(b) for b in buckets]
+
+
+def test_decimate(backend):
+    """Test decimating data to one min/max pair per column"""
+
+    values = [random.uniform(-100, 100) for _ in range(10000)]
+    decimator = MinMaxDecimator(values)
+
+    mins, maxs = decimator.decimate(300)
+
+    assert len(mins) == 300
+    assert (mins, maxs) == brute_force_decimate(values, 300)
+    assert min(mins) == min(values)
+    assert max(maxs) == max(values)
+
+
+def test_decimate_exact_columns(backend):
+    """Test that columns span exactly their data points if there are few data points per column"""
+
+    values = [random.uniform(-100, 100) for _ in range(2000)]
+    decimator = MinMaxDecimator(values)
+
+    columns = [values[i * 2000 // 300:(i + 1) * 2000 // 300] for i in range(300)]
+    assert decimator.decimate(300) == ([min(c) for c in columns], [max(c) for c in columns])
+
+
+def test_decimate_small_data(backend):
+    """Test decimating less data points than columns"""
+
+    decimator = MinMaxDecimator([3, 1, 2])
+
+    assert decimator.decimate(100) == ([3, 1, 2], [3, 1, 2])
+
+
+def test_decimate_append_incremental(backend):
+    """Test that appending data gives the same result as decimating all data at once"""
+
+    values = [random.uniform(-100, 100) for _ in range(5000)]
+    decimator = MinMaxDecimator(values[:777])
+    decimator.decimate(200)
+
+    for start in range(777, 5000, 333):
+        decimator.append(values[start:start + 333])
+        assert decimator.decimate(200) == brute_force_decimate(values[:start + 333], 200)
+
+    assert decimator.size() == 5000
+
+
+def test_slider_background_data(qtbot, backend):
+    """Test setting, appending and removing the background data of a slider"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setBackgroundData(range(1000))
+    assert slider.getBackgroundDataSize() == 1000
+
+    slider.appendBackgroundData([5, 10])
+    assert slider.getBackgroundDataSize() == 1002
+
+    # Simulate paint event and wait for event to be handled
+    with qtbot.capture_exceptions() as exceptions:
+        paint_event = QPaintEvent(QRect(0, 0, 0, 0))
+        qt_api.QtWidgets.QApplication.instance().postEvent(slider, paint_event)
+        QTest.qWait(100)
+    assert len(exceptions) == 0
+
+    slider.setBackgroundData(None)
+    assert slider.getBackgroundDataSize() == 0
@@ -0,0 +1,115 @@
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, ConstrainedSliderGroup, SumConstraint, OrderedConstraint
+
+
+def test_sum_constraint(qtbot):
+    """Test rebalancing sliders proportionally to keep their sum"""
+
+    group = ConstrainedSliderGroup()
+    for key, value in zip(['a', 'b', 'c'], [50, 30, 20]):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        group.addSlider(key, slider)
+
+    group.addConstraint(SumConstraint(['a', 'b', 'c'], 100))
+
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+    slider_emitted = []
+    group.getSlider('b').valueChanged.connect(slider_emitted.append)
+
+    # Moving one slider rebalances the others proportionally
+    group.getSlider('a').setValue(75)
+    assert group.getValues() == {'a': 75, 'b': 15, 'c': 10}
+
+    # Rounded shares still add up to the total
+    group.getSlider('a').setValue(66)
+    assert sum(group.getValues().values()) == 100
+
+    # Linked sliders don't emit on their own, the group emits once
+    assert slider_emitted == []
+    QTest.qWait(10)
+    assert len(emitted) == 1
+    assert emitted[0]['a'] == 66
+
+    # Others are distributed equally once they are all zero
+    group.setValues({'a': 100})
+    assert group.getValues() == {'a': 100, 'b': 0, 'c': 0}
+    group.setValues({'a': 40})
+    assert group.getValues() == {'a': 40, 'b': 30, 'c': 30}
+
+
+def test_sum_constraint_float(qtbot):
+    """Test rebalancing float sliders with decimals"""
+
+    group = ConstrainedSliderGroup()
+    for key, value in zip(['a', 'b', 'c'], [0, 0, 0]):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        group.addSlider(key, slider)
+
+    for key in group.getKeys():
+        group.getSlider(key).setFloat(True)
+        group.getSlider(key).setDecimals(1)
+        group.getSlider(key).setRange(0, 1)
+    group.addConstraint(SumConstraint(['a', 'b', 'c'], 1))
+
+    group.setValues({'a': 0.5})
+    assert group.getValues() == {'a': 0.5, 'b': 0.3, 'c': 0.2}
+
+    # Changed sliders exceeding the total are scaled down
+    group.setValues({'a': 0.9, 'b': 0.9})
+    assert group.getValues() == {'a': 0.5, 'b': 0.5, 'c': 0.0}
+
+
+def test_ordered_constraint(qtbot):
+    """Test pushing sliders along to keep them in order"""
+
+    group = ConstrainedSliderGroup()
+    for key, value in zip(['low', 'mid', 'high'], [20, 50, 80]):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        group.addSlider(key, slider)
+
+    group.addConstraint(OrderedConstraint(['low', 'mid', 'high']))
+
+    group.getSlider('low').setValue(90)
+    assert group.getValues() == {'low': 90, 'mid': 90, 'high': 90}
+
+    group.getSlider('high').setValue(10)
+    assert group.getValues() == {'low': 10, 'mid': 10, 'high': 10}
+
+    group.setValues({'mid': 60, 'low': 30})
+    assert group.getValues() == {'low': 30, 'mid': 60, 'high': 60}
+
+
+def test_chained_constraints(qtbot):
+    """Test that constraints are solved once in the order they have been added"""
+
+    group = ConstrainedSliderGroup()
+    for key, value in zip(['a', 'b', 'c'], [40, 40, 20]):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        group.addSlider(key, slider)
+
+    group.addConstraint(SumConstraint(['a', 'b'], 80))
+    group.addConstraint(OrderedConstraint(['a', 'b', 'c']))
+
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+
+    group.getSlider('a').setValue(30)
+    assert group.getValues() == {'a': 30, 'b': 50, 'c': 50}
+
+    QTest.qWait(10)
+    assert emitted == [{'a': 30, 'b': 50, 'c': 50}]
@@ -0,0 +1,209 @@
+import json
+from PyQt6.QtNetwork import QLocalSocket
+
+
+from src.pyqt_advanced_slider import Slider, RangeSlider, SliderGroup, ControlServer
+
+
+class Client:
+
+    def __init__(self, qtbot, name: str):
+        """Connect a local socket to the control server"""
+
+        self.qtbot = qtbot
+        self.socket = QLocalSocket()
+        self.socket.connectToServer(name)
+        assert self.socket.waitForConnected(1000)
+        self.messages = []
+        self.buffer = b''
+        self.socket.readyRead.connect(self.read)
+
+    def read(self):
+        """Collect the received messages"""
+
+        lines = (self.buffer + bytes(self.socket.readAll())).split(b'\n')
+        self.buffer = lines.pop()
+        self.messages += [json.loads(line) for line in lines]
+
+    def send(self, *commands):
+        """Send commands with one write"""
+
+        self.socket.write(b''.join(json.dumps(command).encode('utf-8') + b'\n' for command in commands))
+        self.socket.flush()
+
+    def wait(self, amount: int) -> list:
+        """Wait until the given amount of messages has been received"""
+
+        self.qtbot.waitUntil(lambda: len(self.messages) >= amount, timeout=2000)
+        return self.messages
+
+
+def test_set_get(qtbot, tmp_path):
+    """Test batched set and get commands"""
+
+    group = SliderGroup()
+    for index in range(16):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+    server = ControlServer(group, str(tmp_path / 'control'))
+    assert server.start()
+    assert server.isListening()
+    client = Client(qtbot, server.getServerName())
+
+    client.send({'id': 1, 'cmd': 'set', 'values': {'slider0': 10, 'slider5': 500}},
+                {'id': 2, 'cmd': 'get', 'keys': ['slider0', 'slider5']},
+                {'id': 3, 'cmd': 'get'})
+    messages = client.wait(3)
+
+    assert messages[0] == {'id': 1, 'ok': True, 'values': {'slider0': 10, 'slider5': 100}}
+    assert messages[1] == {'id': 2, 'ok': True, 'values': {'slider0': 10, 'slider5': 100}}
+    assert len(messages[2]['values']) == 16
+    assert group.getSlider('slider5').getValue() == 100
+    assert server.getClientCount() == 1
+
+    # Errors are reported without closing the connection
+    client.send({'id': 4, 'cmd': 'set', 'values': {'unknown': 1}}, {'cmd': 'jump'})
+    client.socket.write(b'invalid json\n')
+    messages = client.wait(6)
+    assert messages[3]['id'] == 4 and not messages[3]['ok']
+    assert not messages[4]['ok']
+    assert not messages[5]['ok']
+
+    server.close()
+
+
+def test_set_batch(qtbot, tmp_path):
+    """Test that the set commands of one read are applied with one setValues call"""
+
+    class CountingGroup(SliderGroup):
+
+        def __init__(self):
+            super(CountingGroup, self).__init__()
+            self.batches = []
+
+        def setValues(self, values: dict):
+            self.batches.append(dict(values))
+            super(CountingGroup, self).setValues(values)
+
+    group = CountingGroup()
+    for index in range(3):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+    server = ControlServer(group, str(tmp_path / 'control'))
+    assert server.start()
+    client = Client(qtbot, server.getServerName())
+
+    client.send({'id': 1, 'cmd': 'set', 'values': {'slider0': 5}},
+                {'id': 2, 'cmd': 'set', 'values': {'slider1': 30}},
+                {'id': 3, 'cmd': 'set', 'values': {'slider0': 10, 'slider2': 40}},
+                {'id': 4, 'cmd': 'set', 'values': {'slider2': 'loud'}})
+    messages = client.wait(4)
+
+    # Setting a slider of the current batch again starts a new batch
+    assert group.batches == [{'slider0': 5, 'slider1': 30}, {'slider0': 10, 'slider2': 40}]
+    assert messages[0] == {'id': 1, 'ok': True, 'values': {'slider0': 5}}
+    assert messages[1] == {'id': 2, 'ok': True, 'values': {'slider1': 30}}
+    assert messages[2] == {'id': 3, 'ok': True, 'values': {'slider0': 10, 'slider2': 40}}
+    assert messages[3]['id'] == 4 and not messages[3]['ok']
+    assert group.getSlider('slider2').getValue() == 40
+
+    server.close()
+
+
+def test_command_order(qtbot, tmp_path):
+    """Test that every response contains the state at its place in the stream"""
+
+    group = SliderGroup()
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setRange(0, 100)
+    group.addSlider('a', slider)
+
+    server = ControlServer(group, str(tmp_path / 'control'))
+    assert server.start()
+    client = Client(qtbot, server.getServerName())
+
+    client.send({'id': 1, 'cmd': 'get', 'keys': ['a']},
+                {'id': 2, 'cmd': 'set', 'values': {'a': 10}},
+                {'id': 3, 'cmd': 'set', 'values': {'a': 20}},
+                {'id': 4, 'cmd': 'get', 'keys': ['a']})
+    messages = client.wait(4)
+
+    assert [message['values'] for message in messages] == [{'a': 0}, {'a': 10}, {'a': 20}, {'a': 20}]
+    server.close()
+
+
+def test_rejected_values(qtbot, tmp_path):
+    """Test that values rejected by a slider are reported for the failing command only"""
+
+    group = SliderGroup()
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setRange(0, 100)
+    group.addSlider('a', slider)
+    range_slider = RangeSlider()
+    qtbot.addWidget(range_slider)
+    range_slider.setRange(0, 100)
+    group.addSlider('range', range_slider)
+
+    server = ControlServer(group, str(tmp_path / 'control'))
+    failures = []
+    server.requestFailed.connect(failures.append)
+    assert server.start()
+    client = Client(qtbot, server.getServerName())
+
+    client.send({'id': 1, 'cmd': 'set', 'values': {'a': 10}},
+                {'id': 2, 'cmd': 'set', 'values': {'range': 5}},
+                {'id': 3, 'cmd': 'get'})
+    messages = client.wait(3)
+
+    assert messages[0] == {'id': 1, 'ok': True, 'values': {'a': 10}}
+    assert messages[1]['id'] == 2 and not messages[1]['ok']
+    assert messages[2]['values'] == {'a': 10, 'range': [0, 10]}
+    assert len(failures) == 1
+
+    # The signals of the rejecting slider are not left blocked
+    assert not range_slider.signalsBlocked()
+    server.close()
+
+
+def test_subscribe(qtbot, tmp_path):
+    """Test streaming coalesced value changes to subscribers"""
+
+    group = SliderGroup()
+    for index in range(4):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+    server = ControlServer(group, str(tmp_path / 'control'))
+    assert server.start()
+    assert server.isListening()
+    subscriber = Client(qtbot, server.getServerName())
+    subscriber.send({'cmd': 'subscribe'})
+    subscriber.wait(1)
+    qtbot.waitUntil(lambda: server.getSubscriberCount() == 1, timeout=2000)
+
+    # Many changes in one event loop iteration are streamed as one event
+    for value in range(50):
+        group.getSlider('slider1').setValue(value)
+    group.getSlider('slider2').setValue(7)
+
+    messages = subscriber.wait(2)
+    assert messages[1] == {'event': 'valuesChanged', 'values': {'slider1': 49, 'slider2': 7}}
+
+    subscriber.send({'cmd': 'unsubscribe'})
+    subscriber.wait(3)
+    assert server.getSubscriberCount() == 0
+
+    # Disconnected clients are removed
+    subscriber.socket.disconnectFromServer()
+    qtbot.waitUntil(lambda: server.getClientCount() == 0, timeout=2000)
+    server.close()
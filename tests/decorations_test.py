@@ -0,0 +1,191 @@
+import threading
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QPaintEvent, QFont
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+
+
+from src.pyqt_advanced_slider import Slider, DecorationLayer, DecorationRenderer, TickLayer, RenderContext
+
+
+class RecordingLayer(DecorationLayer):
+    """Layer recording the threads and sizes it has been rendered with"""
+
+    def __init__(self, z=DecorationLayer.BELOW_VALUE, asynchronous=True):
+        super().__init__(z, asynchronous)
+        self.renders = []
+
+    def snapshot(self, context):
+        return context.width
+
+    def render(self, painter, context, state):
+        self.renders.append((threading.get_ident(), state))
+
+
+def repaint(slider):
+    """Simulate paint event and wait for event to be handled"""
+
+    paint_event = QPaintEvent(QRect(0, 0, 0, 0))
+    qt_api.QtWidgets.QApplication.instance().postEvent(slider, paint_event)
+    QTest.qWait(50)
+
+
+def test_asynchronous_layer(qtbot):
+    """Test that asynchronous layers are rendered off the GUI thread and cached"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    layer = RecordingLayer()
+    slider.addDecorationLayer(layer)
+    repaint(slider)
+    qtbot.waitUntil(lambda: len(layer.renders) == 1 and not slider.isRenderingDecorations())
+
+    assert layer.renders[0][0] != threading.get_ident()
+    assert layer.renders[0][1] == slider.width()
+
+    # Repainting with the same size uses the cached image
+    slider.setValue(5)
+    repaint(slider)
+    assert len(layer.renders) == 1
+
+    # Invalidating renders the layer again
+    layer.invalidate()
+    repaint(slider)
+    qtbot.waitUntil(lambda: len(layer.renders) == 2)
+
+    # Removed layers are not rendered anymore
+    slider.removeDecorationLayer(layer)
+    layer.invalidate()
+    repaint(slider)
+    assert len(layer.renders) == 2
+    assert slider.getDecorationLayers() == []
+
+
+def test_synchronous_layer(qtbot):
+    """Test that synchronous layers are rendered on the GUI thread during the paint event"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    layer = RecordingLayer(DecorationLayer.ABOVE_VALUE, asynchronous=False)
+    slider.addDecorationLayer(layer)
+    repaint(slider)
+
+    assert layer.renders == [(threading.get_ident(), slider.width())]
+
+    slider.resize(slider.width() + 10, slider.height())
+    repaint(slider)
+
+    assert layer.renders[-1] == (threading.get_ident(), slider.width())
+
+
+def test_background_data_layer(qtbot):
+    """Test that the background data is rendered as a decoration layer"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setBackgroundData(range(1000))
+    assert len(slider.getDecorationLayers()) == 1
+
+    repaint(slider)
+    qtbot.waitUntil(lambda: not slider.isRenderingDecorations())
+
+    slider.setBackgroundData(None)
+    assert slider.getDecorationLayers() == []
+
+
+def test_renderer_device_pixel_ratio(qtbot):
+    """Test that layers are rendered in device pixels and cached per device pixel ratio"""
+
+    renderer = DecorationRenderer()
+    layer = RecordingLayer(asynchronous=False)
+
+    image = renderer.image(layer, RenderContext(100, 20, 2.0, 0, 10, QFont()))
+    assert image.width() == 200
+    assert image.height() == 40
+    assert image.devicePixelRatio() == 2.0
+
+    image = renderer.image(layer, RenderContext(100, 20, 1.0, 0, 10, QFont()))
+    assert image.width() == 100
+    assert image.devicePixelRatio() == 1.0
+
+    # Moving back to the first screen uses the cached image
+    renderer.image(layer, RenderContext(100, 20, 2.0, 0, 10, QFont()))
+    assert len(layer.renders) == 2
+
+
+def test_tick_layer(qtbot):
+    """Test that tick positions and labels are computed once per size, range and format"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(400, 30)
+
+    slider.setRange(0, 100)
+    slider.setTickInterval(25, 5)
+    slider.showTickLabels(True)
+    slider.setSuffix('%')
+
+    assert slider.getTickInterval() == (25, 5)
+    assert slider.isShowingTickLabels()
+
+    tick_layer = [layer for layer in slider.getDecorationLayers() if isinstance(layer, TickLayer)][0]
+    snapshots = []
+    original_snapshot = tick_layer.snapshot
+    tick_layer.snapshot = lambda context: snapshots.append(original_snapshot(context)) or snapshots[-1]
+
+    repaint(slider)
+    assert len(snapshots) == 1
+    major, minor, labels, color = snapshots[0]
+    assert major == [0, 100, 200, 300, 400]
+    assert len(minor) == 16
+    assert [text for _, text in labels] == ['0%', '25%', '50%', '75%', '100%']
+
+    # Changing the value reuses the cached layer
+    slider.setValue(50)
+    repaint(slider)
+    assert len(snapshots) == 1
+
+    # Changing the format or range computes the ticks again
+    slider.setSuffix(' dB')
+    repaint(slider)
+    assert len(snapshots) == 2
+    slider.setRange(0, 50)
+    repaint(slider)
+    assert len(snapshots) == 3
+    assert snapshots[-1][0] == [0, 200, 400]
+
+    # Explicit positions
+    slider.setTickPositions([10, 20], [15])
+    repaint(slider)
+    assert snapshots[-1][0] == [80, 160]
+    assert snapshots[-1][1] == [120]
+    assert slider.getTickPositions() == ([10, 20], [15])
+
+
+def test_tick_layer_float_interval(qtbot):
+    """Test that float intervals get ticks at the bounds of the range"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(400, 30)
+    slider.setFloat(True)
+    slider.setRange(0, 1)
+    slider.setTickInterval(0.1)
+
+    tick_layer = [layer for layer in slider.getDecorationLayers() if isinstance(layer, TickLayer)][0]
+    snapshots = []
+    original_snapshot = tick_layer.snapshot
+    tick_layer.snapshot = lambda context: snapshots.append(original_snapshot(context)) or snapshots[-1]
+
+    repaint(slider)
+    assert len(snapshots[-1][0]) == 11
+    assert snapshots[-1][0][-1] == 400
+
+    slider.setRange(0.3, 0.9)
+    repaint(slider)
+    assert len(snapshots[-1][0]) == 7
+    assert snapshots[-1][0][0] == 0
+    assert snapshots[-1][0][-1] == 400
@@ -0,0 +1,108 @@
+import pytest
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, DerivedSliderGroup
+
+
+def test_derived_range(qtbot):
+    """Test deriving the range of a slider from another slider"""
+
+    group = DerivedSliderGroup()
+    for key in ['a', 'b']:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider(key, slider)
+
+    group.getSlider('a').setValue(50)
+    group.getSlider('b').setValue(40)
+
+    # Deriving computes the range immediately
+    group.setDerivedRange('b', lambda a: (0, a), ['a'])
+    assert group.getSlider('b').getRange() == (0, 50)
+
+    emitted = []
+    group.getSlider('b').valueChanged.connect(emitted.append)
+
+    group.getSlider('a').setValue(20)
+    assert group.getSlider('b').getRange() == (0, 20)
+    assert group.getSlider('b').getValue() == 20
+    assert emitted == [20]
+
+
+def test_propagation_order(qtbot):
+    """Test that every dependent slider is recomputed once in topological order"""
+
+    group = DerivedSliderGroup()
+    for key in ['a', 'b', 'c', 'd']:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider(key, slider)
+
+
+    calls = []
+
+    def derive(name, fn):
+        def wrapper(*values):
+            calls.append(name)
+            return fn(*values)
+        return wrapper
+
+    # Diamond: a -> b, a -> c, (b, c) -> d
+    group.setDerivedValue('d', derive('d', lambda b, c: b + c), ['b', 'c'])
+    group.setDerivedValue('b', derive('b', lambda a: a // 2), ['a'])
+    group.setDerivedValue('c', derive('c', lambda a: a // 4), ['a'])
+    assert group.getDependencies('d') == {'b', 'c'}
+
+    order = group.getEvaluationOrder()
+    assert order.index('a') < order.index('b') < order.index('d')
+    assert order.index('c') < order.index('d')
+
+    emitted = []
+    group.getSlider('d').valueChanged.connect(emitted.append)
+    group.valuesChanged.connect(emitted.append)
+    calls.clear()
+
+    group.getSlider('a').setValue(40)
+    assert group.getValues() == {'a': 40, 'b': 20, 'c': 10, 'd': 30}
+    assert sorted(calls) == ['b', 'c', 'd']
+    assert emitted == [30]
+
+    # The group emits all changes at once
+    QTest.qWait(10)
+    assert emitted[1] == {'a': 40, 'b': 20, 'c': 10, 'd': 30}
+
+    # Batched changes propagate once
+    calls.clear()
+    group.setValues({'a': 80, 'b': 10})
+    assert sorted(calls) == ['b', 'c', 'd']
+
+
+def test_cycle_detection(qtbot):
+    """Test that cyclic dependencies are rejected"""
+
+    group = DerivedSliderGroup()
+    for key in ['a', 'b', 'c']:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider(key, slider)
+
+    group.setDerivedValue('b', lambda a: a, ['a'])
+    group.setDerivedValue('c', lambda b: b, ['b'])
+
+    with pytest.raises(ValueError):
+        group.setDerivedRange('a', lambda c: (0, c), ['c'])
+
+    # The graph is unchanged after a rejected dependency
+    assert group.getDependencies('a') == set()
+    group.getSlider('a').setValue(70)
+    assert group.getSlider('c').getValue() == 70
+
+    # Sources can't be removed while sliders are derived from them
+    with pytest.raises(ValueError):
+        group.removeSlider('a')
+    group.removeDerivedValue('b')
+    group.removeSlider('a')
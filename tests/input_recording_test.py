@@ -0,0 +1,91 @@
+from PyQt6.QtCore import Qt, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+
+
+from src.pyqt_advanced_slider import Slider, InputRecorder, InputReplayer
+
+
+def record_session(qtbot, slider: Slider) -> list[dict]:
+    """Record a session with mouse drags, keys and wheel input"""
+
+    recorder = InputRecorder(slider)
+    recorder.start()
+    assert recorder.isRecording()
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(20, 5))
+    for x in range(20, 120, 10):
+        QTest.mouseMove(slider, pos=QPoint(x, 5))
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(120, 5))
+    QTest.keyClick(slider, Qt.Key.Key_Right)
+    QTest.keyClick(slider, Qt.Key.Key_PageDown)
+    wheel_event = QWheelEvent(QPointF(5, 5), slider.mapToGlobal(QPointF(5, 5)), QPoint(0, 0), QPoint(0, 120),
+                              Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                              Qt.ScrollPhase.NoScrollPhase, False)
+    qt_api.QtWidgets.QApplication.instance().sendEvent(slider, wheel_event)
+
+    recorder.stop()
+    assert not recorder.isRecording()
+    return recorder.getEvents()
+
+
+def test_record(qtbot, tmp_path):
+    """Test recording input events with timing"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setRange(0, 100)
+    slider.show()
+    QTest.qWait(10)
+    events = record_session(qtbot, slider)
+
+    types = [event['type'] for event in events]
+    assert types[0] == 'mousePress'
+    assert types.count('mouseRelease') == 1
+    assert 'keyPress' in types and 'keyRelease' in types
+    assert types[-1] == 'wheel'
+    assert [event['time'] for event in events] == sorted(event['time'] for event in events)
+
+    # Recorded events can be saved and loaded
+    recorder = InputRecorder(slider)
+    recorder.start()
+    QTest.keyClick(slider, Qt.Key.Key_End)
+    recorder.stop()
+    recorder.save(str(tmp_path / 'session.json'))
+    assert InputRecorder.load(str(tmp_path / 'session.json')) == recorder.getEvents()
+
+
+def test_replay(qtbot):
+    """Test that replaying a session reproduces the value and reports counts"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setRange(0, 100)
+    slider.show()
+    QTest.qWait(10)
+    events = record_session(qtbot, slider)
+    final_value = slider.getValue()
+
+    replay_slider = Slider()
+    qtbot.addWidget(replay_slider)
+    replay_slider.resize(200, 30)
+    replay_slider.setRange(0, 100)
+    replay_slider.show()
+    QTest.qWait(10)
+    replayer = InputReplayer(replay_slider)
+    result = replayer.replay(events, speed=0)
+
+    assert replay_slider.getValue() == final_value
+    assert result['events'] == len(events)
+    assert result['emissions'] > 0
+    assert result['paints'] > 0
+    assert result['handler_time_max'] >= result['handler_time_mean'] >= 0
+
+    # Accelerated replay keeps the relative timing
+    replay_slider.setValue(0)
+    result = replayer.replay(events, speed=4)
+    assert replay_slider.getValue() == final_value
+    assert result['duration'] >= events[-1]['time'] / 4
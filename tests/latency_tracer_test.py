@@ -0,0 +1,138 @@
+import json
+import time
+from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtGui import QPaintEvent
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, RangeSlider, MultiSlider, SliderGroup, LatencyHistogram, LatencyTracer
+
+
+def test_histogram_percentiles():
+    """Test the percentiles of the logarithmic histogram"""
+
+    histogram = LatencyHistogram()
+    assert histogram.toDict()['p50'] == 0.0
+
+    for index in range(100):
+        histogram.add(0.001 if index < 90 else 0.1)
+
+    statistics = histogram.toDict()
+    assert statistics['count'] == 100
+    assert statistics['max'] == 0.1
+    assert abs(statistics['mean'] - 0.0109) < 1e-9
+    # Percentiles are exact up to the bucket resolution
+    assert 0.001 <= statistics['p50'] <= 0.001 * LatencyHistogram.GROWTH
+    assert statistics['p95'] == statistics['p99'] == 0.1
+    assert sum(count for _, count in statistics['buckets']) == 100
+
+    # Durations out of the bucket range are kept
+    histogram.reset()
+    histogram.add(0.0)
+    histogram.add(1000.0)
+    assert histogram.count() == 2
+    assert histogram.percentile(100) == 1000.0
+
+
+def test_input_to_paint_latency(qtbot):
+    """Test that inputs are timed until the paint reflecting them"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setSingleStep(1)
+
+    tracer = LatencyTracer()
+    tracer.addSlider('gain', slider)
+    assert slider.getLatencyTracer() is tracer
+
+    # Two inputs reflected by one paint
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    time.sleep(0.01)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    latency = tracer.getLatency('gain')
+    assert latency['count'] == 2
+    assert latency['p50'] >= 0.01
+
+    # Inputs that do not change the value are not traced
+    QTest.keyPress(slider, Qt.Key.Key_Home)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    QTest.keyPress(slider, Qt.Key.Key_Home)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    assert tracer.getLatency('gain')['count'] == 3
+
+    # Mouse inputs are traced
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(150, 1))
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    assert tracer.getLatency('gain')['count'] == 4
+    assert tracer.getLatency()['count'] == 4
+
+    tracer.removeSlider('gain')
+    assert slider.getLatencyTracer() is None
+    assert tracer.getKeys() == []
+
+
+def test_range_and_multi_sliders(qtbot):
+    """Test tracing the latency and handler time of range and multi sliders"""
+
+    range_slider = RangeSlider()
+    multi_slider = MultiSlider()
+    for slider in (range_slider, multi_slider):
+        qtbot.addWidget(slider)
+        slider.resize(200, 30)
+        slider.setRange(0, 100)
+        slider.setSingleStep(1)
+    multi_slider.setHandleValues([20, 80])
+    QTest.qWait(10)
+
+    tracer = LatencyTracer()
+    tracer.addSlider('range', range_slider)
+    tracer.addSlider('multi', multi_slider)
+
+    for slider in (range_slider, multi_slider):
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(150, 1))
+        QTest.mouseMove(slider, pos=QPoint(120, 1))
+        QTest.keyPress(slider, Qt.Key.Key_Left)
+        slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    QTest.qWait(10)
+
+    assert tracer.getLatency('range')['count'] == 3
+    assert tracer.getLatency('multi')['count'] == 3
+    assert tracer.getHandlerTime('range')['count'] == 3
+    assert tracer.getHandlerTime('multi')['count'] == 1
+
+
+def test_handler_time(qtbot, tmp_path):
+    """Test that the time of downstream valueChanged handlers is measured separately"""
+
+    group = SliderGroup()
+    fast_slider = Slider()
+    slow_slider = Slider()
+    qtbot.addWidget(fast_slider)
+    qtbot.addWidget(slow_slider)
+    group.addSlider('fast', fast_slider)
+    group.addSlider('slow', slow_slider)
+    slow_slider.valueChanged.connect(lambda value: time.sleep(0.02))
+
+    tracer = LatencyTracer()
+    tracer.addGroup(group)
+    assert tracer.getKeys() == ['fast', 'slow']
+
+    fast_slider.setValue(3)
+    slow_slider.setValue(3)
+    assert tracer.getHandlerTime('fast')['max'] < 0.02
+    assert tracer.getHandlerTime('slow')['max'] >= 0.02
+    assert tracer.getHandlerTime()['count'] == 2
+
+    path = tmp_path / 'latency.json'
+    tracer.dump(str(path))
+    with open(path, 'r', encoding='utf-8') as file:
+        dumped = json.load(file)
+    assert dumped['handler_time']['count'] == 2
+    assert dumped['sliders']['slow']['handler_time']['count'] == 1
+    assert dumped['sliders']['slow']['latency']['count'] == 0
+
+    tracer.reset()
+    assert tracer.getHandlerTime()['count'] == 0
+    assert tracer.getHandlerTime('slow')['count'] == 0
@@ -0,0 +1,204 @@
+from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtGui import QPaintEvent
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+
+
+from src.pyqt_advanced_slider import MultiSlider
+
+
+def test_initial_values(qtbot):
+    """Test initial values after instantiating"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    assert slider.getRange() == (0, 10)
+    assert slider.getValue() == []
+    assert slider.getHandleCount() == 0
+    assert slider.getActiveHandle() is None
+    assert slider.getNearestHandle(10) is None
+    assert slider.getValueFormatted() == ''
+
+
+def test_handles(qtbot):
+    """Test adding, setting and removing handles"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setHandleValues([70, 10, 500, 40])
+    assert slider.getHandleValues() == [10, 40, 70, 100]
+
+    # New handles are inserted in order
+    assert slider.addHandle(50) == 2
+    assert slider.getValue() == [10, 40, 50, 70, 100]
+
+    # Handles can't pass their neighbors
+    slider.setHandleValue(1, 60)
+    assert slider.getHandleValue(1) == 50
+    slider.setHandleValue(1, -5)
+    assert slider.getHandleValue(1) == 10
+
+    slider.removeHandle(0)
+    assert slider.getValue() == [10, 50, 70, 100]
+
+    # Changing the range clamps the handles
+    slider.setRange(20, 60)
+    assert slider.getValue() == [20, 50, 60, 60]
+
+
+def test_nearest_handle(qtbot):
+    """Test finding the nearest handle by bisection"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    slider.resize(1000, 30)
+    slider.setRange(0, 1000)
+    slider.setHandleValues(range(0, 1001, 10))
+
+    assert slider.getNearestHandle(-50) == 0
+    assert slider.getNearestHandle(2000) == 100
+    assert slider.getNearestHandle(504) == 50
+    assert slider.getNearestHandle(506) == 51
+
+    # Handles on top of each other: the one that can move towards the position wins
+    slider.setHandleValues([50, 50, 50])
+    assert slider.getNearestHandle(10) == 0
+    assert slider.getNearestHandle(900) == 2
+
+
+def test_coalesced_emission(qtbot):
+    """Test that all changes of one event loop iteration are emitted once"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setHandleValues([10, 50, 90])
+    QTest.qWait(10)
+
+    emitted = []
+    values = []
+    slider.valuesChanged.connect(emitted.append)
+    slider.valueChanged.connect(values.append)
+
+    slider.setHandleValue(0, 20)
+    slider.setHandleValue(0, 30)
+    slider.setHandleValue(2, 80)
+
+    # Nothing is emitted before returning to the event loop
+    assert emitted == []
+    QTest.qWait(10)
+    assert emitted == [{0: 30, 2: 80}]
+    assert values == [[30, 50, 80]]
+
+    # Setting the same value does not emit
+    slider.setHandleValue(1, 50)
+    QTest.qWait(10)
+    assert len(emitted) == 1
+
+
+def test_batch_order(qtbot):
+    """Test that batched handles are not blocked by neighbors moving out of their way"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setHandleValues([1, 2])
+    slider.setHandleValuesBatch({0: 50, 1: 60})
+    assert slider.getValue() == [50, 60]
+
+    slider.setHandleValuesBatch({1: 10, 0: 5})
+    assert slider.getValue() == [5, 10]
+
+    # Handles moving down and up in one batch
+    slider.setHandleValues([10, 20, 30, 40])
+    slider.setHandleValuesBatch({3: 90, 2: 80, 1: 15, 0: 12})
+    assert slider.getValue() == [12, 15, 80, 90]
+    slider.setHandleValuesBatch({0: 16, 1: 17, 2: 18})
+    assert slider.getValue() == [16, 17, 18, 90]
+
+
+def test_mouse_and_keyboard(qtbot):
+    """Test that the mouse moves the nearest handle and the keyboard moves the active handle"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setHandleValues([20, 50, 80])
+    width = slider.width()
+
+    # Pressing near the middle handle moves it and makes it active
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(width * 0.4), 1))
+    assert slider.getValue() == [20, 40, 80]
+    assert slider.getActiveHandle() == 1
+
+    # Dragging stops at the neighbor handle
+    QTest.mouseMove(slider, pos=QPoint(int(width * 0.1), 1))
+    assert slider.getValue() == [20, 20, 80]
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(width * 0.1), 1))
+
+    QTest.keyPress(slider, Qt.Key.Key_PageUp)
+    assert slider.getValue() == [20, 25, 80]
+    QTest.keyPress(slider, Qt.Key.Key_End)
+    assert slider.getValue() == [20, 80, 80]
+
+
+def test_partial_repaint(qtbot):
+    """Test that moving a handle only redraws the span around it"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+    slider.show()
+
+    slider.resize(400, 30)
+    slider.setRange(0, 400)
+    slider.setHandleValues(range(0, 401, 4))
+    slider.setActiveHandle(50)
+
+    with qtbot.capture_exceptions() as exceptions:
+        QTest.qWait(50)
+        slider.setHandleValue(50, 201)
+        paint_event = QPaintEvent(QRect(0, 0, 0, 0))
+        qt_api.QtWidgets.QApplication.instance().postEvent(slider, paint_event)
+        QTest.qWait(50)
+
+    assert len(exceptions) == 0
+    assert slider.getValuePosition()[50] == 201
+
+    # Handles outside of the span keep their pixels, the moved handle is drawn at its new position
+    image = slider.findChild(qt_api.QtWidgets.QLabel).pixmap().toImage()
+    ratio = image.devicePixelRatio()
+    accent = slider.getAccentColor().rgb()
+    assert image.pixelColor(int(201 * ratio), int(2 * ratio)).rgb() == accent
+    assert image.pixelColor(int(100 * ratio), int(2 * ratio)).rgb() == accent
+
+
+def test_render_stats(qtbot):
+    """Test that input events and coalesced emissions of the multi slider are counted"""
+
+    slider = MultiSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setRange(0, 100)
+    slider.setHandleValues([20, 80])
+    slider.setSingleStep(1)
+    QTest.qWait(10)
+    slider.setInstrumentationEnabled(True)
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(150, 1))
+    QTest.mouseMove(slider, pos=QPoint(150, 1))
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(160, 1))
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    QTest.keyPress(slider, Qt.Key.Key_Shift)
+    QTest.qWait(10)
+
+    stats = slider.renderStats()
+    assert stats['inputs_handled'] == 4
+    assert stats['inputs_coalesced'] == 1
+    assert stats['emissions'] == 1
@@ -0,0 +1,120 @@
+import pytest
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, RangeSlider, SliderGroup, ParameterBank
+
+
+def test_bind_slider(qtbot, tmp_path):
+    """Test that value changes land in the bank file without saving"""
+
+    path = str(tmp_path / 'bank.bin')
+    bank = ParameterBank(path, 8)
+    assert bank.getRecordCount() == 8
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setFloat(True)
+    slider.setRange(0, 100)
+    slider.setValue(25)
+    bank.bindSlider(slider, 3)
+    assert bank.readRecord(3) == (25.0, ParameterBank.VALID_FLAG)
+    assert not bank.isValid(0)
+
+    # Setting values and user input are written immediately
+    slider.setValue(42.5)
+    assert bank.read(3) == 42.5
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(slider.width(), 1))
+    assert bank.read(3) == 100.0
+
+    # The file holds the value without flushing or closing
+    reopened = ParameterBank(path, 8)
+    assert reopened.read(3) == 100.0
+    reopened.close()
+
+    bank.unbindSlider(3)
+    slider.setValue(10)
+    assert bank.read(3) == 100.0
+
+    with pytest.raises(IndexError):
+        bank.bindSlider(slider, 8)
+
+    # Sliders with multiple values are rejected
+    range_slider = RangeSlider()
+    qtbot.addWidget(range_slider)
+    with pytest.raises(TypeError):
+        bank.bindSlider(range_slider, 0)
+    bank.close()
+
+
+def test_restore(qtbot, tmp_path):
+    """Test restoring sliders from an existing bank"""
+
+    path = str(tmp_path / 'bank.bin')
+    bank = ParameterBank(path, 2)
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setFloat(True)
+    slider.setRange(0, 100)
+    bank.bindSlider(slider, 0)
+    bank.write(1, 75.5)
+    bank.close()
+
+    # Growing an existing bank keeps its records
+    bank = ParameterBank(path, 4)
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setFloat(True)
+    slider.setRange(0, 100)
+    bank.bindSlider(slider, 1)
+    assert slider.getValue() == 75.5
+    assert not bank.isValid(3)
+    bank.close()
+
+    with open(str(tmp_path / 'other.bin'), 'wb') as file:
+        file.write(b'not a parameter bank')
+    with pytest.raises(ValueError):
+        ParameterBank(str(tmp_path / 'other.bin'), 2)
+
+
+def test_bind_group(qtbot, tmp_path):
+    """Test that values applied by a group land in the bank and are restored as one batch"""
+
+    path = str(tmp_path / 'bank.bin')
+    bank = ParameterBank(path, 4)
+    group = SliderGroup()
+    for key in ['a', 'b']:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 10)
+        group.addSlider(key, slider)
+    preset = group.saveState()
+
+    assert bank.bindGroup(group) == {'a': 0, 'b': 1}
+    assert bank.isValid(0) and bank.isValid(1)
+
+    group.setValues({'a': 7, 'b': 3})
+    QTest.qWait(10)
+    assert (bank.read(0), bank.read(1)) == (7.0, 3.0)
+
+    group.restoreState(preset)
+    assert (bank.read(0), bank.read(1)) == (0.0, 0.0)
+    group.setValues({'a': 5, 'b': 6})
+    QTest.qWait(10)
+    bank.close()
+
+    # Restoring emits the stored values once
+    bank = ParameterBank(path, 4)
+    group = SliderGroup()
+    for key in ['a', 'b']:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 10)
+        group.addSlider(key, slider)
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+    bank.bindGroup(group, {'b': 1, 'a': 0})
+    assert group.getValues() == {'a': 5, 'b': 6}
+    assert emitted == [{'a': 5, 'b': 6}]
+    bank.close()
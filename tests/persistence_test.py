@@ -0,0 +1,118 @@
+import json
+import os
+from PyQt6.QtCore import QSettings
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import (Slider, SliderGroup, SliderPersistence, JsonFileBackend,
+                                      SettingsBackend, PersistenceBackend)
+
+
+class RecordingBackend(PersistenceBackend):
+
+    def __init__(self, values=None):
+        """Backend keeping all writes in memory"""
+
+        self.values = dict(values or {})
+        self.writes = []
+
+    def load(self) -> dict:
+        return dict(self.values)
+
+    def store(self, values: dict):
+        self.writes.append(dict(values))
+        self.values.update(values)
+
+
+def test_write_behind(qtbot):
+    """Test that changes are coalesced and written once after the idle interval"""
+
+    backend = RecordingBackend({'a': 30})
+    persistence = SliderPersistence(backend, idle_interval=50)
+
+    slider_a = Slider()
+    qtbot.addWidget(slider_a)
+    slider_a.setRange(0, 100)
+    slider_b = Slider()
+    qtbot.addWidget(slider_b)
+    slider_b.setRange(0, 100)
+    persistence.addSlider('a', slider_a)
+    persistence.addSlider('b', slider_b)
+    assert slider_a.getValue() == 30
+
+    # Dragging does not write
+    for value in range(60):
+        slider_a.setValue(value)
+        slider_b.setValue(100 - value)
+    assert backend.writes == []
+    assert persistence.getPendingCount() == 2
+
+    qtbot.waitUntil(lambda: len(backend.writes) == 1, timeout=1000)
+    assert backend.writes == [{'a': 59, 'b': 41}]
+    assert persistence.getStoredValue('a') == 59
+
+    # Committing writes immediately
+    slider_a.setValue(5)
+    persistence.commit()
+    assert backend.writes[-1] == {'a': 5}
+    assert persistence.getPendingCount() == 0
+
+    persistence.close()
+    slider_a.setValue(6)
+    QTest.qWait(100)
+    assert len(backend.writes) == 2
+
+
+def test_group(qtbot):
+    """Test persisting a group with its coalesced changes"""
+
+    backend = RecordingBackend({'0': 10, '1': 20})
+    persistence = SliderPersistence(backend, idle_interval=10000)
+
+    group = SliderGroup()
+    for index in range(3):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider(index, slider)
+    persistence.addGroup(group)
+    assert group.getValues() == {0: 10, 1: 20, 2: 0}
+
+    group.setValues({1: 50, 2: 60})
+    QTest.qWait(10)
+    persistence.commit()
+    assert backend.writes == [{'1': 50, '2': 60}]
+
+
+def test_json_file_backend(qtbot, tmp_path):
+    """Test atomically replacing a JSON file"""
+
+    path = str(tmp_path / 'sliders.json')
+    backend = JsonFileBackend(path)
+    assert backend.load() == {}
+
+    backend.store({'a': 1})
+    backend.store({'b': 2.5})
+    with open(path, 'r', encoding='utf-8') as file:
+        assert json.load(file) == {'a': 1, 'b': 2.5}
+
+    # No temporary files are left behind
+    assert os.listdir(str(tmp_path)) == ['sliders.json']
+
+    persistence = SliderPersistence(JsonFileBackend(path, atomic=False))
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setRange(0, 100)
+    persistence.addSlider('a', slider)
+    assert slider.getValue() == 1
+
+
+def test_settings_backend(qtbot, tmp_path):
+    """Test persisting values with QSettings"""
+
+    settings = QSettings(str(tmp_path / 'sliders.ini'), QSettings.Format.IniFormat)
+    backend = SettingsBackend(settings, group='mixer')
+    backend.store({'volume': 80, 'pan': -0.5})
+
+    reloaded = SettingsBackend(QSettings(str(tmp_path / 'sliders.ini'), QSettings.Format.IniFormat), group='mixer')
+    assert reloaded.load() == {'volume': 80, 'pan': -0.5}
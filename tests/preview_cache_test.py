@@ -0,0 +1,81 @@
+import threading
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtGui import QImage
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, PreviewCache
+
+
+def create_image(value):
+    """Create a small preview image"""
+
+    image = QImage(4, 4, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    image.setText('value', str(value))
+    return image
+
+
+def test_preview_cache_lru_eviction(qtbot):
+    """Test that the least recently used previews are evicted"""
+
+    cache = PreviewCache(create_image, capacity=2, prefetch=0)
+
+    for bucket in range(3):
+        with qtbot.waitSignal(cache.previewReady):
+            cache.request(bucket)
+        # Touch bucket 0 so that bucket 1 becomes least recently used
+        cache.get(0)
+
+    assert cache.size() == 2
+    assert cache.get(0) is not None
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+    cache.shutdown()
+
+
+def test_preview_cache_prefetch_direction(qtbot):
+    """Test that neighboring buckets are prefetched in the drag direction only"""
+
+    requested = []
+    lock = threading.Lock()
+
+    def provider(bucket):
+        with lock:
+            requested.append(bucket)
+        return create_image(bucket)
+
+    cache = PreviewCache(provider, capacity=10, prefetch=2)
+    cache.setBucketRange(0, 5)
+
+    cache.request(4, direction=1)
+    qtbot.waitUntil(lambda: cache.size() == 2)
+    assert sorted(requested) == [4, 5]
+
+    cache.request(2, direction=-1)
+    qtbot.waitUntil(lambda: cache.size() == 5)
+    assert sorted(requested) == [0, 1, 2, 4, 5]
+    cache.shutdown()
+
+
+def test_slider_preview_during_drag(qtbot):
+    """Test that the preview is shown while dragging and hidden on release"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.show()
+
+    values = []
+    slider.setRange(0, 100)
+    slider.setPreviewProvider(lambda value: values.append(value) or create_image(value), bucket_size=10)
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(slider.width() // 2, 1))
+    qtbot.waitUntil(slider.isPreviewVisible)
+    assert 50 in values
+
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(slider.width() // 2, 1))
+    assert not slider.isPreviewVisible()
+
+    # Removing the provider
+    slider.setPreviewProvider(None)
+    assert slider.getPreviewCache() is None
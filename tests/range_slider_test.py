@@ -0,0 +1,166 @@
+from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtGui import QPaintEvent
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+
+
+from src.pyqt_advanced_slider import RangeSlider
+
+
+def test_initial_values(qtbot):
+    """Test initial values after instantiating"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    assert slider.getRange() == (0, 10)
+    assert slider.getValue() == (0, 10)
+    assert slider.getLowValue() == 0
+    assert slider.getHighValue() == 10
+    assert slider.getRangeSeparator() == ' - '
+    assert slider.getActiveHandle() == RangeSlider.HIGH_HANDLE
+
+
+def test_set_values(qtbot):
+    """Test setting the low and high value"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    emitted = []
+    slider.rangeChanged.connect(lambda low, high: emitted.append((low, high)))
+
+    slider.setRange(-100, 100)
+    slider.setValues(50, -20)
+    assert slider.getValues() == (-20, 50)
+
+    # Handles can't pass each other
+    slider.setLowValue(80)
+    assert slider.getValue() == (50, 50)
+    slider.setHighValue(500)
+    assert slider.getValue() == (50, 100)
+
+    # Setting both values emits once
+    assert emitted == [(-20, 50), (50, 50), (50, 100)]
+
+    # Setting the same values does not emit
+    slider.setValue((50, 100))
+    assert len(emitted) == 3
+
+    # Changing the range clamps the values
+    slider.setRange(0, 60)
+    assert slider.getValue() == (50, 60)
+
+
+def test_formatting(qtbot):
+    """Test formatting the range with the slider formatting"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    slider.setFloat(True)
+    slider.setDecimals(2)
+    slider.setRange(0, 10000)
+    slider.setValues(1250.5, 7512.24)
+    slider.setThousandsSeparator(',')
+    slider.setSuffix('€')
+    slider.setRangeSeparator(' to ')
+
+    assert slider.getValueFormatted() == '1,250.50€ to 7,512.24€'
+
+
+def test_mouse_nearest_handle(qtbot):
+    """Test that the mouse moves the nearest handle"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setValues(20, 80)
+    width = slider.width()
+
+    emitted = []
+    slider.rangeChanged.connect(lambda low, high: emitted.append((low, high)))
+
+    # Pressing near the low handle moves the low handle
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(width * 0.3), 1))
+    assert slider.getValue() == (30, 80)
+    assert slider.getActiveHandle() == RangeSlider.LOW_HANDLE
+
+    # Dragging the low handle past the high handle stops at the high handle
+    QTest.mouseMove(slider, pos=QPoint(width, 1))
+    assert slider.getValue() == (80, 80)
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(width, 1))
+
+    # Pressing right of the span moves the high handle
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(width * 0.9), 1))
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(width * 0.9), 1))
+    assert slider.getValue() == (80, 90)
+    assert slider.getActiveHandle() == RangeSlider.HIGH_HANDLE
+
+    # One emission per event that changed the range
+    assert emitted == [(30, 80), (80, 80), (80, 90)]
+
+
+def test_keyboard_active_handle(qtbot):
+    """Test that the keyboard moves the active handle"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setValues(20, 80)
+
+    QTest.keyPress(slider, Qt.Key.Key_Left)
+    assert slider.getValue() == (20, 79)
+
+    slider.setActiveHandle(RangeSlider.LOW_HANDLE)
+    QTest.keyPress(slider, Qt.Key.Key_PageUp)
+    assert slider.getValue() == (25, 79)
+    QTest.keyPress(slider, Qt.Key.Key_Home)
+    assert slider.getValue() == (0, 79)
+    QTest.keyPress(slider, Qt.Key.Key_End)
+    assert slider.getValue() == (79, 79)
+
+
+def test_paint_event(qtbot):
+    """Test painting both handles and the span"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+    slider.setValues(25, 75)
+
+    with qtbot.capture_exceptions() as exceptions:
+        paint_event = QPaintEvent(QRect(0, 0, 0, 0))
+        qt_api.QtWidgets.QApplication.instance().postEvent(slider, paint_event)
+        QTest.qWait(100)
+
+    assert len(exceptions) == 0
+    assert slider.getValuePosition() == (slider.width() // 4, slider.width() * 3 // 4)
+
+
+def test_render_stats(qtbot):
+    """Test that input events and emissions of the range slider are counted"""
+
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setRange(0, 100)
+    slider.setValues(20, 80)
+    slider.setSingleStep(1)
+    slider.setInstrumentationEnabled(True)
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(150, 1))
+    QTest.mouseMove(slider, pos=QPoint(160, 1))
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(160, 1))
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    QTest.keyPress(slider, Qt.Key.Key_End)
+    QTest.keyPress(slider, Qt.Key.Key_End)
+    QTest.keyPress(slider, Qt.Key.Key_A)
+
+    stats = slider.renderStats()
+    assert stats['inputs_handled'] == 6
+    assert stats['inputs_coalesced'] == 2
+    assert stats['emissions'] == 4
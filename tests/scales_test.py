@@ -0,0 +1,87 @@
+import math
+import pytest
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, LinearScale, LogScale, PowerScale, FunctionScale
+
+
+def test_log_scale():
+    """Test mapping values with a logarithmic scale"""
+
+    scale = LogScale()
+
+    assert scale.toNormalized(20, 20, 20000) == 0
+    assert scale.toNormalized(20000, 20, 20000) == pytest.approx(1)
+    assert scale.fromNormalized(0.5, 20, 20000) == pytest.approx(math.sqrt(20 * 20000))
+
+    with pytest.raises(ValueError):
+        scale.toNormalized(5, 0, 10)
+
+
+def test_power_scale():
+    """Test mapping values with a power scale"""
+
+    scale = PowerScale(2)
+
+    assert scale.fromNormalized(0.5, 0, 100) == 25
+    assert scale.toNormalized(25, 0, 100) == pytest.approx(0.5)
+
+    with pytest.raises(ValueError):
+        PowerScale(0)
+
+
+def test_function_scale_without_inverse():
+    """Test that values of a function scale without an inverse are found by bisection"""
+
+    scale = FunctionScale(lambda value: value ** 3)
+
+    assert scale.fromNormalized(0.125, 0, 10) == pytest.approx(5)
+    assert scale.toNormalized(5, 0, 10) == pytest.approx(0.125)
+
+
+def test_scale_table():
+    """Test the pixel to value lookup table and its bisection inverse"""
+
+    table = LogScale().createTable(1, 1000, 300)
+
+    assert table.valueAt(0) == 1
+    assert table.valueAt(300) == 1000
+    assert table.valueAt(150) == pytest.approx(math.sqrt(1000))
+    assert table.valueAt(-10) == 1
+    assert table.valueAt(500) == 1000
+
+    for position_x in range(301):
+        assert table.positionOf(table.valueAt(position_x)) == position_x
+    assert table.positionOf(0.5) == 0
+    assert table.positionOf(5000) == 300
+
+    assert LinearScale().isLinear()
+    assert not LogScale().isLinear()
+
+
+def test_slider_log_scale(qtbot):
+    """Test mouse and keyboard input of a slider with a logarithmic scale"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(1, 10000)
+    slider.setScale(LogScale())
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(slider.width() / 2), 1))
+    assert slider.getValue() == 100
+
+    slider.setValue(1000)
+    assert slider.getValuePosition() == round(slider.width() * 0.75)
+
+    # Default single step is 1% of the track for non-linear scales
+    slider.setValue(100)
+    QTest.keyPress(slider, Qt.Key.Key_Up)
+    assert slider.getValue() == int(10 ** 2.04)
+
+    # Custom single step is added to the value
+    slider.setSingleStep(10)
+    QTest.keyPress(slider, Qt.Key.Key_Down)
+    assert slider.getValue() == int(10 ** 2.04) - 10
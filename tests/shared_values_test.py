@@ -0,0 +1,135 @@
+import multiprocessing
+import struct
+import pytest
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import (Slider, RangeSlider, MultiSlider, ConstrainedSliderGroup, SumConstraint,
+                                      SharedValueBinding, SharedValueReader)
+
+
+def read_until(name: str, slot: int, final_value: float, queue):
+    """Read a slot in a worker process until the final value arrives (values must only increase)"""
+
+    reader = SharedValueReader(name)
+    values = [reader.read(slot)]
+    while values[-1] != final_value:
+        value = reader.read(slot)
+        if value != values[-1]:
+            values.append(value)
+    reader.close()
+    queue.put((values == sorted(values), values[-1]))
+
+
+def test_bind_slider(qtbot):
+    """Test writing slider values into shared memory slots"""
+
+    binding = SharedValueBinding(4)
+    try:
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setFloat(True)
+        slider.setRange(0, 1)
+        slider.setValue(0.5)
+
+        binding.bindSlider(slider, 2)
+        reader = SharedValueReader(binding.getName())
+        assert reader.getSlotCount() == 4
+        assert reader.readWithSequence(2) == (0.5, 2)
+
+        slider.setValue(0.8)
+        assert reader.readWithSequence(2) == (0.8, 4)
+        assert reader.readAll() == [0.0, 0.0, 0.8, 0.0]
+
+        # Unbound sliders are not written anymore
+        binding.unbindSlider(2)
+        slider.setValue(0.1)
+        assert reader.read(2) == 0.8
+
+        with pytest.raises(IndexError):
+            binding.bindSlider(slider, 4)
+
+        # Sliders with multiple values are rejected
+        for multi_value_slider in (RangeSlider(), MultiSlider()):
+            qtbot.addWidget(multi_value_slider)
+            with pytest.raises(TypeError):
+                binding.bindSlider(multi_value_slider, 0)
+
+        # Values that can't be written leave the slot readable
+        with pytest.raises(struct.error):
+            binding.write(1, (0, 1))
+        assert reader.readWithSequence(1) == (0.0, 0)
+        reader.close()
+    finally:
+        binding.close()
+
+
+def test_bind_group(qtbot):
+    """Test that values applied by a group are written into shared memory slots"""
+
+    binding = SharedValueBinding(4)
+    try:
+        group = ConstrainedSliderGroup()
+        for key, value in zip(['a', 'b'], [7, 3]):
+            slider = Slider()
+            qtbot.addWidget(slider)
+            slider.setRange(0, 10)
+            slider.setValue(value)
+            group.addSlider(key, slider)
+        preset = group.saveState()
+
+        assert binding.bindGroup(group, {'a': 1, 'b': 3}) == {'a': 1, 'b': 3}
+        reader = SharedValueReader(binding.getName())
+        assert reader.readAll() == [0.0, 7.0, 0.0, 3.0]
+
+        # Batched values
+        group.setValues({'a': 2})
+        QTest.qWait(10)
+        assert reader.read(1) == 2.0
+
+        # Rebalanced values
+        group.addConstraint(SumConstraint(['a', 'b'], 10))
+        group.getSlider('a').setValue(6)
+        QTest.qWait(10)
+        assert reader.readAll() == [0.0, 6.0, 0.0, 4.0]
+
+        # Restored presets
+        group.restoreState(preset)
+        assert reader.readAll() == [0.0, 7.0, 0.0, 3.0]
+
+        binding.unbindGroup(group)
+        group.setValues({'a': 1, 'b': 9})
+        QTest.qWait(10)
+        assert reader.read(1) == 7.0
+
+        # Groups with sliders with multiple values are rejected
+        range_slider = RangeSlider()
+        qtbot.addWidget(range_slider)
+        group.addSlider('range', range_slider)
+        with pytest.raises(TypeError):
+            binding.bindGroup(group)
+        reader.close()
+    finally:
+        binding.close()
+
+
+def test_two_processes():
+    """Test reading values written in this process from a worker process"""
+
+    binding = SharedValueBinding(1)
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=read_until, args=(binding.getName(), 0, 100000.0, queue))
+    try:
+        process.start()
+        for value in range(100001):
+            binding.write(0, value)
+
+        increasing, last_value = queue.get(timeout=60)
+        process.join(timeout=60)
+        assert increasing
+        assert last_value == 100000.0
+    finally:
+        if process.is_alive():
+            process.terminate()
+        binding.close()
@@ -0,0 +1,128 @@
+import pytest
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, RangeSlider, SliderGroup, SliderGroupObserver
+
+
+def test_add_remove(qtbot):
+    """Test adding and removing sliders"""
+
+    group = SliderGroup()
+    for index in range(3):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+
+    assert group.size() == 3
+    assert group.getKeys() == ['slider0', 'slider1', 'slider2']
+    assert group.getValues() == {'slider0': 0, 'slider1': 0, 'slider2': 0}
+
+    slider = group.removeSlider('slider1')
+    assert group.getKeys() == ['slider0', 'slider2']
+
+    # Removed sliders are no longer tracked
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+    slider.setValue(50)
+    QTest.qWait(10)
+    assert emitted == []
+
+
+def test_batched_emission(qtbot):
+    """Test that changes of many sliders are emitted once per event loop iteration"""
+
+    group = SliderGroup()
+    for index in range(32):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+
+    group.getSlider('slider0').setValue(10)
+    group.getSlider('slider0').setValue(20)
+    group.getSlider('slider5').setValue(30)
+
+    assert emitted == []
+    QTest.qWait(10)
+    assert emitted == [{'slider0': 20, 'slider5': 30}]
+
+
+def test_set_values(qtbot):
+    """Test setting values without per-slider signals"""
+
+    group = SliderGroup()
+    for index in range(64):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+
+    slider_emitted = []
+    group.getSlider('slider3').valueChanged.connect(slider_emitted.append)
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+
+    group.setValues({'slider{}'.format(index): index for index in range(64)})
+    assert slider_emitted == []
+    assert group.getValues()['slider63'] == 63
+
+    # Unchanged values are not emitted
+    QTest.qWait(10)
+    assert len(emitted) == 1
+    assert len(emitted[0]) == 63
+    assert 'slider0' not in emitted[0]
+
+    # Flushing emits immediately
+    group.setValues({'slider0': 150})
+    group.flush()
+    assert emitted[1] == {'slider0': 100}
+    QTest.qWait(10)
+    assert len(emitted) == 2
+
+
+def test_observer(qtbot):
+    """Test forwarding the values applied by groups to their targets"""
+
+    group = SliderGroup()
+    for index in range(3):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        group.addSlider('slider{}'.format(index), slider)
+
+    forwarded = []
+    observer = SliderGroupObserver(forwarded.append)
+    assert observer.bind(group) == {'slider0': 0, 'slider1': 1, 'slider2': 2}
+    assert observer.bind(group, {'slider1': 5, 'slider2': 6}) == {'slider1': 5, 'slider2': 6}
+    assert observer.getTargets(group) == {'slider1': 5, 'slider2': 6}
+
+    # Rebinding replaces the targets, unbound keys are not forwarded
+    group.setValues({'slider0': 10, 'slider1': 20})
+    group.getSlider('slider2').setValue(30)
+    QTest.qWait(10)
+    assert forwarded == [{5: 20, 6: 30}]
+
+    group.setValues({'slider0': 40})
+    QTest.qWait(10)
+    assert len(forwarded) == 1
+
+    observer.unbind(group)
+    assert observer.getTargets(group) is None
+    group.setValues({'slider1': 50})
+    QTest.qWait(10)
+    assert len(forwarded) == 1
+
+    # Sliders with multiple values are rejected
+    range_slider = RangeSlider()
+    qtbot.addWidget(range_slider)
+    group.addSlider('range', range_slider)
+    with pytest.raises(TypeError):
+        observer.bind(group)
@@ -0,0 +1,144 @@
+import pytest
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import Slider, RangeSlider, MultiSlider, SliderGroup, SliderState
+
+
+def test_save_restore_state(qtbot):
+    """Test restoring all settings of a slider from a saved state"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setFloat(True)
+    slider.setDecimals(2)
+    slider.setFixedPoint(True)
+    slider.setRange(-500, 2 ** 70)
+    slider.setValue(1234.5)
+    slider.setSingleStep(0.25)
+    slider.setPageStep(10)
+    slider.setPrefix('~')
+    slider.setSuffix(' €')
+    slider.setThousandsSeparator('.')
+    slider.setDecimalSeparator(',')
+    slider.showValue(False)
+
+    state = slider.saveState()
+    assert state[:4] == SliderState.MAGIC
+    assert len(state) < 100
+
+    restored = Slider()
+    qtbot.addWidget(restored)
+
+    emitted = []
+    restored.valueChanged.connect(emitted.append)
+    restored.restoreState(state)
+
+    assert restored.getValue() == 1234.5
+    assert restored.getRange() == (-500, 2 ** 70)
+    assert restored.isFloat() and restored.isFixedPoint()
+    assert restored.getDecimals() == 2
+    assert restored.getSingleStep() == 0.25
+    assert restored.getPageStep() == 10
+    assert not restored.isShowingValue()
+    assert restored.getValueFormatted() == '~1.234,50 €'
+    assert emitted == [1234.5]
+
+
+def test_invalid_state(qtbot):
+    """Test that invalid states raise ValueError"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    state = slider.saveState()
+
+    with pytest.raises(ValueError):
+        slider.restoreState(b'invalid')
+    with pytest.raises(ValueError):
+        slider.restoreState(state[:-1])
+    with pytest.raises(ValueError):
+        slider.restoreState(state[:4] + bytes([SliderState.VERSION + 1]) + state[5:])
+
+
+def test_group_restore_state(qtbot):
+    """Test restoring the states of many sliders with one emission"""
+
+    group = SliderGroup()
+    for index in range(200):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 1000)
+        slider.setValue(index)
+        group.addSlider('slider{}'.format(index), slider)
+
+    state = group.saveState()
+    group.setValues({key: 0 for key in group.getKeys()})
+    QTest.qWait(10)
+
+    slider_emitted = []
+    group.getSlider('slider5').valueChanged.connect(slider_emitted.append)
+    emitted = []
+    group.valuesChanged.connect(emitted.append)
+
+    group.restoreState(state)
+    assert group.getSlider('slider199').getValue() == 199
+    assert slider_emitted == []
+    assert len(emitted) == 1
+    assert len(emitted[0]) == 199
+
+    QTest.qWait(10)
+    assert len(emitted) == 1
+
+
+def test_handle_states(qtbot):
+    """Test that range and multi sliders save and restore their handle values"""
+
+    range_slider = RangeSlider()
+    qtbot.addWidget(range_slider)
+    range_slider.setRange(0, 100)
+    range_slider.setValues(20, 80)
+    state = range_slider.saveState()
+
+    restored_range_slider = RangeSlider()
+    qtbot.addWidget(restored_range_slider)
+    restored_range_slider.setValues(5, 10)
+    emitted = []
+    restored_range_slider.rangeChanged.connect(lambda low, high: emitted.append((low, high)))
+    restored_range_slider.restoreState(state)
+    assert restored_range_slider.getValues() == (20, 80)
+    assert emitted == [(20, 80)]
+
+    multi_slider = MultiSlider()
+    qtbot.addWidget(multi_slider)
+    multi_slider.setFloat(True)
+    multi_slider.setRange(0, 100)
+    multi_slider.setHandleValues([2.5, 40, 90])
+    state = multi_slider.saveState()
+
+    restored_multi_slider = MultiSlider()
+    qtbot.addWidget(restored_multi_slider)
+    restored_multi_slider.setHandleValues([1, 2, 3, 4])
+    restored_multi_slider.restoreState(state)
+    assert restored_multi_slider.getValue() == [2.5, 40, 90]
+
+    # States without handle values can't be restored into these sliders
+    slider = Slider()
+    qtbot.addWidget(slider)
+    with pytest.raises(ValueError):
+        restored_range_slider.restoreState(slider.saveState())
+    with pytest.raises(ValueError):
+        restored_multi_slider.restoreState(slider.saveState())
+    with pytest.raises(ValueError):
+        restored_range_slider.restoreState(state)
+
+    # Handle values are part of group presets
+    group = SliderGroup()
+    group.addSlider('range', range_slider)
+    group.addSlider('multi', multi_slider)
+    preset = group.saveState()
+    range_slider.setValues(0, 1)
+    multi_slider.setHandleValues([])
+    group.restoreState(preset)
+    assert range_slider.getValues() == (20, 80)
+    assert multi_slider.getValue() == [2.5, 40, 90]
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from PyQt6.QtCore import Qt, QPoint, QPointF, QRect
 from PyQt6.QtGui import QFont, QColor, QWheelEvent, QPaintEvent
 from PyQt6.QtTest import QTest
@@ -817,3 +819,386 @@ def test_paint_event_range_exception(qtbot):
         QTest.qWait(250)
 
     assert len(exceptions) == 1
+
+
+def test_bind_worker_latest_value_wins(qtbot):
+    """Test that only the worker result for the latest value is delivered"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 50)
+    results = []
+    slider.workerFinished.connect(lambda value, result: results.append((value, result)))
+
+    def compute(value):
+        time.sleep(0.05)
+        return value * 2
+
+    slider.bindWorker(compute)
+    for value in range(1, 6):
+        slider.setValue(value)
+
+    qtbot.waitUntil(lambda: not slider.isWorkerBusy() and len(results) > 0)
+    QTest.qWait(100)
+
+    assert results == [(5, 10)]
+    slider.unbindWorker()
+
+
+def test_bind_worker_failed(qtbot):
+    """Test that exceptions raised by the worker are delivered with the failed signal"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    def compute(value):
+        raise ValueError(value)
+
+    with qtbot.waitSignal(slider.workerFailed) as blocker:
+        slider.bindWorker(compute)
+
+    assert blocker.args[0] == 0
+    assert isinstance(blocker.args[1], ValueError)
+
+    # No results should be delivered after unbinding
+    results = []
+    slider.workerFailed.connect(lambda value, exception: results.append(value))
+    slider.unbindWorker()
+    slider.setValue(5)
+    QTest.qWait(100)
+
+    assert results == []
+
+
+def test_values_stream_latest_only(qtbot):
+    """Test that the value stream only yields the latest value to slow consumers"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+
+    async def consume():
+        stream = slider.values()
+        for value in range(1, 11):
+            slider.setValue(value)
+        first = await stream.__anext__()
+
+        slider.setValue(20)
+        slider.setValue(30)
+        second = await stream.__anext__()
+
+        # Closing the stream ends the iteration
+        stream.close()
+        rest = [value async for value in stream]
+        return first, second, rest
+
+    assert asyncio.run(consume()) == (10, 30, [])
+
+
+def test_values_stream_debounce(qtbot):
+    """Test that the value stream waits until the value is stable"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+
+    async def produce():
+        for value in range(1, 6):
+            slider.setValue(value)
+            await asyncio.sleep(0.01)
+
+    async def consume():
+        stream = slider.values(debounce=0.1)
+        producer = asyncio.ensure_future(produce())
+        value = await stream.__anext__()
+        await producer
+        stream.close()
+        return value
+
+    assert asyncio.run(consume()) == 5
+
+
+def test_values_stream_break(qtbot):
+    """Test that leaving an async for loop early closes the value stream"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setRange(0, 100)
+
+    async def consume():
+        stream = slider.values()
+        slider.setValue(10)
+        async for value in stream:
+            assert value == 10
+            break
+
+        # The abandoned generator is finalized by the event loop
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return stream.isClosed()
+
+    assert asyncio.run(consume())
+
+    # The closed stream is no longer connected
+    slider.setValue(20)
+    assert slider.receivers(slider.valueChanged) == 0
+
+
+def test_allowed_values(qtbot):
+    """Test restricting the slider to discrete values"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setAllowedValues([48000, 8000, 44100, 96000, 16000, 8000])
+    assert slider.getAllowedValues() == [8000, 16000, 44100, 48000, 96000]
+    assert slider.getRange() == (8000, 96000)
+
+    # Setting values snaps to the nearest allowed value
+    slider.setValue(45000)
+    assert slider.getValue() == 44100
+    slider.setValue(47000)
+    assert slider.getValue() == 48000
+
+    # Arrow keys step through the allowed values
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 96000
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 96000
+    QTest.keyPress(slider, Qt.Key.Key_Left)
+    QTest.keyPress(slider, Qt.Key.Key_Down)
+    assert slider.getValue() == 44100
+
+    # Mouse input maps to the nearest allowed value
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(0, 1))
+    assert slider.getValue() == 8000
+    QTest.mouseMove(slider, pos=QPoint(int(slider.width() * 0.4), 1))
+    assert slider.getValue() == 44100
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(slider.width(), 1))
+    assert slider.getValue() == 96000
+
+    # Removing the allowed values repaints the slider
+    slider.setInstrumentationEnabled(True)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    slider.setAllowedValues(None)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    assert slider.renderStats()['paints_performed'] == 2
+
+    slider.setValue(45000)
+    assert slider.getValue() == 45000
+
+
+def test_allowed_values_range(qtbot):
+    """Test that the slider only snaps to allowed values inside the range"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setAllowedValues([1, 5, 10, 50, 100])
+    slider.setRange(5, 60)
+    slider.setValue(90)
+    assert slider.getValue() == 50
+    slider.setValue(2)
+    assert slider.getValue() == 5
+
+    # Keyboard input steps through the allowed values inside the range
+    QTest.keyPress(slider, Qt.Key.Key_Left)
+    assert slider.getValue() == 5
+    slider.setValue(50)
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 50
+
+    # Mouse input maps to the allowed values inside the range
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(slider.width(), 1))
+    assert slider.getValue() == 50
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(0, 1))
+    assert slider.getValue() == 5
+
+    # Without allowed values inside the range every value is allowed
+    slider.setRange(20, 40)
+    slider.setValue(30)
+    assert slider.getValue() == 30
+    assert slider.getAllowedValues() == [1, 5, 10, 50, 100]
+
+
+def test_allowed_values_large(qtbot):
+    """Test stepping through a large amount of discrete values"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setAllowedValues(range(0, 200001, 2))
+    slider.setValue(1001)
+    assert slider.getValue() == 1000
+
+    QTest.keyPress(slider, Qt.Key.Key_Up)
+    assert slider.getValue() == 1002
+
+    # Page step moves by 5% of the values
+    QTest.keyPress(slider, Qt.Key.Key_PageUp)
+    assert slider.getValue() == 11002
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(int(slider.width() / 2), 1))
+    assert slider.getValue() == 100000
+
+
+def test_fixed_point(qtbot):
+    """Test exact stepping and formatting with fixed-point storage"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+
+    slider.setFloat(True)
+    slider.setDecimals(1)
+    slider.setRange(0, 1)
+    slider.setSingleStep(0.1)
+    slider.setFixedPoint(True)
+    assert slider.isFixedPoint()
+
+    emitted = []
+    slider.valueChanged.connect(emitted.append)
+
+    # Stepping does not accumulate rounding errors
+    for i in range(3):
+        QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 0.3
+    assert emitted == [0.1, 0.2, 0.3]
+
+    # Values are quantized once when they are set
+    slider.setDecimals(2)
+    slider.setRange(-10000, 10000)
+    slider.setThousandsSeparator(',')
+    slider.setValue(-1234.567)
+    assert slider.getValue() == -1234.57
+    assert slider.getValueFormatted() == '-1,234.57'
+
+    slider.setDecimals(0)
+    assert slider.getValueFormatted() == '-1,235'
+
+    # Disabling fixed-point storage keeps the value
+    slider.setFixedPoint(False)
+    slider.setDecimals(2)
+    assert slider.getValue() == -1235.0
+
+
+def test_drag_within_value_step(qtbot):
+    """Test that the value rect follows the mouse while dragging within one int value step"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.show()
+    QTest.qWait(10)
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(21, 1))
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    QTest.mouseMove(slider, pos=QPoint(39, 1))
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+
+    # Value stays 1, but the value rect is drawn up to the mouse position
+    assert slider.getValue() == 1
+    assert slider.getValuePosition() == 39
+    image = slider.findChild(qt_api.QtWidgets.QLabel).pixmap().toImage()
+    ratio = image.devicePixelRatio()
+    accent = slider.getAccentColor().rgb()
+    assert image.pixelColor(int(37 * ratio), int(15 * ratio)).rgb() == accent
+    assert image.pixelColor(int(41 * ratio), int(15 * ratio)).rgb() != accent
+
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(39, 1))
+
+
+def test_integer_exact_mapping(qtbot):
+    """Test exact value and position mapping for int ranges up to ±2^63"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(1000, 30)
+
+    minimum, maximum = -2 ** 63, 2 ** 63 - 1
+    slider.setRange(minimum, maximum)
+    value_range = maximum - minimum
+
+    # Every position maps exactly to its value and back
+    for position_x in (0, 1, 333, 500, 999, 1000):
+        slider.setValue(minimum - (-value_range * position_x // 1000))
+        assert slider.getValuePosition() == position_x
+
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(1000, 1))
+    assert slider.getValue() == maximum
+    QTest.mouseMove(slider, pos=QPoint(500, 1))
+    assert slider.getValue() == 0
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(0, 1))
+    assert slider.getValue() == minimum
+
+    # Values beyond 2^53 are stepped and formatted exactly
+    slider.setRange(0, 2 ** 62)
+    slider.setValue(2 ** 53 + 1)
+    slider.setSingleStep(1)
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 2 ** 53 + 2
+    assert slider.getValueFormatted() == str(2 ** 53 + 2)
+
+    # Default steps are exact fractions of the range
+    slider.setSingleStep(0)
+    QTest.keyPress(slider, Qt.Key.Key_Right)
+    assert slider.getValue() == 2 ** 53 + 2 + 2 ** 62 // 100
+
+
+def test_render_stats(qtbot):
+    """Test the opt-in paint, emission and input instrumentation"""
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 30)
+    slider.setSingleStep(1)
+
+    # Disabled instrumentation counts nothing
+    assert not slider.isInstrumentationEnabled()
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    assert slider.renderStats()['paints_performed'] == 0
+
+    slider.setInstrumentationEnabled(True)
+    Slider.setGlobalInstrumentationEnabled(True)
+    assert Slider.isGlobalInstrumentationEnabled()
+
+    # Repaint only happens if the value changed
+    slider.setValue(5)
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    stats = slider.renderStats()
+    assert stats['paints_performed'] == 1
+    assert stats['paints_skipped'] == 1
+    assert stats['paint_time'] > 0
+    assert stats['paint_time_max'] == stats['paint_time_mean'] == stats['paint_time']
+    assert stats['emissions'] == 1
+
+    # Inputs that do not change the value are coalesced
+    for key in (Qt.Key.Key_Right, Qt.Key.Key_End, Qt.Key.Key_End, Qt.Key.Key_A):
+        QTest.keyPress(slider, key)
+        slider.paintEvent(QPaintEvent(QRect(0, 0, 0, 0)))
+    stats = slider.renderStats()
+    assert stats['inputs_handled'] == 3
+    assert stats['inputs_coalesced'] == 1
+    assert stats['emissions'] == 3
+
+    # Global stats include all sliders
+    other_slider = Slider()
+    qtbot.addWidget(other_slider)
+    other_slider.setValue(1)
+    assert Slider.globalRenderStats()['emissions'] == 4
+    assert slider.renderStats()['emissions'] == 3
+
+    slider.resetRenderStats()
+    assert slider.renderStats()['emissions'] == 0
+    Slider.resetGlobalRenderStats()
+    assert Slider.globalRenderStats()['emissions'] == 0
+
+    slider.setInstrumentationEnabled(False)
+    Slider.setGlobalInstrumentationEnabled(False)
+    slider.setValue(2)
+    assert slider.renderStats()['emissions'] == 0
+    assert Slider.globalRenderStats()['emissions'] == 0
@@ -0,0 +1,144 @@
+import pytest
+from PyQt6.QtTest import QTest
+
+
+from src.pyqt_advanced_slider import (Slider, RangeSlider, SliderGroup, ConstrainedSliderGroup, SumConstraint,
+                                      ValueHistory)
+
+
+def test_ring_buffer():
+    """Test that the oldest entries are overwritten when the buffer is full"""
+
+    history = ValueHistory(4)
+    for index in range(6):
+        history.append(index * 10, channel=index % 2, timestamp=float(index))
+
+    assert history.size() == 4
+    assert history.getCapacity() == 4
+    assert history.toLists() == ([2.0, 3.0, 4.0, 5.0], [0, 1, 0, 1], [20.0, 30.0, 40.0, 50.0])
+
+    history.clear()
+    assert history.size() == 0
+    assert history.toLists() == ([], [], [])
+
+    with pytest.raises(ValueError):
+        ValueHistory(0)
+
+
+def test_export():
+    """Test exporting to NumPy arrays and bytes"""
+
+    numpy = pytest.importorskip('numpy')
+
+    history = ValueHistory(3)
+    for index in range(5):
+        history.append(index / 2, channel=index, timestamp=100.0 + index)
+
+    timestamps, channels, values = history.toNumpy()
+    assert timestamps.tolist() == [102.0, 103.0, 104.0]
+    assert channels.dtype == numpy.uint32 and channels.tolist() == [2, 3, 4]
+    assert values.tolist() == [1.0, 1.5, 2.0]
+
+    data = history.toBytes()
+    assert len(data) == ValueHistory.HEADER.size + 3 * 20
+    assert ValueHistory.fromBytes(data).toLists() == history.toLists()
+
+    with pytest.raises(ValueError):
+        ValueHistory.fromBytes(data[:-1])
+
+
+def test_bind(qtbot):
+    """Test recording sliders and groups into one buffer"""
+
+    history = ValueHistory(100)
+
+    slider = Slider()
+    qtbot.addWidget(slider)
+    slider.setRange(0, 100)
+    history.bindSlider(slider, channel=7)
+    slider.setValue(10)
+    slider.setValue(20)
+
+    group = SliderGroup()
+    for key in ('a', 'b'):
+        group_slider = Slider()
+        qtbot.addWidget(group_slider)
+        group_slider.setRange(0, 100)
+        group.addSlider(key, group_slider)
+    assert history.bindGroup(group) == {'a': 0, 'b': 1}
+    assert history.getChannels(group) == {'a': 0, 'b': 1}
+
+    group.getSlider('b').setValue(5)
+    group.getSlider('a').setValue(6)
+    QTest.qWait(10)
+
+    timestamps, channels, values = history.toLists()
+    assert channels == [7, 7, 1, 0]
+    assert values == [10, 20, 5, 6]
+    assert timestamps == sorted(timestamps)
+
+    history.unbindAll()
+    slider.setValue(30)
+    assert history.size() == 4
+
+
+def test_bind_group_applied_values(qtbot):
+    """Test that values applied by a group are recorded"""
+
+    history = ValueHistory(100)
+
+    group = ConstrainedSliderGroup()
+    for key, value in zip(['x', 'y'], [50, 50]):
+        slider = Slider()
+        qtbot.addWidget(slider)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        group.addSlider(key, slider)
+    group.addConstraint(SumConstraint(['x', 'y'], 100))
+    preset = group.saveState()
+    history.bindGroup(group)
+
+    # Rebalanced values
+    group.getSlider('x').setValue(70)
+    QTest.qWait(10)
+    assert history.toLists()[1:] == ([0, 1], [70, 30])
+
+    # Batched and restored values
+    group.setValues({'x': 20})
+    QTest.qWait(10)
+    group.restoreState(preset)
+    assert history.toLists()[1:] == ([0, 1, 0, 1, 0, 1], [70, 30, 20, 80, 50, 50])
+
+
+def test_bind_groups(qtbot):
+    """Test that groups with the same keys are recorded on their own channels"""
+
+    history = ValueHistory(100)
+
+    groups = []
+    for _ in range(3):
+        group = SliderGroup()
+        for key in range(2):
+            slider = Slider()
+            qtbot.addWidget(slider)
+            slider.setRange(0, 100)
+            group.addSlider(key, slider)
+        groups.append(group)
+
+    assert history.bindGroup(groups[0]) == {0: 0, 1: 1}
+    assert history.bindGroup(groups[1]) == {0: 2, 1: 3}
+    assert history.bindGroup(groups[2], {0: 10, 1: 11}) == {0: 10, 1: 11}
+
+    # Rebinding keeps the channels
+    assert history.bindGroup(groups[0]) == {0: 0, 1: 1}
+
+    for index, group in enumerate(groups):
+        group.setValues({0: index + 1, 1: index + 50})
+    QTest.qWait(10)
+    assert history.toLists()[1:] == ([0, 1, 2, 3, 10, 11], [1, 50, 2, 51, 3, 52])
+
+    # Sliders with multiple values are rejected
+    range_slider = RangeSlider()
+    qtbot.addWidget(range_slider)
+    with pytest.raises(TypeError):
+        history.bindSlider(range_slider)